@@ -0,0 +1,195 @@
+"""
+Benchmark the solution entry points and catch performance regressions.
+
+Each benchmark has a setup function that prepares a fixed-size input and
+returns the call to time, so parsing and building objects stay out of
+the measurement. Results are compared against a stored baseline after
+scaling both by a calibration workload, which keeps the baseline usable
+on machines faster or slower than the one that recorded it.
+
+The calibration workload runs before every timed run, and each result
+keeps the median of those times. A machine whose speed drifts during a
+run, as shared ones do, then scales each benchmark by how fast it was
+while that benchmark ran, not by a single figure from the start.
+"""
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from aoc.runner import ROOT
+
+BASELINE_PATH = ROOT / "benchmarks.json"
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.5
+# Words the calibration workload counts, enough for it to take tens of
+# milliseconds so a brief burst of speed can't make it look fast.
+CALIBRATION_SIZE = 50000
+
+Job = Callable[[], Any]
+
+
+@dataclass
+class Benchmark:
+    """A timed call to a solution entry point.
+
+    Attributes:
+      name (str): the dotted path of the entry point being measured.
+      setup (Callable[[], Job]): prepares the input and returns the call
+        to time. It runs before every repeat, so the call may consume or
+        mutate what it was given.
+      repeat (int): how many timed runs to take.
+      budget (Optional[float]): the most seconds the fastest run may
+        take, however the baseline ran.
+    """
+
+    name: str
+    setup: Callable[[], Job]
+    repeat: int = DEFAULT_REPEAT
+    budget: Optional[float] = None
+
+
+@dataclass
+class Result:
+    """Timings and memory use of a benchmark, in seconds and bytes.
+
+    Attributes:
+      calibration (float): the median time of the calibration workload
+        run alongside the benchmark, which its timings are relative to.
+    """
+
+    median: float
+    p90: float
+    best: float
+    peak_memory: int
+    calibration: float
+
+    @property
+    def relative_median(self) -> float:
+        """Return the median time in units of the calibration workload."""
+        return self.median / self.calibration
+
+
+@dataclass
+class Comparison:
+    """How a result changed from its baseline, as ratios where 1.0 means
+    no change.
+    """
+
+    name: str
+    time_ratio: float
+    memory_ratio: float
+
+    def regressed(self, threshold: float = DEFAULT_THRESHOLD) -> bool:
+        return self.time_ratio > 1 + threshold or self.memory_ratio > 1 + threshold
+
+
+@dataclass
+class Baseline:
+    """Stored results to compare fresh ones against."""
+
+    results: Dict[str, Result] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = BASELINE_PATH) -> "Baseline":
+        with open(path) as data:
+            raw = json.load(data)
+        return cls({name: Result(**result) for name, result in raw["results"].items()})
+
+    def save(self, path: Union[str, Path] = BASELINE_PATH) -> None:
+        with open(path, "w") as output:
+            json.dump(asdict(self), output, indent=2, sort_keys=True)
+            output.write("\n")
+
+    def compare(self, name: str, result: Result) -> Comparison:
+        """Compare a fresh result to the stored one, adjusting for how
+        fast each machine ran the calibration workload meanwhile.
+        """
+        stored = self.results[name]
+        return Comparison(
+            name,
+            time_ratio=result.relative_median / stored.relative_median,
+            memory_ratio=result.peak_memory / max(stored.peak_memory, 1),
+        )
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, repeat: int = DEFAULT_REPEAT, budget: Optional[float] = None
+) -> Callable[[Callable[[], Job]], Callable[[], Job]]:
+    """Register a setup function as a benchmark of the named entry point."""
+
+    def register(setup: Callable[[], Job]) -> Callable[[], Job]:
+        BENCHMARKS[name] = Benchmark(name, setup, repeat, budget)
+        return setup
+
+    return register
+
+
+def calibration_workload() -> List[str]:
+    """A fixed pure-Python workload to measure the machine's speed by:
+    formatting, hashing, and sorting strings, like most solutions.
+    """
+    words = [str(i * 7919 % 10007) for i in range(CALIBRATION_SIZE)]
+    counts: Dict[str, int] = {}
+    for word in words:
+        counts[word] = counts.get(word, 0) + 1
+    return sorted(counts)
+
+
+def run(benchmark: Benchmark) -> Result:
+    """Time a benchmark, running the calibration workload before each
+    timed run, and trace its peak memory in a separate run.
+    """
+    timings = []
+    calibrations = []
+    for _ in range(benchmark.repeat):
+        job = benchmark.setup()
+        calibrations.append(_time(calibration_workload))
+        timings.append(_time(job))
+
+    job = benchmark.setup()
+    tracemalloc.start()
+    try:
+        job()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        median=statistics.median(timings),
+        p90=_percentile(timings, 90),
+        best=min(timings),
+        peak_memory=peak_memory,
+        calibration=statistics.median(calibrations),
+    )
+
+
+def select(pattern: Optional[str] = None) -> List[Benchmark]:
+    """Return the registered benchmarks whose names contain the pattern."""
+    # Registering the benchmarks imports every day module, so wait until
+    # they're needed.
+    import aoc.benchmarks  # noqa: F401
+
+    return [
+        benchmark
+        for name, benchmark in sorted(BENCHMARKS.items())
+        if pattern is None or pattern in name
+    ]
+
+
+def _time(job: Job) -> float:
+    start = time.perf_counter()
+    job()
+    return time.perf_counter() - start
+
+
+def _percentile(timings: List[float], percent: int) -> float:
+    if len(timings) < 2:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method="inclusive")[percent - 1]
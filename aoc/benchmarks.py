@@ -0,0 +1,397 @@
+"""
+Benchmarks of the solution entry points over fixed-size generated inputs.
+
+Sizes are chosen so each call takes a few milliseconds to a few tenths
+of a second, keeping the whole suite quick enough for make test. Every
+day also has a cold start benchmark, which times a fresh process getting
+ready to solve it and fails past a fixed budget.
+"""
+import io
+import json
+from functools import lru_cache, partial
+from typing import Tuple
+
+from aoc import generators, startup
+from aoc.bench import Job, benchmark
+from aoc.runner import Puzzle, discover
+from aoc_2015 import day_01 as aoc_2015_day_01
+from aoc_2015 import day_02 as aoc_2015_day_02
+from aoc_2015 import day_03 as aoc_2015_day_03
+from aoc_2015 import day_04 as aoc_2015_day_04
+from aoc_2015 import day_05 as aoc_2015_day_05
+from aoc_2015 import day_06 as aoc_2015_day_06
+from aoc_2015 import day_07 as aoc_2015_day_07
+from aoc_2015 import day_08 as aoc_2015_day_08
+from aoc_2022 import day_01 as aoc_2022_day_01
+from aoc_2022 import day_02 as aoc_2022_day_02
+from aoc_2022 import day_03 as aoc_2022_day_03
+from aoc_2022 import day_04 as aoc_2022_day_04
+from aoc_2022 import day_05 as aoc_2022_day_05
+from aoc_2022 import day_06 as aoc_2022_day_06
+from aoc_2022 import day_07 as aoc_2022_day_07
+from aoc_2022 import day_08 as aoc_2022_day_08
+from aoc_2022 import day_09 as aoc_2022_day_09
+from aoc_2022 import day_10 as aoc_2022_day_10
+from aoc_2022 import day_11 as aoc_2022_day_11
+from aoc_2022 import day_12 as aoc_2022_day_12
+from aoc_2022 import day_13 as aoc_2022_day_13
+from aoc_2023 import day_01 as aoc_2023_day_01
+from aoc_2023 import day_02 as aoc_2023_day_02
+from aoc_2023 import day_03 as aoc_2023_day_03
+from aoc_2023 import day_04 as aoc_2023_day_04
+
+
+@lru_cache(maxsize=None)
+def lines(year: int, day: int, scale: int) -> Tuple[str, ...]:
+    """Return the lines of a generated input, newlines included."""
+    text = "".join(generators.generate(year, day, scale))
+    return tuple(text.splitlines(keepends=True))
+
+
+def text(year: int, day: int, scale: int) -> str:
+    """Return a generated single-line input without its newline."""
+    return lines(year, day, scale)[0].rstrip("\n")
+
+
+@benchmark("aoc_2015.day_01.Elevator.execute")
+def elevator_execute() -> Job:
+    commands = text(2015, 1, 100000)
+    return lambda: aoc_2015_day_01.Elevator().execute(commands)
+
+
+@benchmark("aoc_2015.day_01.Elevator.execute[CompactElevatorHistory]")
+def elevator_execute_compact_history() -> Job:
+    commands = text(2015, 1, 100000)
+    history = aoc_2015_day_01.CompactElevatorHistory
+    return lambda: aoc_2015_day_01.Elevator(history=history()).execute(commands)
+
+
+@benchmark("aoc_2015.day_01.VectorElevator.execute")
+def vector_elevator_execute() -> Job:
+    commands = text(2015, 1, 100000).encode()
+    return lambda: aoc_2015_day_01.VectorElevator().execute(commands)
+
+
+@benchmark("aoc_2015.day_01.ParallelElevator.execute", repeat=3)
+def parallel_elevator_execute() -> Job:
+    commands = text(2015, 1, 4000000).encode()
+    elevator = aoc_2015_day_01.ParallelElevator
+    return lambda: elevator(chunk_size=len(commands) // 4).execute(commands)
+
+
+@benchmark("aoc_2015.day_01.FloorIndex")
+def floor_index() -> Job:
+    walked = aoc_2015_day_01.floors(text(2015, 1, 100000))
+    return lambda: aoc_2015_day_01.FloorIndex(walked)
+
+
+@benchmark("aoc_2015.day_01.FloorIndex.lowest")
+def floor_index_lowest() -> Job:
+    index = aoc_2015_day_01.FloorIndex.from_commands(text(2015, 1, 100000))
+    ranges = [(start, start + start * 7 % 50000) for start in range(1, 50001, 50)]
+    return lambda: [index.lowest(start, end) for start, end in ranges]
+
+
+@benchmark("aoc_2015.day_01.final_floor")
+def elevator_final_floor() -> Job:
+    commands = text(2015, 1, 100000).encode()
+    return lambda: aoc_2015_day_01.final_floor(commands)
+
+
+@benchmark("aoc_2015.day_02.Calculator.calculate_wrapping_paper")
+def calculator_calculate_wrapping_paper() -> Job:
+    presents = aoc_2015_day_02.read_presents(lines(2015, 2, 20000))
+    return aoc_2015_day_02.Calculator(presents).calculate_wrapping_paper
+
+
+@benchmark("aoc_2015.day_02.read_presents")
+def read_presents() -> Job:
+    dimensions = lines(2015, 2, 20000)
+    return lambda: aoc_2015_day_02.read_presents(dimensions)
+
+
+@benchmark("aoc_2015.day_02.Calculator.calculate_wrapping_paper[PresentBatch]")
+def calculator_calculate_wrapping_paper_batch() -> Job:
+    presents = aoc_2015_day_02.PresentBatch.from_lines(lines(2015, 2, 20000))
+    return aoc_2015_day_02.Calculator(presents).calculate_wrapping_paper
+
+
+@benchmark("aoc_2015.day_02.StreamingCalculator.consume")
+def streaming_calculator_consume() -> Job:
+    dimensions = lines(2015, 2, 20000)
+    return lambda: aoc_2015_day_02.StreamingCalculator().consume(
+        dimensions, batch_size=4096
+    )
+
+
+@benchmark("aoc_2015.day_02.PresentBatch.from_text")
+def present_batch_from_text() -> Job:
+    dimensions = "".join(lines(2015, 2, 20000))
+    return lambda: aoc_2015_day_02.PresentBatch.from_text(dimensions)
+
+
+@benchmark("aoc_2015.day_03.Santa.deliver")
+def santa_deliver() -> Job:
+    directions = text(2015, 3, 100000)
+    return lambda: aoc_2015_day_03.Santa().deliver(directions)
+
+
+@benchmark("aoc_2015.day_03.VectorSanta.deliver")
+def vector_santa_deliver() -> Job:
+    directions = text(2015, 3, 100000)
+    return lambda: aoc_2015_day_03.VectorSanta().deliver(directions)
+
+
+@benchmark("aoc_2015.day_03.Fleet.deliver")
+def fleet_deliver() -> Job:
+    directions = text(2015, 3, 100000)
+    return lambda: aoc_2015_day_03.Fleet(4, workers=1).deliver(directions)
+
+
+@benchmark("aoc_2015.day_04.main")
+def adventcoin_main() -> Job:
+    secret_key = text(2015, 4, 1)
+    return lambda: aoc_2015_day_04.main("0000", secret_key=secret_key)
+
+
+@benchmark("aoc_2015.day_04.search_block[hex]")
+def search_block_hex() -> Job:
+    return lambda: aoc_2015_day_04.ENGINES["hex"]("000000", text(2015, 4, 1), 0, 50000)
+
+
+@benchmark("aoc_2015.day_04.search_block[prefix]")
+def search_block_prefix() -> Job:
+    return lambda: aoc_2015_day_04.ENGINES["prefix"](
+        "000000", text(2015, 4, 1), 0, 50000
+    )
+
+
+@benchmark("aoc_2015.day_04.search_block_multi")
+def search_block_multi() -> Job:
+    return lambda: aoc_2015_day_04.search_block_multi(
+        ["00000", "000000"], text(2015, 4, 1), 0, 50000
+    )
+
+
+@benchmark("aoc_2015.day_04.ParallelMiner.mine", repeat=3)
+def parallel_miner_mine() -> Job:
+    miner = aoc_2015_day_04.ParallelMiner(text(2015, 4, 1), workers=2)
+    return lambda: miner.mine("0000")
+
+
+@benchmark("aoc_2015.day_05.main")
+def nice_strings_main() -> Job:
+    strings = lines(2015, 5, 20000)
+    return lambda: aoc_2015_day_05.main(strings)
+
+
+@benchmark("aoc_2015.day_05.main[PART_TWO_VALIDATORS]")
+def nice_strings_main_part_two() -> Job:
+    strings = lines(2015, 5, 20000)
+    validators = aoc_2015_day_05.PART_TWO_VALIDATORS
+    return lambda: aoc_2015_day_05.main(strings, validators=validators)
+
+
+@benchmark("aoc_2015.day_05.FusedValidator.count")
+def fused_validator_count() -> Job:
+    strings = lines(2015, 5, 20000)
+    return lambda: aoc_2015_day_05.FusedValidator(aoc_2015_day_05.RULES).count(strings)
+
+
+@benchmark("aoc_2015.day_05.FusedValidator.count[PART_TWO_RULES]")
+def fused_validator_count_part_two() -> Job:
+    strings = lines(2015, 5, 20000)
+    rules = aoc_2015_day_05.PART_TWO_RULES
+    return lambda: aoc_2015_day_05.FusedValidator(rules).count(strings)
+
+
+@benchmark("aoc_2015.day_05.validate_bulk")
+def validate_bulk() -> Job:
+    strings = "".join(lines(2015, 5, 20000))
+    return lambda: aoc_2015_day_05.validate_bulk(
+        io.StringIO(strings), workers=1, chunk_size=1 << 16
+    )
+
+
+def distinct_letters(length: int) -> str:
+    """Return a string with no letter twice, the worst case for day 5's
+    validators, which can't stop early.
+    """
+    return "".join(map(chr, range(0x4E00, 0x4E00 + length)))
+
+
+def validate_pair_of_pairs(length: int) -> Job:
+    string = distinct_letters(length)
+    return lambda: aoc_2015_day_05.validate_pair_of_pairs(string)
+
+
+# The same validator on longer and longer strings, to show how it scales.
+for length in (1000, 4000, 16000):
+    benchmark(f"aoc_2015.day_05.validate_pair_of_pairs[{length}]")(
+        partial(validate_pair_of_pairs, length)
+    )
+
+
+@benchmark("aoc_2015.day_06.Grid.decorate", repeat=3)
+def grid_decorate() -> Job:
+    instructions = list(lines(2015, 6, 5))
+    # Building the million lights dominates, so leave it out of the timing.
+    grid = aoc_2015_day_06.Grid()
+    return lambda: grid.decorate(instructions)
+
+
+@benchmark("aoc_2015.day_06.VectorGrid.decorate")
+def vector_grid_decorate() -> Job:
+    instructions = lines(2015, 6, 5)
+    return lambda: aoc_2015_day_06.VectorGrid().decorate(instructions)
+
+
+@benchmark("aoc_2015.day_06.VectorGrid.decorate[DimmableLight]")
+def vector_grid_decorate_dimmable() -> Job:
+    instructions = lines(2015, 6, 5)
+    bulb_type = aoc_2015_day_06.DimmableLight
+    return lambda: aoc_2015_day_06.VectorGrid(bulb_type=bulb_type).decorate(
+        instructions
+    )
+
+
+@benchmark("aoc_2015.day_07.Circuit.trace")
+def circuit_trace() -> Job:
+    instructions = [line.rstrip("\n") for line in lines(2015, 7, 5000)]
+    circuit = aoc_2015_day_07.Circuit.build(instructions)
+    # Wire a only depends on a handful of wires, so trace all of them.
+    wire_names = [instruction.split(" -> ")[1] for instruction in instructions]
+    return lambda: [circuit.trace(wire_name) for wire_name in wire_names]
+
+
+@benchmark("aoc_2015.day_08.SpaceCounter.count")
+def space_counter_count() -> Job:
+    strings = [line.rstrip("\n") for line in lines(2015, 8, 20000)]
+    return aoc_2015_day_08.SpaceCounter(strings).count
+
+
+@benchmark("aoc_2022.day_01.ElfStats.from_calories_list")
+def elf_stats_from_calories_list() -> Job:
+    calories_list = list(lines(2022, 1, 20000))
+    return lambda: aoc_2022_day_01.ElfStats.from_calories_list(calories_list)
+
+
+@benchmark("aoc_2022.day_02.RockPaperScissors.run")
+def rock_paper_scissors_run() -> Job:
+    rounds = list(lines(2022, 2, 20000))
+    player, other = aoc_2022_day_02.Player(), aoc_2022_day_02.Player()
+    return aoc_2022_day_02.RockPaperScissors(player, other, rounds).run
+
+
+@benchmark("aoc_2022.day_03.sort")
+def rucksack_sort() -> Job:
+    rucksacks = list(lines(2022, 3, 30000))
+    return lambda: aoc_2022_day_03.sort(rucksacks)
+
+
+@benchmark("aoc_2022.day_04.assess")
+def assignments_assess() -> Job:
+    pairs = list(lines(2022, 4, 10000))
+    return lambda: aoc_2022_day_04.assess(pairs)
+
+
+@benchmark("aoc_2022.day_05.CrateMover9000.rearrange")
+def crate_mover_rearrange() -> Job:
+    commands = [line.rstrip("\n") for line in lines(2022, 5, 20000)][10:]
+    crane = aoc_2022_day_05.CrateMover9000(aoc_2022_day_05.Inventory())
+    return lambda: crane.rearrange(commands)
+
+
+@benchmark("aoc_2022.day_06.Receiver.find_marker")
+def receiver_find_marker() -> Job:
+    receiver = aoc_2022_day_06.Receiver(text(2022, 6, 100000))
+    return lambda: receiver.find_marker(14)
+
+
+@benchmark("aoc_2022.day_07.Filesystem.size_up_to_limit")
+def filesystem_size_up_to_limit() -> Job:
+    log = [line.rstrip("\n") for line in lines(2022, 7, 5000)]
+    return aoc_2022_day_07.Filesystem.build_from_log(log).size_up_to_limit
+
+
+@benchmark("aoc_2022.day_08.Surveyor.count_visible")
+def surveyor_count_visible() -> Job:
+    rows = tuple(line.rstrip("\n") for line in lines(2022, 8, 2500))
+    surveyor = aoc_2022_day_08.Surveyor(aoc_2022_day_08.Grid.from_rows(rows))
+    return surveyor.count_visible
+
+
+@benchmark("aoc_2022.day_09.Rope.move")
+def rope_move() -> Job:
+    motions = tuple(line.rstrip("\n") for line in lines(2022, 9, 2000))
+    return lambda: aoc_2022_day_09.Rope(10).move(motions)
+
+
+@benchmark("aoc_2022.day_10.CPU.run")
+def cpu_run() -> Job:
+    # The program is always 240 cycles long, so run it many times over.
+    instructions = tuple(line.rstrip("\n") for line in lines(2022, 10, 1))
+    return lambda: [aoc_2022_day_10.CPU().run(instructions) for _ in range(200)]
+
+
+@benchmark("aoc_2022.day_11.MonkeyBusinessCalculator.calculate")
+def monkey_business_calculator_calculate() -> Job:
+    monkey_defs = json.loads("".join(lines(2022, 11, 40)))
+    calculator = aoc_2022_day_11.MonkeyBusinessCalculator.build(monkey_defs)
+    return lambda: calculator.calculate(1000, divide_by_3=False)
+
+
+@benchmark("aoc_2022.day_12.Dijkstra.walk")
+def dijkstra_walk() -> Job:
+    heightmap = tuple(tuple(line.rstrip("\n")) for line in lines(2022, 12, 20000))
+    terrain = aoc_2022_day_12.Terrain.from_input(heightmap)
+    return lambda: aoc_2022_day_12.Dijkstra().walk(terrain)
+
+
+@benchmark("aoc_2022.day_13.compare")
+def packets_compare() -> Job:
+    pairs = aoc_2022_day_13.read_pairs(io.StringIO("".join(lines(2022, 13, 5000))))
+    return lambda: aoc_2022_day_13.compare(pairs)
+
+
+@benchmark("aoc_2023.day_01.main")
+def calibrations_main() -> Job:
+    calibrations = lines(2023, 1, 20000)
+    digit_func = aoc_2023_day_01.enhanced_digits
+    return lambda: aoc_2023_day_01.main(calibrations, digit_func=digit_func)
+
+
+@benchmark("aoc_2023.day_02.CubeGame.from_record")
+def cube_game_from_record() -> Job:
+    records = lines(2023, 2, 10000)
+    return lambda: [aoc_2023_day_02.CubeGame.from_record(r) for r in records]
+
+
+@benchmark("aoc_2023.day_03.collect_parts")
+def schematic_collect_parts() -> Job:
+    schematic = lines(2023, 3, 40000)
+    symbols = aoc_2023_day_03.collect_symbols(schematic)
+    return lambda: aoc_2023_day_03.collect_parts(symbols, schematic)
+
+
+@benchmark("aoc_2023.day_04.tabulate_tickets")
+def scratchcards_tabulate_tickets() -> Job:
+    scratchcards = tuple(
+        aoc_2023_day_04.Scratchcard.from_ticket(ticket)
+        for ticket in lines(2023, 4, 500)
+    )
+    return lambda: [
+        aoc_2023_day_04.tabulate_tickets(scratchcards, scratchcards) for _ in range(50)
+    ]
+
+
+def cold_start(puzzle: Puzzle) -> Job:
+    return lambda: startup.cold_start(puzzle)
+
+
+for puzzle in discover():
+    benchmark(
+        f"aoc.startup.cold_start[{puzzle.year}-{puzzle.day:02}]",
+        repeat=3,
+        budget=startup.DEFAULT_BUDGET,
+    )(partial(cold_start, puzzle))
@@ -0,0 +1,164 @@
+"""
+Cache puzzle answers on disk so unchanged parts don't run again.
+
+An answer is stored under a hash of the puzzle input and the source of
+the day module that solved it, along with every first-party module it
+imports, so editing any of them misses the cache.
+Each answer is a small JSON file; reading one marks it as recently used,
+and the least recently used files are removed once the cache grows past
+its size limit.
+"""
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from aoc.runner import ROOT, Puzzle
+
+CACHE_DIR = ROOT / ".aoc_cache"
+DEFAULT_MAX_SIZE = 16 * 1024 * 1024
+CHUNK_SIZE = 1 << 20
+# Top-level packages of this repository, aoc and the aoc_<year> days.
+FIRST_PARTY_PREFIX = "aoc"
+
+
+def is_first_party(module_name: str) -> bool:
+    """Return whether a module belongs to this repository."""
+    return module_name.partition(".")[0].startswith(FIRST_PARTY_PREFIX)
+
+
+def module_source(module_name: str) -> Optional[Path]:
+    """Return the source file of a module without importing it, or None
+    if it isn't a module with a source file.
+
+    Finding a submodule imports the packages above it.
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not spec.has_location:
+        return None
+    return Path(spec.origin)
+
+
+def imported_modules(module_name: str, source: bytes) -> Iterator[str]:
+    """Yield the names of the modules a module's source imports, as far
+    as they can be told apart from the names imported from them.
+    """
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                package = module_name.rsplit(".", node.level)[0]
+                base = f"{package}.{base}" if base else package
+            yield base
+            # from package import submodule
+            for alias in node.names:
+                yield f"{base}.{alias.name}"
+
+
+def first_party_sources(module_name: str) -> Dict[str, Path]:
+    """Return the source file of a module and of every first-party
+    module it imports, directly or through another, by module name.
+    """
+    sources: Dict[str, Path] = {}
+    unread = [module_name]
+    while unread:
+        name = unread.pop()
+        if name in sources or not is_first_party(name):
+            continue
+        path = module_source(name)
+        if path is None:
+            continue
+        sources[name] = path
+        unread.extend(imported_modules(name, path.read_bytes()))
+    return sources
+
+
+@dataclass(frozen=True)
+class ResultCache:
+    """A size-bounded directory of cached answers.
+
+    Attributes:
+      directory (Path): where the answers are stored.
+      max_size (int): the most bytes of answers to keep.
+    """
+
+    directory: Path = CACHE_DIR
+    max_size: int = DEFAULT_MAX_SIZE
+
+    def key(self, puzzle: Puzzle, part: int, input_path: Union[str, Path]) -> str:
+        """Return the cache key for solving a part with an input."""
+        digest = hashlib.sha256(f"{puzzle.module_name}:{part}\0".encode())
+        sources = first_party_sources(puzzle.module_name)
+        if puzzle.module_name not in sources:
+            raise ModuleNotFoundError(f"No source found for {puzzle}.")
+        for name, path in sorted(sources.items()):
+            digest.update(f"{name}\0".encode())
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+        with open(input_path, "rb") as data:
+            for chunk in iter(lambda: data.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached answer for a key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path) as data:
+                answer = json.load(data)["answer"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        # Touch the file so eviction sees it as recently used.
+        os.utime(path)
+        return answer
+
+    def put(self, key: str, answer: Any) -> None:
+        """Store an answer, evicting old ones to stay under the limit.
+
+        Answers that can't be written as JSON aren't cached.
+        """
+        try:
+            serialized = json.dumps({"answer": answer})
+        except TypeError:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see half a file.
+        path = self._path(key)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        partial.write_text(serialized)
+        os.replace(partial, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used answers until under the limit."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached answer."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
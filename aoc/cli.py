@@ -0,0 +1,388 @@
+"""
+Command line interface for running puzzle solutions.
+
+    python -m aoc run --year 2022 --day 11 --part 2 --input path
+    python -m aoc run --all --workers 8
+    python -m aoc run --year 2022 --day 7 --profile
+    python -m aoc generate --year 2022 --day 8 --scale 1000000 --output path
+    python -m aoc bench --check
+    python -m aoc startup --year 2022
+
+Every command imports what it needs when it runs, so starting up to
+solve one puzzle doesn't pay for benchmarking, profiling, or the process
+pool.
+"""
+import argparse
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from aoc.runner import (
+    PART_TO_FUNCTION_MAP,
+    Measurement,
+    discover,
+    format_bytes,
+    measure,
+)
+
+if TYPE_CHECKING:
+    from aoc.bench import Benchmark, Result
+    from aoc.cache import ResultCache
+    from aoc.parallel import Job
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the parser for all aoc commands."""
+    parser = argparse.ArgumentParser(prog="aoc", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve puzzles and measure them")
+    run.add_argument("--year", type=int, help="only run puzzles for this year")
+    run.add_argument("--day", type=int, help="only run puzzles for this day")
+    run.add_argument(
+        "--part",
+        type=int,
+        choices=sorted(PART_TO_FUNCTION_MAP),
+        help="only run this part",
+    )
+    run.add_argument(
+        "--input",
+        help="puzzle input to use instead of the checked-in one",
+    )
+    run.add_argument(
+        "--json",
+        action="store_true",
+        help="print one JSON object per part instead of a summary",
+    )
+    run.add_argument(
+        "--no-memory",
+        dest="trace_memory",
+        action="store_false",
+        help="skip tracing peak memory for more faithful timings",
+    )
+    run.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="always solve instead of reusing answers for unchanged code and input",
+    )
+    run.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="where cached answers are kept (default: .aoc_cache)",
+    )
+    run.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile each part, saving cProfile stats, sampled call stacks "
+        "for a flamegraph, and the biggest allocations",
+    )
+    run.add_argument(
+        "--profile-dir",
+        type=Path,
+        help="where --profile saves its files (default: profiles)",
+    )
+    run.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="functions and allocation sites --profile prints (default: 10)",
+    )
+    run.add_argument(
+        "--all",
+        action="store_true",
+        help="run every matching part at once on a pool of processes, "
+        "longest first, reporting each as it finishes",
+    )
+    run.add_argument(
+        "--workers",
+        type=int,
+        help="processes to use with --all (default: one per CPU)",
+    )
+    run.add_argument(
+        "--timings",
+        help="historical timings that --all schedules by and updates "
+        "(default: timings.json)",
+    )
+    run.set_defaults(handler=run_command)
+
+    generate = commands.add_parser("generate", help="write a synthetic input")
+    generate.add_argument("--year", type=int, required=True)
+    generate.add_argument("--day", type=int, required=True)
+    generate.add_argument(
+        "--scale",
+        type=int,
+        default=1000,
+        help="how many records or cells to generate (default: 1000)",
+    )
+    generate.add_argument("--seed", type=int, default=0, help="(default: 0)")
+    generate.add_argument("--output", help="file to write (default: stdout)")
+    generate.set_defaults(handler=generate_command)
+
+    benchmark = commands.add_parser(
+        "bench", help="benchmark entry points against the stored baseline"
+    )
+    benchmark.add_argument(
+        "--filter", help="only run benchmarks whose names contain this"
+    )
+    benchmark.add_argument(
+        "--baseline",
+        help="baseline file (default: benchmarks.json)",
+    )
+    benchmark.add_argument(
+        "--save",
+        action="store_true",
+        help="record new benchmarks in the baseline, and with --filter, "
+        "re-record the ones it picks",
+    )
+    benchmark.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if any benchmark regressed",
+    )
+    benchmark.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="fraction slower or bigger that counts as a regression (default: 0.5)",
+    )
+    benchmark.set_defaults(handler=bench_command)
+
+    startup = commands.add_parser(
+        "startup", help="time how long a fresh process takes to be ready"
+    )
+    startup.add_argument("--year", type=int, help="only time puzzles for this year")
+    startup.add_argument("--day", type=int, help="only time puzzles for this day")
+    startup.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="processes to start per puzzle, keeping the fastest (default: 5)",
+    )
+    startup.add_argument(
+        "--budget",
+        type=float,
+        default=0.3,
+        help="seconds a fresh process may take before --check fails (default: 0.3)",
+    )
+    startup.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if any puzzle is over budget",
+    )
+    startup.set_defaults(handler=startup_command)
+
+    return parser
+
+
+def run_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Solve the requested puzzle parts and report on each."""
+    puzzles = discover(args.year, args.day)
+    if not puzzles:
+        parser.error("no puzzles match the given year and day")
+    if args.input and len(puzzles) > 1:
+        parser.error("--input needs a single puzzle; pass --year and --day")
+
+    parts = [args.part] if args.part else sorted(PART_TO_FUNCTION_MAP)
+    if args.profile:
+        if args.all:
+            parser.error("--profile can't be used with --all")
+        return profile_command(args, [(p, part) for p in puzzles for part in parts])
+    if args.all:
+        if args.input:
+            parser.error("--input can't be used with --all")
+        return run_all_command(args, [(p, part) for p in puzzles for part in parts])
+
+    result_cache = open_cache(args)
+    for puzzle in puzzles:
+        for part in parts:
+            report(
+                measure(puzzle, part, args.input, args.trace_memory, result_cache),
+                args.json,
+            )
+
+    return 0
+
+
+def open_cache(args: argparse.Namespace) -> Optional["ResultCache"]:
+    """Return the result cache the run arguments ask for, if any."""
+    if not args.use_cache:
+        return None
+    from aoc.cache import CACHE_DIR, ResultCache
+
+    return ResultCache(args.cache_dir or CACHE_DIR)
+
+
+def profile_command(args: argparse.Namespace, jobs: List["Job"]) -> int:
+    """Profile puzzle parts one at a time and save what was found."""
+    from aoc import profiling
+
+    for puzzle, part in jobs:
+        result = profiling.profile(puzzle, part, args.input, top=args.top)
+        report(result.measurement, args.json)
+        paths = result.write(args.profile_dir or profiling.PROFILE_DIR)
+        if not args.json:
+            print(result.stats_report(args.top))
+            print(f"Largest allocations at peak memory:\n{result.allocation_report()}")
+            print("Saved " + ", ".join(str(path) for path in paths) + "\n")
+    return 0
+
+
+def run_all_command(args: argparse.Namespace, jobs: List["Job"]) -> int:
+    """Solve puzzle parts in parallel and record how long each took."""
+    from aoc import parallel
+
+    timings_path = args.timings or parallel.TIMINGS_PATH
+    start = time.perf_counter()
+    measurements = []
+    for measurement in parallel.run_all(
+        jobs,
+        parallel.load_timings(timings_path),
+        workers=args.workers,
+        trace_memory=args.trace_memory,
+        cache=open_cache(args),
+    ):
+        report(measurement, args.json)
+        measurements.append(measurement)
+    parallel.save_timings(measurements, timings_path)
+
+    if not args.json:
+        elapsed = time.perf_counter() - start
+        slowest = max(measurement.wall_time for measurement in measurements)
+        print(
+            f"{len(measurements)} parts in {elapsed:.2f}s "
+            f"(slowest part {slowest:.2f}s)"
+        )
+    return 0
+
+
+def generate_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Write a synthetic input for a puzzle."""
+    from aoc import generators
+
+    if (args.year, args.day) not in generators.GENERATORS:
+        parser.error(f"no generator for {args.year} day {args.day:02}")
+
+    generators.write(args.year, args.day, args.output, args.scale, args.seed)
+    return 0
+
+
+def bench_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Run benchmarks, compare them to the baseline, and maybe save them."""
+    from aoc import bench
+
+    benchmarks = bench.select(args.filter)
+    if not benchmarks:
+        parser.error("no benchmarks match the filter")
+
+    baseline_path = args.baseline or bench.BASELINE_PATH
+    try:
+        baseline = bench.Baseline.load(baseline_path)
+    except FileNotFoundError:
+        if args.check:
+            parser.error(f"no baseline at {baseline_path} to check against")
+        baseline = None
+
+    regressions = []
+    saved: Dict[str, "Result"] = {}
+    for benchmark in benchmarks:
+        result = bench.run(benchmark)
+        comparison = None
+        if baseline and benchmark.name in baseline.results:
+            comparison = baseline.compare(benchmark.name, result)
+        if (comparison and comparison.regressed(args.threshold)) or over_budget(
+            benchmark, result
+        ):
+            # Give a noisy machine a second chance before failing.
+            retry = bench.run(benchmark)
+            if retry.relative_median < result.relative_median:
+                result = retry
+                if baseline and comparison:
+                    comparison = baseline.compare(benchmark.name, result)
+
+        line = (
+            f"{benchmark.name:<60} {result.median * 1000:9.2f} ms "
+            f"(p90 {result.p90 * 1000:.2f} ms) "
+            f"{format_bytes(result.peak_memory):>10}"
+        )
+        regressed = bool(comparison and comparison.regressed(args.threshold))
+        if comparison:
+            line += (
+                f"  time x{comparison.time_ratio:.2f}"
+                f"  memory x{comparison.memory_ratio:.2f}"
+            )
+            if regressed:
+                line += "  REGRESSED"
+        if benchmark.budget is not None and over_budget(benchmark, result):
+            line += f"  OVER BUDGET ({benchmark.budget * 1000:.0f} ms)"
+            regressed = True
+        if regressed:
+            regressions.append(benchmark.name)
+        print(line, flush=True)
+
+        # Stored results are only replaced when asked for by name, so a
+        # change re-records just the benchmarks it touches.
+        if args.save and (
+            args.filter is not None
+            or not baseline
+            or benchmark.name not in baseline.results
+        ):
+            saved[benchmark.name] = result
+
+    if args.save:
+        baseline = baseline or bench.Baseline()
+        baseline.results.update(saved)
+        baseline.save(baseline_path)
+
+    if args.check and regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed past {args.threshold:.0%} "
+            "or went over budget"
+        )
+        return 1
+    return 0
+
+
+def over_budget(benchmark: "Benchmark", result: "Result") -> bool:
+    """Return whether a benchmark's fastest run took longer than allowed."""
+    return benchmark.budget is not None and result.best > benchmark.budget
+
+
+def startup_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Time fresh processes readied to solve each puzzle."""
+    from aoc import startup
+
+    puzzles = discover(args.year, args.day)
+    if not puzzles:
+        parser.error("no puzzles match the given year and day")
+
+    over_budget = []
+    for puzzle in puzzles:
+        result = startup.measure(puzzle, args.repeat)
+        line = str(result)
+        if result.wall_time > args.budget:
+            line += "  OVER BUDGET"
+            over_budget.append(puzzle)
+        print(line, flush=True)
+
+    if args.check and over_budget:
+        print(f"{len(over_budget)} puzzle(s) took over {args.budget:.2f}s to start")
+        return 1
+    return 0
+
+
+def report(measurement: Measurement, as_json: bool = False) -> None:
+    """Print a measurement in human or JSON form."""
+    if as_json:
+        import json
+
+        print(json.dumps(asdict(measurement)), flush=True)
+    else:
+        print(measurement, flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(parser, args)
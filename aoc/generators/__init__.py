@@ -0,0 +1,66 @@
+"""
+Synthetic puzzle inputs at any scale.
+
+Each generator takes a seeded random number generator and a scale and
+yields the text of a valid puzzle input in chunks, so inputs far larger
+than memory can be written straight to disk. What scale counts (lines,
+characters, grid cells, ...) depends on the puzzle and is noted on each
+generator.
+"""
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+from aoc.generators import year_2015, year_2022, year_2023
+
+Generator = Callable[[random.Random, int], Iterator[str]]
+
+GENERATORS: Dict[Tuple[int, int], Generator] = {
+    (year, day): generator
+    for year, module in (
+        (2015, year_2015),
+        (2022, year_2022),
+        (2023, year_2023),
+    )
+    for day, generator in module.GENERATORS.items()
+}
+
+
+def generate(year: int, day: int, scale: int = 1000, seed: int = 0) -> Iterator[str]:
+    """Yield the text of a synthetic input for a puzzle.
+
+    Args:
+      year (int): the puzzle year.
+      day (int): the puzzle day.
+      scale (int, default: 1000): how big to make the input.
+      seed (int, default: 0): the seed that makes the input repeatable.
+
+    Returns:
+      (Iterator[str]): chunks of the input's text.
+    """
+    try:
+        generator = GENERATORS[year, day]
+    except KeyError:
+        raise ValueError(f"No generator for {year} day {day:02}.") from None
+
+    return generator(random.Random(seed), scale)
+
+
+def write(
+    year: int,
+    day: int,
+    path: Optional[Union[str, Path]] = None,
+    scale: int = 1000,
+    seed: int = 0,
+) -> None:
+    """Stream a synthetic input for a puzzle to a file, or to stdout if
+    no path is given.
+    """
+    chunks = generate(year, day, scale, seed)
+    if path is None:
+        sys.stdout.writelines(chunks)
+        return
+
+    with open(path, "w") as output:
+        output.writelines(chunks)
@@ -0,0 +1,23 @@
+"""Building blocks shared by the puzzle input generators."""
+import random
+import string
+from typing import Iterator
+
+CHUNK_SIZE = 1 << 16
+
+# Lowercase letters that can't spell "cd", "ls", or "dir", which the
+# 2022 day 7 log parser looks for anywhere in a line.
+SAFE_LETTERS = "".join(c for c in string.ascii_lowercase if c not in "cdils")
+
+
+def characters(rng: random.Random, alphabet: str, count: int) -> Iterator[str]:
+    """Yield count random characters from the alphabet in chunks."""
+    while count > 0:
+        size = min(count, CHUNK_SIZE)
+        yield "".join(rng.choices(alphabet, k=size))
+        count -= size
+
+
+def word(rng: random.Random, alphabet: str, shortest: int, longest: int) -> str:
+    """Return a random word with a length between shortest and longest."""
+    return "".join(rng.choices(alphabet, k=rng.randint(shortest, longest)))
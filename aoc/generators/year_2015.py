@@ -0,0 +1,117 @@
+"""Input generators for the 2015 puzzles."""
+import random
+import string
+from typing import Iterator
+
+from aoc.generators.common import characters, word
+
+INSTRUCTIONS = ("turn on", "turn off", "toggle")
+GATES = ("AND", "OR", "LSHIFT", "RSHIFT", "NOT", "WIRE", "SIGNAL")
+
+
+def day_01(rng: random.Random, scale: int) -> Iterator[str]:
+    """One line of scale parentheses."""
+    yield from characters(rng, "()", scale)
+    yield "\n"
+
+
+def day_02(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of present dimensions."""
+    for _ in range(scale):
+        length, width, height = (rng.randint(1, 30) for _ in range(3))
+        yield f"{length}x{width}x{height}\n"
+
+
+def day_03(rng: random.Random, scale: int) -> Iterator[str]:
+    """One line of scale directions."""
+    yield from characters(rng, "^v<>", scale)
+    yield "\n"
+
+
+def day_04(rng: random.Random, scale: int) -> Iterator[str]:
+    """A secret key. The search space is set by the puzzle, not the
+    input, so scale has no effect.
+    """
+    yield word(rng, string.ascii_lowercase, 8, 8) + "\n"
+
+
+def day_05(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of sixteen-letter strings."""
+    for _ in range(scale):
+        yield word(rng, string.ascii_lowercase, 16, 16) + "\n"
+
+
+def day_06(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of light instructions on the 1000x1000 grid."""
+    for _ in range(scale):
+        x1, x2 = sorted(rng.randrange(1000) for _ in range(2))
+        y1, y2 = sorted(rng.randrange(1000) for _ in range(2))
+        yield f"{rng.choice(INSTRUCTIONS)} {x1},{y1} through {x2},{y2}\n"
+
+
+def wire_name(index: int) -> str:
+    """Return a unique wire name for an index: a, b, ..., z, aa, ab, ..."""
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = string.ascii_lowercase[remainder] + name
+    return name
+
+
+def day_07(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of wiring, each wire fed only by wires listed before
+    it, ending with wire a. Wire b always carries a plain signal.
+    """
+    scale = max(scale, 2)
+    yield f"{rng.randrange(1 << 16)} -> b\n"
+    # Wire indexes 0 and 1 are a and b, so the rest start at 2.
+    for index in range(2, scale + 1):
+        target = "a" if index == scale else wire_name(index)
+        left = wire_name(rng.randrange(1, index))
+        right = wire_name(rng.randrange(1, index))
+        if index == scale and index > 2:
+            # Make wire a depend on the most recent wires.
+            left, right, gate = wire_name(index - 1), wire_name(index - 2), "OR"
+        else:
+            gate = rng.choice(GATES) if index > 2 else "SIGNAL"
+        if gate == "SIGNAL":
+            recipe = str(rng.randrange(1 << 16))
+        elif gate == "WIRE":
+            recipe = left
+        elif gate == "NOT":
+            recipe = f"NOT {left}"
+        elif gate in ("LSHIFT", "RSHIFT"):
+            recipe = f"{left} {gate} {rng.randint(1, 15)}"
+        else:
+            recipe = f"{left} {gate} {right}"
+        yield f"{recipe} -> {target}\n"
+
+
+def day_08(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of quoted string literals with escapes."""
+    for _ in range(scale):
+        pieces = []
+        for _ in range(rng.randint(0, 30)):
+            kind = rng.random()
+            if kind < 0.05:
+                pieces.append("\\\\")
+            elif kind < 0.1:
+                pieces.append('\\"')
+            elif kind < 0.15:
+                pieces.append(f"\\x{rng.randrange(256):02x}")
+            else:
+                pieces.append(rng.choice(string.ascii_lowercase))
+        yield '"' + "".join(pieces) + '"\n'
+
+
+GENERATORS = {
+    1: day_01,
+    2: day_02,
+    3: day_03,
+    4: day_04,
+    5: day_05,
+    6: day_06,
+    7: day_07,
+    8: day_08,
+}
@@ -0,0 +1,311 @@
+"""Input generators for the 2022 puzzles."""
+import json
+import math
+import random
+import string
+from typing import Iterator, List, Tuple
+
+from aoc.generators.common import CHUNK_SIZE, SAFE_LETTERS, characters, word
+from aoc_2022.day_05 import STARTING_STACKS
+
+# The monkeys keep worry levels in check by the product of these, so
+# their tests may only use them.
+MONKEY_CONDITIONS = (2, 3, 5, 7, 11, 13, 17, 19)
+
+MAX_DIRECTORY_DEPTH = 10
+# The most the 70000000-byte disk of day 7 may hold while leaving the
+# 30000000 bytes the update needs, and roughly how full it gets, so that
+# part two always has a directory to delete.
+UPDATE_USAGE_LIMIT = 70000000 - 30000000
+DISK_USAGE = 50000000
+
+
+def day_01(rng: random.Random, scale: int) -> Iterator[str]:
+    """Meals for scale Elves, separated by blank lines."""
+    for elf in range(scale):
+        if elf:
+            yield "\n"
+        for _ in range(rng.randint(1, 8)):
+            yield f"{rng.randint(1000, 9999)}\n"
+
+
+def day_02(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of strategy guide rounds."""
+    for _ in range(scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
+
+
+def rucksack(
+    rng: random.Random, badge: str, items: str, half_length: int
+) -> Tuple[str, str]:
+    """Return the two compartments of a rucksack carrying the badge and
+    sharing exactly one item between the compartments.
+    """
+    split = len(items) // 2
+    left, right = items[:split], items[split:]
+    common = rng.choice(items + badge)
+    first = [common] + rng.choices(left, k=half_length - 1)
+    second = [common] + rng.choices(right, k=half_length - 1)
+    if badge != common:
+        # Replace anything but the shared item with the badge.
+        first[rng.randrange(1, half_length)] = badge
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first), "".join(second)
+
+
+def day_03(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale rucksacks, rounded up to whole groups of three."""
+    for _ in range(math.ceil(scale / 3)):
+        letters = list(string.ascii_letters)
+        rng.shuffle(letters)
+        badge, others = letters[0], letters[1:]
+        # Each Elf packs from their own letters so only the badge is
+        # common to the whole group.
+        pools = ("".join(others[i::3]) for i in range(3))
+        for items in pools:
+            first, second = rucksack(rng, badge, items, rng.randint(4, 16))
+            yield f"{first}{second}\n"
+
+
+def day_04(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of paired section assignments."""
+    for _ in range(scale):
+        first_start, first_end = sorted(rng.randint(1, 99) for _ in range(2))
+        second_start, second_end = sorted(rng.randint(1, 99) for _ in range(2))
+        yield f"{first_start}-{first_end},{second_start}-{second_end}\n"
+
+
+def day_05(rng: random.Random, scale: int) -> Iterator[str]:
+    """The starting stacks drawing followed by scale valid moves."""
+    stacks = [
+        [supply.name for supply in stack.supplies] for stack in STARTING_STACKS.values()
+    ]
+    for level in range(max(len(stack) for stack in stacks) - 1, -1, -1):
+        row = " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        )
+        yield row.rstrip() + "\n"
+    yield " " + "   ".join(str(column) for column in STARTING_STACKS) + "\n"
+    yield "\n"
+
+    heights = {column: len(stack) for column, stack in STARTING_STACKS.items()}
+    columns = list(heights)
+    for _ in range(scale):
+        source = rng.choice([column for column in columns if heights[column]])
+        destination = rng.choice([column for column in columns if column != source])
+        count = rng.randint(1, min(heights[source], 5))
+        heights[source] -= count
+        heights[destination] += count
+        yield f"move {count} from {source} to {destination}\n"
+
+
+def day_06(rng: random.Random, scale: int) -> Iterator[str]:
+    """One line of scale characters whose only markers are at the end."""
+    marker = list("defghijklmnopq")
+    rng.shuffle(marker)
+    yield from characters(rng, "abc", max(scale - len(marker), 0))
+    yield "".join(marker) + "\n"
+
+
+def split_budget(rng: random.Random, budget: int, parts: int) -> List[int]:
+    """Randomly split a budget into parts that add up to it."""
+    if not parts:
+        return []
+    cuts = sorted(rng.randint(0, budget) for _ in range(parts - 1))
+    return [end - start for start, end in zip([0] + cuts, cuts + [budget])]
+
+
+def listing(
+    rng: random.Random, budget: int, depth: int, largest_file: int
+) -> Tuple[List[str], List[Tuple[str, int]]]:
+    """Return the lines of a directory listing holding budget entries
+    in total, and the name and budget of each subdirectory.
+    """
+    if depth == MAX_DIRECTORY_DEPTH:
+        file_count = budget
+    else:
+        file_count = min(budget, rng.randint(1, 6))
+    remaining = budget - file_count
+    directory_count = min(remaining, rng.randint(1, 5))
+    budgets = split_budget(rng, remaining - directory_count, directory_count)
+
+    lines = [
+        f"{rng.randint(1, largest_file)} {word(rng, SAFE_LETTERS, 1, 8)}{i}.txt\n"
+        for i in range(file_count)
+    ]
+    directories = [
+        (f"{word(rng, SAFE_LETTERS, 1, 8)}{i}", directory_budget)
+        for i, directory_budget in enumerate(budgets)
+    ]
+    lines.extend(f"dir {name}\n" for name, _ in directories)
+    return lines, directories
+
+
+def listed_size(lines: List[str]) -> int:
+    """Return the total size of the files in a directory listing."""
+    return sum(int(line.split()[0]) for line in lines if not line.startswith("dir"))
+
+
+def day_07(rng: random.Random, scale: int) -> Iterator[str]:
+    """A terminal log exploring a filesystem of scale files and
+    directories.
+    """
+    largest_file = max(2 * DISK_USAGE // max(scale, 1), 2)
+    yield "$ cd /\n"
+    yield "$ ls\n"
+    lines, directories = listing(rng, scale, 0, largest_file)
+    yield from lines
+    # Listed up front but explored last, once the files generated so far
+    # are known, to top the disk up past what the update can live with.
+    yield "dir quota\n"
+    usage = listed_size(lines)
+    # Walk depth first, keeping only the unvisited directories of each
+    # level in memory.
+    unvisited = [iter(directories)]
+    while unvisited:
+        for name, budget in unvisited[-1]:
+            yield f"$ cd {name}\n"
+            yield "$ ls\n"
+            lines, directories = listing(rng, budget, len(unvisited), largest_file)
+            yield from lines
+            usage += listed_size(lines)
+            unvisited.append(iter(directories))
+            break
+        else:
+            unvisited.pop()
+            if unvisited:
+                yield "$ cd ..\n"
+    top_up = max(UPDATE_USAGE_LIMIT - usage, 0)
+    yield "$ cd quota\n"
+    yield "$ ls\n"
+    yield f"{top_up + rng.randint(1, DISK_USAGE - UPDATE_USAGE_LIMIT)} quota.txt\n"
+
+
+def day_08(rng: random.Random, scale: int) -> Iterator[str]:
+    """A square grid of about scale tree heights."""
+    side = max(math.isqrt(scale), 1)
+    for _ in range(side):
+        yield "".join(rng.choices(string.digits, k=side)) + "\n"
+
+
+def day_09(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of rope motions."""
+    for _ in range(scale):
+        yield f"{rng.choice('RULD')} {rng.randint(1, 20)}\n"
+
+
+def day_10(rng: random.Random, scale: int) -> Iterator[str]:
+    """A program for the 240 cycles the CRT can draw. The screen size is
+    set by the puzzle, not the input, so scale has no effect.
+    """
+    cycles = 0
+    register = 1
+    while cycles < 240:
+        if cycles == 239 or rng.random() < 0.3:
+            cycles += 1
+            yield "noop\n"
+        else:
+            cycles += 2
+            # Keep the sprite on the screen.
+            value = rng.randint(max(-10, -register), min(10, 39 - register))
+            register += value
+            yield f"addx {value}\n"
+
+
+def day_11(rng: random.Random, scale: int) -> Iterator[str]:
+    """Eight monkeys holding scale items between them, as JSON."""
+    monkey_count = len(MONKEY_CONDITIONS)
+    conditions = list(MONKEY_CONDITIONS)
+    rng.shuffle(conditions)
+    holdings = split_budget(rng, scale, monkey_count)
+
+    yield "["
+    for index, (condition, holding) in enumerate(zip(conditions, holdings)):
+        if index:
+            yield ","
+        yield '{"starting": ['
+        while holding > 0:
+            size = min(holding, CHUNK_SIZE)
+            items = (str(rng.randint(50, 99)) for _ in range(size))
+            yield ", ".join(items)
+            holding -= size
+            if holding:
+                yield ", "
+        yield "], "
+
+        kind = rng.random()
+        if kind < 0.15:
+            # A negative operand squares the old worry level.
+            operation = {"operator": "multiply", "operand": -1}
+        elif kind < 0.5:
+            operation = {"operator": "multiply", "operand": rng.randint(2, 19)}
+        else:
+            operation = {"operator": "plus", "operand": rng.randint(1, 8)}
+        true, false = rng.sample(
+            [other for other in range(monkey_count) if other != index], 2
+        )
+        test = {"condition": condition, "true": true, "false": false}
+        yield f'"operation": {json.dumps(operation)}, "test": {json.dumps(test)}}}'
+    yield "]\n"
+
+
+def day_12(rng: random.Random, scale: int) -> Iterator[str]:
+    """A heightmap of about scale squares climbing from S on the left
+    to E on the right without ever rising more than one step.
+    """
+    # At least 26 columns leave room for every height from a to z.
+    width = max(math.isqrt(scale), 26)
+    height = max(scale // width, 1)
+    end_row = rng.randrange(height)
+    shift = 0
+    for y in range(height):
+        if y:
+            # Neighboring rows drift apart by at most one column.
+            shift = min(max(shift + rng.randint(-1, 1), 0), width // 4)
+        row = [
+            string.ascii_lowercase[min((x + shift) * 26 // width, 25)]
+            for x in range(width)
+        ]
+        if y == 0:
+            row[0] = "S"
+        if y == end_row:
+            row[-1] = "E"
+        yield "".join(row) + "\n"
+
+
+def packet(rng: random.Random, depth: int = 0) -> list:
+    """Return a random packet of nested lists and integers."""
+    items: list = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 3 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+        else:
+            items.append(rng.randint(0, 10))
+    return items
+
+
+def day_13(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale pairs of packets, separated by blank lines."""
+    for pair in range(scale):
+        if pair:
+            yield "\n"
+        for _ in range(2):
+            yield json.dumps(packet(rng), separators=(",", ":")) + "\n"
+
+
+GENERATORS = {
+    1: day_01,
+    2: day_02,
+    3: day_03,
+    4: day_04,
+    5: day_05,
+    6: day_06,
+    7: day_07,
+    8: day_08,
+    9: day_09,
+    10: day_10,
+    11: day_11,
+    12: day_12,
+    13: day_13,
+}
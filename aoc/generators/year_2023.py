@@ -0,0 +1,91 @@
+"""Input generators for the 2023 puzzles."""
+import math
+import random
+import string
+from typing import Iterator
+
+from aoc.generators.common import word
+
+DIGIT_WORDS = (
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+)
+SYMBOLS = "*#+$/@=%&-"
+
+
+def day_01(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of calibrations, each with at least one digit."""
+    for _ in range(scale):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.3:
+                pieces.append(rng.choice(string.digits[1:]))
+            elif kind < 0.5:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                pieces.append(word(rng, string.ascii_lowercase, 1, 5))
+        rng.shuffle(pieces)
+        yield "".join(pieces) + "\n"
+
+
+def day_02(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of cube game records."""
+    for game in range(1, scale + 1):
+        pulls = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            pulls.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        yield f"Game {game}: {'; '.join(pulls)}\n"
+
+
+def day_03(rng: random.Random, scale: int) -> Iterator[str]:
+    """A square engine schematic of about scale characters."""
+    side = max(math.isqrt(scale), 1)
+    for _ in range(side):
+        row = ""
+        while len(row) < side:
+            kind = rng.random()
+            length = rng.randint(1, 3)
+            if kind < 0.15 and len(row) + length <= side:
+                # Follow each number with a dot so it can't run into the
+                # next one.
+                row += str(rng.randint(10 ** (length - 1), 10**length - 1)) + "."
+            elif kind < 0.2:
+                row += rng.choice(SYMBOLS)
+            else:
+                row += "."
+        yield row[:side] + "\n"
+
+
+def day_04(rng: random.Random, scale: int) -> Iterator[str]:
+    """Scale lines of scratchcards.
+
+    Cards win fewer than one card on average so the total number of
+    copies grows with scale rather than exploding.
+    """
+    for card in range(1, scale + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, losing = numbers[:10], numbers[10:]
+        winner_count = 0 if rng.random() < 0.6 else rng.randint(1, 3)
+        player = rng.sample(winning, winner_count) + losing[winner_count:]
+        rng.shuffle(player)
+        yield (
+            f"Card {card:>3}: {' '.join(f'{n:>2}' for n in winning)} | "
+            f"{' '.join(f'{n:>2}' for n in player)}\n"
+        )
+
+
+GENERATORS = {
+    1: day_01,
+    2: day_02,
+    3: day_03,
+    4: day_04,
+}
@@ -0,0 +1,214 @@
+"""
+A rectangular grid stored in one contiguous NumPy array.
+
+Grid puzzles tend to start out as a Python object per cell, which costs
+dozens of bytes for each one and makes every whole-grid operation a loop
+in Python. ArrayGrid keeps each cell as a single array element instead,
+so a character grid takes one byte per cell and whole rows, columns, or
+rectangles can be read and updated at once.
+
+    grid = ArrayGrid.from_input(data)
+    grid.rectangle(0, 0, 2, 3)[...] ^= 1
+    steps = grid.distances(grid.cells == ord("S"), lambda a, b: b <= a + 1)
+"""
+import mmap
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from aoc.loader import NEWLINE, Input, MappedInput
+
+# North, east, south, and west, as (y, x) steps.
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONALS = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+
+Position = Tuple[int, int]
+MoveRule = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+class ArrayGrid:
+    """A grid of cells backed by a 2D NumPy array.
+
+    Attributes:
+      cells (np.ndarray): the cells, indexed by row then column.
+    """
+
+    def __init__(self, cells: np.ndarray):
+        if cells.ndim != 2:
+            raise ValueError("A grid needs a two-dimensional array.")
+        self.cells = cells
+
+    @classmethod
+    def full(
+        cls, height: int, width: int, fill: int = 0, dtype: type = np.uint8
+    ) -> "ArrayGrid":
+        """Return a grid with every cell set to the same value."""
+        return cls(np.full((height, width), fill, dtype=dtype))
+
+    @classmethod
+    def from_bytes(cls, buffer: Union[bytes, mmap.mmap], start: int = 0) -> "ArrayGrid":
+        """Parse rows of equal width separated by newlines into a grid of
+        byte values, copying just the cells out of the buffer.
+        """
+        end = len(buffer)
+        while end > start and buffer[end - 1 : end] == NEWLINE:
+            end -= 1
+        newline = buffer.find(NEWLINE, start, end)
+        width = (end if newline == -1 else newline) - start
+        if not width:
+            return cls(np.zeros((0, 0), dtype=np.uint8))
+
+        stride = width + 1
+        height, remainder = divmod(end - start + 1, stride)
+        if remainder:
+            raise ValueError("Rows of a grid must all be the same width.")
+        # Every row but the last ends in a newline; view the last row's
+        # missing one as past the end and then drop that column.
+        flat = np.frombuffer(buffer, dtype=np.uint8, count=end - start, offset=start)
+        cells = np.empty((height, stride), dtype=np.uint8)
+        cells.reshape(-1)[: end - start] = flat
+        if not (cells[:-1, width] == ord(NEWLINE)).all():
+            raise ValueError("Rows of a grid must all be the same width.")
+        return cls(np.ascontiguousarray(cells[:, :width]))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[str, Sequence[str]]]) -> "ArrayGrid":
+        """Parse rows of characters into a grid of their byte values."""
+        encoded = [
+            (row if isinstance(row, str) else "".join(row)).rstrip("\n").encode()
+            for row in rows
+        ]
+        if not encoded:
+            return cls(np.zeros((0, 0), dtype=np.uint8))
+        if len(set(map(len, encoded))) != 1:
+            raise ValueError("Rows of a grid must all be the same width.")
+        return cls.from_bytes(b"\n".join(encoded))
+
+    @classmethod
+    def from_input(cls, data: Input) -> "ArrayGrid":
+        """Parse the rest of a puzzle input into a grid of byte values."""
+        if isinstance(data, MappedInput):
+            grid = cls.from_bytes(data.buffer, data.tell())
+            data.seek(0, 2)
+            return grid
+        return cls.from_rows(data)
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def shape(self) -> Position:
+        return self.cells.shape  # type: ignore
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value) -> None:
+        self.cells[index] = value
+
+    def __contains__(self, position: Position) -> bool:
+        y, x = position
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayGrid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    def __str__(self) -> str:
+        """Draw a grid of byte values as rows of characters."""
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def positions(self) -> Iterator[Position]:
+        """Yield every position in row order."""
+        for y in range(self.height):
+            for x in range(self.width):
+                yield y, x
+
+    def neighbors(self, y: int, x: int, diagonal: bool = False) -> Iterator[Position]:
+        """Yield the positions next to a cell that are on the grid."""
+        steps = DIRECTIONS + DIAGONALS if diagonal else DIRECTIONS
+        for dy, dx in steps:
+            if (y + dy, x + dx) in self:
+                yield y + dy, x + dx
+
+    def rectangle(self, top: int, left: int, bottom: int, right: int) -> np.ndarray:
+        """Return a writable view of the cells between two corners,
+        inclusive.
+        """
+        return self.cells[top : bottom + 1, left : right + 1]
+
+    def distances(
+        self,
+        sources: np.ndarray,
+        can_move: MoveRule,
+        targets: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return the fewest steps from any source to each cell, moving
+        north, east, south, or west.
+
+        Each step expands only the cells reached by the one before, so
+        every cell is visited once and the Python work grows with the
+        length of the path, not the size of the grid.
+
+        Args:
+          sources (np.ndarray): a boolean mask of where to start.
+          can_move (MoveRule): given arrays of the values moved from and
+            to, return which of those moves are allowed.
+          targets (Optional[np.ndarray]): a boolean mask of cells to stop
+            at as soon as any of them is reached.
+
+        Returns:
+          (np.ndarray): steps to each cell, or -1 where it wasn't reached.
+        """
+        # Work on flat indices, where a step is a fixed offset.
+        steps = np.full(self.cells.size, -1, dtype=np.int64)
+        frontier = np.flatnonzero(sources)
+        steps[frontier] = 0
+        stops = None if targets is None else targets.reshape(-1)
+        # The offset of each direction and which cells may move that way.
+        moves = [
+            (
+                dy * self.width + dx,
+                (
+                    shift(np.ones(self.shape, dtype=bool), -dy, -dx, False)
+                    & can_move(self.cells, shift(self.cells, -dy, -dx, 0))
+                ).reshape(-1),
+            )
+            for dy, dx in DIRECTIONS
+        ]
+
+        step = 0
+        while frontier.size:
+            if stops is not None and stops[frontier].any():
+                break
+            step += 1
+            reached = []
+            for offset, movable in moves:
+                there = frontier[movable[frontier]] + offset
+                # Claiming cells as they're found keeps them from being
+                # reached again from another direction.
+                there = there[steps[there] < 0]
+                steps[there] = step
+                reached.append(there)
+            frontier = np.concatenate(reached)
+        return steps.reshape(self.shape)
+
+
+def shift(array: np.ndarray, dy: int, dx: int, fill) -> np.ndarray:
+    """Return a copy of an array moved dy rows down and dx columns right,
+    with the cells left behind set to fill.
+    """
+    height, width = array.shape
+    result = np.full_like(array, fill)
+    if abs(dy) >= height or abs(dx) >= width:
+        return result
+    result[max(dy, 0) : height + min(dy, 0), max(dx, 0) : width + min(dx, 0)] = array[
+        max(-dy, 0) : height + min(-dy, 0), max(-dx, 0) : width + min(-dx, 0)
+    ]
+    return result
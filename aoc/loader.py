@@ -0,0 +1,160 @@
+"""
+Read puzzle inputs without copying them into Python objects up front.
+
+MappedInput memory-maps an input file and reads like a text file, so
+every solver can take one in place of an open file. The helpers below
+accept either: given a MappedInput they work on the mapped bytes and
+only decode what is asked for, and given any other text stream they fall
+back to reading it line by line.
+
+    with MappedInput("aoc_2022/inputs/day_01.txt") as data:
+        for block in blocks(data):
+            ...
+"""
+import mmap
+from pathlib import Path
+from typing import Iterator, List, TextIO, Union
+
+ENCODING = "utf-8"
+NEWLINE = b"\n"
+BLANK_LINE = b"\n\n"
+
+Input = Union[TextIO, "MappedInput"]
+# Raw input bytes: a view into a mapped input, or a copy of a stream's.
+Buffer = Union[bytes, memoryview]
+
+
+class MappedInput:
+    """A memory-mapped input file that reads like a text file.
+
+    Only the text that is read is decoded, so iterating over the lines of
+    a file much larger than memory holds one line at a time.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.name = str(path)
+        self._file = open(path, "rb")
+        try:
+            self.buffer: Union[mmap.mmap, bytes] = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            # Empty files can't be mapped.
+            self.buffer = b""
+        self._position = 0
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                # A view from read_bytes is still in use; the map is
+                # closed once the last one is gone.
+                pass
+        self._file.close()
+
+    def read(self, size: int = -1) -> str:
+        """Read and decode size bytes, or the rest of the file."""
+        end = len(self.buffer) if size < 0 else min(self._position + size, len(self))
+        return self._take(end)
+
+    def readline(self) -> str:
+        """Read and decode the next line, newline included."""
+        end = self.buffer.find(NEWLINE, self._position)
+        return self._take(len(self.buffer) if end == -1 else end + 1)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Move to a byte offset, like a binary file."""
+        base = (0, self._position, len(self))[whence]
+        self._position = min(max(base + offset, 0), len(self))
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def _take(self, end: int) -> str:
+        text = self.buffer[self._position : end].decode(ENCODING)
+        self._position = end
+        return text
+
+
+def lines(data: Input) -> Iterator[str]:
+    """Yield the remaining lines of an input without their newlines."""
+    for line in data:
+        yield line[:-1] if line.endswith("\n") else line
+
+
+def blocks(data: Input) -> Iterator[List[str]]:
+    """Yield the remaining groups of lines separated by blank lines.
+
+    A mapped input is split on its bytes, so only one block at a time is
+    ever decoded.
+    """
+    if not isinstance(data, MappedInput):
+        block: List[str] = []
+        for line in lines(data):
+            if line:
+                block.append(line)
+            elif block:
+                yield block
+                block = []
+        if block:
+            yield block
+        return
+
+    buffer, size = data.buffer, len(data)
+    start = data.tell()
+    while start < size:
+        end = buffer.find(BLANK_LINE, start)
+        if end == -1:
+            end = size
+        block = buffer[start:end].decode(ENCODING).splitlines()
+        if any(block):
+            yield [line for line in block if line]
+        # Skip the blank line and any more that follow it.
+        start = end + 1
+        while start < size and buffer[start : start + 1] == NEWLINE:
+            start += 1
+        data.seek(start)
+
+
+def read_bytes(data: Input) -> Buffer:
+    """Return the rest of an input as bytes, without trailing whitespace.
+
+    A mapped input gives a view into the map, so nothing is copied or
+    decoded; any other input is read and encoded.
+    """
+    if not isinstance(data, MappedInput):
+        return data.read().rstrip().encode(ENCODING)
+    start, end = data.tell(), trimmed_end(data)
+    data.seek(0, 2)
+    return memoryview(data.buffer)[start:end]
+
+
+def trimmed_end(data: MappedInput) -> int:
+    """Return the offset where a mapped input's trailing whitespace
+    starts, or where the input ends if it has none.
+    """
+    buffer, start = data.buffer, data.tell()
+    end = len(buffer)
+    while end > start and buffer[end - 1 : end].isspace():
+        end -= 1
+    return end
@@ -0,0 +1,100 @@
+"""
+Run many puzzle parts at once on a pool of worker processes.
+
+Parts are scheduled longest first, using how long each took the last
+time it ran, so the slowest part starts right away instead of holding up
+the end of the run. Measurements are yielded as soon as each part
+finishes.
+"""
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from aoc.cache import ResultCache
+from aoc.runner import ROOT, Measurement, Puzzle, measure
+
+TIMINGS_PATH = ROOT / "timings.json"
+
+Job = Tuple[Puzzle, int]
+
+
+def timing_key(puzzle: Puzzle, part: int) -> str:
+    """Return the key a part's timing is stored under, e.g. 2022-11-2."""
+    return f"{puzzle.year}-{puzzle.day:02}-{part}"
+
+
+def load_timings(path: Union[str, Path] = TIMINGS_PATH) -> Dict[str, float]:
+    """Return the stored wall time of each part, or nothing if there are
+    no timings yet.
+    """
+    try:
+        with open(path) as data:
+            return json.load(data)
+    except FileNotFoundError:
+        return {}
+
+
+def save_timings(
+    measurements: Iterable[Measurement], path: Union[str, Path] = TIMINGS_PATH
+) -> None:
+    """Record the wall times of the measured parts, keeping the others.
+
+    Answers from the cache say nothing about how long a part takes to
+    solve, so they're left out.
+    """
+    timings = load_timings(path)
+    for measurement in measurements:
+        if measurement.cached:
+            continue
+        puzzle = Puzzle(measurement.year, measurement.day)
+        timings[timing_key(puzzle, measurement.part)] = round(measurement.wall_time, 6)
+    with open(path, "w") as output:
+        json.dump(timings, output, indent=2, sort_keys=True)
+        output.write("\n")
+
+
+def schedule(jobs: Iterable[Job], timings: Dict[str, float]) -> List[Job]:
+    """Order jobs longest expected first.
+
+    Parts that have never been timed go first of all, since nothing says
+    they're quick.
+    """
+
+    def expected(job: Job) -> float:
+        return timings.get(timing_key(*job), float("inf"))
+
+    return sorted(jobs, key=expected, reverse=True)
+
+
+def run_all(
+    jobs: Iterable[Job],
+    timings: Optional[Dict[str, float]] = None,
+    workers: Optional[int] = None,
+    trace_memory: bool = True,
+    cache: Optional[ResultCache] = None,
+) -> Iterator[Measurement]:
+    """Measure every job in a process pool, yielding as they complete.
+
+    Args:
+      jobs (Iterable[Job]): the puzzle parts to run.
+      timings (Optional[Dict[str, float]]): historical wall times used to
+        start the longest parts first.
+      workers (Optional[int]): how many processes to use. Defaults to one
+        per CPU.
+      trace_memory (bool, default: True): whether to trace peak memory.
+      cache (Optional[ResultCache]): where to look up and store answers.
+
+    Returns:
+      (Iterator[Measurement]): measurements in the order they finish.
+    """
+    ordered = schedule(jobs, timings or {})
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # The executor hands out work in submission order, so the longest
+        # parts are picked up first.
+        futures = [
+            executor.submit(measure, puzzle, part, None, trace_memory, cache)
+            for puzzle, part in ordered
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,241 @@
+"""
+Profile a puzzle part without touching its day module.
+
+A profiled run collects three views of the same call:
+
+* cProfile statistics, saved as a .prof file for pstats or snakeviz.
+* Call stacks sampled every millisecond of CPU time, saved in the
+  collapsed format that flamegraph.pl, speedscope, and inferno read.
+* The lines holding the most memory when usage peaked, from tracemalloc.
+
+Sampling relies on SIGPROF, so it only happens on Unix and in the main
+thread. Elsewhere the stack file is left out.
+"""
+import cProfile
+import io
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from aoc.loader import MappedInput
+from aoc.runner import ROOT, Measurement, Puzzle
+
+PROFILE_DIR = ROOT / "profiles"
+DEFAULT_INTERVAL = 0.001
+DEFAULT_TOP = 10
+# Snapshot memory again only once usage has grown by this fraction, so a
+# steadily growing solution takes a handful of snapshots, not thousands.
+SNAPSHOT_GROWTH = 0.1
+
+
+@dataclass
+class Profile:
+    """What a profiled part spent its time and memory on.
+
+    Attributes:
+      measurement (Measurement): the answer and what it cost, inflated by
+        the profiling itself.
+      stats (pstats.Stats): the cProfile statistics.
+      stacks (Dict[str, int]): samples taken of each collapsed call stack.
+      allocations (List[tracemalloc.Statistic]): the lines holding the
+        most memory at the peak.
+    """
+
+    measurement: Measurement
+    stats: pstats.Stats
+    stacks: Dict[str, int] = field(default_factory=dict)
+    allocations: List[tracemalloc.Statistic] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        m = self.measurement
+        return f"{m.year}-{m.day:02}-{m.part}"
+
+    def write(self, directory: Union[str, Path] = PROFILE_DIR) -> List[Path]:
+        """Save the profile's files to a directory and return their paths."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        stats_path = directory / f"{self.name}.prof"
+        self.stats.dump_stats(stats_path)
+        paths = [stats_path]
+
+        if self.stacks:
+            stacks_path = directory / f"{self.name}.folded"
+            stacks_path.write_text(
+                "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+            )
+            paths.append(stacks_path)
+
+        allocations_path = directory / f"{self.name}.allocations.txt"
+        allocations_path.write_text(self.allocation_report(len(self.allocations)))
+        paths.append(allocations_path)
+        return paths
+
+    def stats_report(self, top: int = DEFAULT_TOP) -> str:
+        """Return the functions with the most cumulative time."""
+        output = io.StringIO()
+        self.stats.stream = output  # type: ignore
+        self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        return output.getvalue().strip("\n") + "\n"
+
+    def allocation_report(self, top: int = DEFAULT_TOP) -> str:
+        """Return the lines holding the most memory at the peak."""
+        return "".join(f"{statistic}\n" for statistic in self.allocations[:top])
+
+
+class StackSampler:
+    """Count the call stacks below a root function every interval of CPU
+    time, and snapshot memory as its usage climbs.
+    """
+
+    def __init__(self, root: CodeType, interval: float = DEFAULT_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_size = 0
+        self._sampling = False
+        self._previous_handler: Any = None
+
+    @staticmethod
+    def available() -> bool:
+        return (
+            hasattr(signal, "setitimer")
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def start(self) -> None:
+        if not self.available():
+            return
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        if not self.available():
+            return
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+    def stacks(self) -> Dict[str, int]:
+        """Return the samples of each stack in collapsed form, root first."""
+        labels: Dict[CodeType, str] = {}
+        collapsed: Counter = Counter()
+        for codes, count in self.samples.items():
+            names = [labels.setdefault(code, frame_label(code)) for code in codes]
+            collapsed[";".join(reversed(names))] += count
+        return dict(collapsed)
+
+    def take_snapshot(self) -> None:
+        """Snapshot memory if usage has grown enough since the last one."""
+        if not tracemalloc.is_tracing():
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self._snapshot_size * (1 + SNAPSHOT_GROWTH):
+            self.snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        # A slow sample can outlast the interval; drop the signals that
+        # arrive while it runs rather than sampling the sampler.
+        if self._sampling:
+            return
+        self._sampling = True
+        try:
+            codes = []
+            while frame is not None and frame.f_code is not self.root:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            if frame is not None:
+                self.samples[tuple(codes)] += 1
+            self.take_snapshot()
+        finally:
+            self._sampling = False
+
+
+def frame_label(code: CodeType) -> str:
+    """Name a function by where it's defined, e.g.
+    size (aoc_2022/day_07.py:140).
+    """
+    path = Path(code.co_filename)
+    try:
+        filename = path.relative_to(ROOT).as_posix()
+    except ValueError:
+        filename = path.name
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def profile(
+    puzzle: Puzzle,
+    part: int,
+    input_path: Optional[Union[str, Path]] = None,
+    interval: float = DEFAULT_INTERVAL,
+    top: int = DEFAULT_TOP,
+) -> Profile:
+    """Solve a puzzle part under cProfile, a stack sampler, and
+    tracemalloc.
+
+    Args:
+      puzzle (Puzzle): the puzzle to solve.
+      part (int): which part to solve, 1 or 2.
+      input_path (Optional[Union[str, Path]]): the puzzle input to use
+        instead of the checked-in one.
+      interval (float): seconds of CPU time between stack samples.
+      top (int): how many allocation sites to keep.
+
+    Returns:
+      (Profile): the answer and where the time and memory went.
+    """
+    solve = puzzle.solver(part)
+    path = input_path or puzzle.default_input
+    profiler = cProfile.Profile()
+    sampler = StackSampler(_call.__code__, interval)
+
+    tracemalloc.start()
+    try:
+        with MappedInput(path) as data, redirect_stdout(sys.stderr):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            sampler.start()
+            try:
+                answer = _call(profiler, solve, data)
+            finally:
+                sampler.stop()
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        # Catch memory still held at the end that no sample saw climb.
+        sampler.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocations = []
+    if sampler.snapshot:
+        allocations = sampler.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        ).statistics("lineno")[:top]
+
+    measurement = Measurement(
+        puzzle.year, puzzle.day, part, answer, wall_time, cpu_time, peak_memory
+    )
+    return Profile(measurement, pstats.Stats(profiler), sampler.stacks(), allocations)
+
+
+def _call(profiler: cProfile.Profile, solve: Callable[[Any], Any], data: Any) -> Any:
+    # Sampled stacks are cut off at this frame, leaving just the solver.
+    profiler.enable()
+    try:
+        return solve(data)
+    finally:
+        profiler.disable()
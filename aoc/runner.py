@@ -0,0 +1,216 @@
+"""
+Discover and run the daily puzzle solutions.
+
+Every day module (e.g. aoc_2022/day_11.py) exposes a part_one and a
+part_two function that take the open puzzle input and return the
+answer. The runner finds those modules without importing them, then
+runs each requested part while measuring how long it took and how much
+memory it needed. Parts are handed a memory-mapped MappedInput, which
+reads like an open file.
+"""
+import importlib
+import pkgutil
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+
+from aoc.loader import MappedInput
+
+if TYPE_CHECKING:
+    from aoc.cache import ResultCache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+YEAR_PREFIX = "aoc_"
+DAY_PREFIX = "day_"
+
+PART_TO_FUNCTION_MAP = {
+    1: "part_one",
+    2: "part_two",
+}
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    """A single day's puzzle for a given year."""
+
+    year: int
+    day: int
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day:02}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}.day_{self.day:02}"
+
+    @property
+    def default_input(self) -> Path:
+        """Return the checked-in puzzle input for the day."""
+        inputs = ROOT / f"aoc_{self.year}" / "inputs"
+        matches = sorted(inputs.glob(f"day_{self.day:02}.*"))
+        if not matches:
+            raise FileNotFoundError(f"No puzzle input found for {self}.")
+        return matches[0]
+
+    def solver(self, part: int) -> Callable[[Any], Any]:
+        """Import the day module and return the function for the part."""
+        module = importlib.import_module(self.module_name)
+        return getattr(module, PART_TO_FUNCTION_MAP[part])
+
+
+@dataclass
+class Measurement:
+    """The answer to a puzzle part and the cost of computing it.
+
+    Attributes:
+      year (int): the puzzle year.
+      day (int): the puzzle day.
+      part (int): the puzzle part, 1 or 2.
+      answer (Any): the value returned by the part's solver.
+      wall_time (float): elapsed seconds.
+      cpu_time (float): seconds of CPU time used by the process.
+      peak_memory (Optional[int]): the most bytes allocated at once, if
+        memory was traced.
+      cached (bool): whether the answer came from the result cache, in
+        which case the times are those of the lookup.
+    """
+
+    year: int
+    day: int
+    part: int
+    answer: Any
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int] = None
+    cached: bool = False
+
+    def __str__(self) -> str:
+        """Format the measurement for reading in a terminal."""
+        answer = str(self.answer)
+        separator = "\n" if "\n" in answer else " "
+
+        memory = "n/a" if self.peak_memory is None else format_bytes(self.peak_memory)
+        return (
+            f"{self.year} day {self.day:02} part {self.part}:{separator}{answer}\n"
+            f"  wall {self.wall_time:.4f}s, cpu {self.cpu_time:.4f}s, "
+            f"peak memory {memory}{' (cached)' if self.cached else ''}"
+        )
+
+
+def format_bytes(size: float) -> str:
+    """Return a byte count in human-readable units."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def numbered(name: str, prefix: str, digits: int) -> Optional[int]:
+    """Return the number in a name like day_07, or None if it isn't one.
+
+    Plain string checks keep the regular expression engine out of every
+    process that runs a puzzle.
+    """
+    number = name[len(prefix) :]
+    if not name.startswith(prefix) or len(number) != digits or not number.isdigit():
+        return None
+    return int(number)
+
+
+def discover(year: Optional[int] = None, day: Optional[int] = None) -> List[Puzzle]:
+    """Find the day modules of every year package, in order.
+
+    Args:
+      year (Optional[int]): only find puzzles for this year.
+      day (Optional[int]): only find puzzles for this day.
+
+    Returns:
+      (List[Puzzle]): the matching puzzles.
+    """
+    puzzles = []
+    for year_package in pkgutil.iter_modules([str(ROOT)]):
+        found_year = numbered(year_package.name, YEAR_PREFIX, 4)
+        if not year_package.ispkg or found_year is None:
+            continue
+        if year is not None and found_year != year:
+            continue
+
+        for day_module in pkgutil.iter_modules([str(ROOT / year_package.name)]):
+            found_day = numbered(day_module.name, DAY_PREFIX, 2)
+            if found_day is None:
+                continue
+            if day is not None and found_day != day:
+                continue
+            puzzles.append(Puzzle(found_year, found_day))
+
+    return sorted(puzzles, key=lambda p: (p.year, p.day))
+
+
+def measure(
+    puzzle: Puzzle,
+    part: int,
+    input_path: Optional[Union[str, Path]] = None,
+    trace_memory: bool = True,
+    cache: Optional["ResultCache"] = None,
+) -> Measurement:
+    """Run a puzzle part and measure it.
+
+    Anything the solver prints goes to stderr, so stdout holds only what
+    the caller reports.
+
+    Args:
+      puzzle (Puzzle): the puzzle to solve.
+      part (int): which part to solve, 1 or 2.
+      input_path (Optional[Union[str, Path]]): the puzzle input to use
+        instead of the checked-in one.
+      trace_memory (bool, default: True): whether to trace peak memory.
+        Tracing slows down allocation-heavy solutions, so turn it off
+        for the most faithful timings.
+      cache (Optional[ResultCache]): where to look up the answer before
+        solving, and to store it after.
+
+    Returns:
+      (Measurement): the answer and what it cost.
+    """
+    path = input_path or puzzle.default_input
+    if cache:
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        key = cache.key(puzzle, part, path)
+        answer = cache.get(key)
+        if answer is not None:
+            return Measurement(
+                puzzle.year,
+                puzzle.day,
+                part,
+                answer,
+                time.perf_counter() - wall_start,
+                time.process_time() - cpu_start,
+                cached=True,
+            )
+
+    solve = puzzle.solver(part)
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        with MappedInput(path) as data, redirect_stdout(sys.stderr):
+            answer = solve(data)
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    if cache:
+        cache.put(key, answer)
+    return Measurement(
+        puzzle.year, puzzle.day, part, answer, wall_time, cpu_time, peak_memory
+    )
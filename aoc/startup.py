@@ -0,0 +1,154 @@
+"""
+Measure how long a fresh process takes to get ready to solve a puzzle.
+
+Short-lived processes, like the workers behind `aoc run --all`, can
+spend more time starting the interpreter and importing modules than
+solving anything. Each measurement starts a new interpreter, imports the
+command line interface and one day module the way `aoc run` does, and
+reads the import times that -X importtime reports.
+"""
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from aoc.runner import ROOT, Puzzle
+
+DEFAULT_REPEAT = 5
+DEFAULT_TOP = 5
+# The most seconds a fresh process may take to be ready to solve a day.
+DEFAULT_BUDGET = 0.3
+IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclass
+class Import:
+    """One module imported while starting up, timed in seconds.
+
+    Attributes:
+      name (str): the module's name.
+      self_time (float): time spent running the module itself.
+      cumulative_time (float): time including the modules it imported.
+      depth (int): how deeply nested the import was, 0 for top level.
+    """
+
+    name: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.name.split(".")[0]
+
+
+@dataclass
+class Startup:
+    """The fastest cold start of a process readied to solve a puzzle.
+
+    Attributes:
+      puzzle (Puzzle): the puzzle whose day module was imported.
+      wall_time (float): seconds from starting the process to its exit.
+      imports (List[Import]): every module imported, in finishing order.
+    """
+
+    puzzle: Puzzle
+    wall_time: float
+    imports: List[Import] = field(default_factory=list)
+
+    @property
+    def import_time(self) -> float:
+        """Return the seconds spent importing anything at all."""
+        return sum(i.cumulative_time for i in self.imports if i.depth == 0)
+
+    @property
+    def day_import_time(self) -> float:
+        """Return the seconds spent importing the day module and the
+        modules only it needed.
+        """
+        for module in self.imports:
+            if module.name == self.puzzle.module_name:
+                return module.cumulative_time
+        return 0.0
+
+    def heaviest(self, top: int = DEFAULT_TOP) -> List[Tuple[str, float]]:
+        """Return the top-level packages that took longest to import."""
+        packages: Dict[str, float] = {}
+        for module in self.imports:
+            packages[module.package] = (
+                packages.get(module.package, 0) + module.self_time
+            )
+        return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def __str__(self) -> str:
+        heaviest = ", ".join(
+            f"{package} {seconds * 1000:.1f} ms" for package, seconds in self.heaviest()
+        )
+        return (
+            f"{self.puzzle}: ready in {self.wall_time * 1000:.1f} ms, "
+            f"imports {self.import_time * 1000:.1f} ms "
+            f"(day module {self.day_import_time * 1000:.1f} ms)\n"
+            f"  heaviest: {heaviest}"
+        )
+
+
+def command(puzzle: Puzzle, import_time: bool = False) -> List[str]:
+    """Return the command that starts a process ready to solve a puzzle."""
+    # An import statement, unlike importlib, shows up in -X importtime.
+    script = f"import aoc.cli, {puzzle.module_name}"
+    options = ["-X", "importtime"] if import_time else []
+    return [sys.executable, *options, "-c", script]
+
+
+def cold_start(puzzle: Puzzle) -> None:
+    """Start a process ready to solve a puzzle and wait for it to exit."""
+    subprocess.run(command(puzzle), cwd=ROOT, check=True)
+
+
+def measure(puzzle: Puzzle, repeat: int = DEFAULT_REPEAT) -> Startup:
+    """Start a fresh process for a puzzle several times and keep the
+    fastest, which is the least disturbed by the rest of the machine.
+    """
+    fastest = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run(
+            command(puzzle, import_time=True),
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        wall_time = time.perf_counter() - start
+        if fastest is None or wall_time < fastest.wall_time:
+            fastest = Startup(puzzle, wall_time, parse_import_times(process.stderr))
+    if fastest is None:
+        raise ValueError("Startup needs at least one repeat.")
+    return fastest
+
+
+def parse_import_times(report: str) -> List[Import]:
+    """Parse the lines -X importtime writes, e.g.
+
+    import time:       139 |      13588 |   pathlib
+    """
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        self_time, cumulative_time, name = line[len(IMPORTTIME_PREFIX) :].split("|")
+        if not self_time.strip().isdigit():
+            # The header line.
+            continue
+        # Names are indented two spaces per level after one separating space.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(
+            Import(
+                name.strip(),
+                int(self_time) / 1e6,
+                int(cumulative_time) / 1e6,
+                depth,
+            )
+        )
+    return imports
@@ -0,0 +1,21 @@
+"""
+Choose how many processes a solver's own pool should use.
+
+Solvers that split their work across processes default to one per CPU.
+Under run --all every part already runs in a worker of a process pool
+that keeps each CPU busy, so a pool started inside one of those workers
+would only oversubscribe the machine. This module is kept free of other
+imports so day modules can use it without slowing down their startup.
+"""
+import multiprocessing
+import os
+
+
+def default_workers() -> int:
+    """Return one worker per CPU, or just one when already running in a
+    worker process, such as those of run --all, which keep every CPU busy
+    on their own.
+    """
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return os.cpu_count() or 1
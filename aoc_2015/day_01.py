@@ -24,8 +24,25 @@ position 2, and so on.
 What is the position of the character that causes Santa to first enter
 the basement?
 """
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Iterator, List, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeGuard,
+    Union,
+)
+
+import numpy as np
+
+from aoc.loader import Buffer, Input, MappedInput, read_bytes, trimmed_end
+from aoc.workers import default_workers
 
 
 def ascend(floor: int) -> int:
@@ -42,6 +59,17 @@ CHAR_TO_COMMAND_MAP = {
     "(": ascend,
     ")": descend,
 }
+UP, DOWN = ord("("), ord(")")
+
+Commands = Union[str, Buffer]
+# Bytes of packed history unpacked at a time while reading it back.
+HISTORY_CHUNK_SIZE = 1 << 16
+# Commands each worker of a ParallelElevator scans at a time.
+PARALLEL_CHUNK_SIZE = 1 << 24
+# Inputs at least this big are worth starting a pool of processes for.
+PARALLEL_THRESHOLD = 1 << 28
+# Floors summed up per block of a FloorIndex's range tables.
+INDEX_BLOCK_SIZE = 64
 
 
 @dataclass
@@ -78,20 +106,129 @@ class ElevatorHistory:
         self._events.append(ElevatorEvent(command=command, floor=floor))
 
 
+class CompactElevatorHistory:
+    """An elevator's command history packed into one bit per command.
+
+    The floors aren't stored at all: each one follows from the floor
+    before the first command and the commands since, so they're worked
+    out again as the history is read. A run of 10^8 commands takes about
+    12 MB, where an event per command takes gigabytes.
+    """
+
+    def __init__(self) -> None:
+        self._bits = bytearray()
+        self._length = 0
+        self._start = 0
+        self._floor = 0
+
+    def __iter__(self) -> Iterator[ElevatorEvent]:
+        floor = self._start
+        for start in range(0, len(self._bits), HISTORY_CHUNK_SIZE):
+            chunk = np.frombuffer(self._bits, dtype=np.uint8)[
+                start : start + HISTORY_CHUNK_SIZE
+            ]
+            ups = np.unpackbits(
+                chunk, count=min(len(chunk) * 8, self._length - start * 8)
+            )
+            floors = np.cumsum(ups.astype(np.int64) * 2 - 1) + floor
+            for up, after in zip(ups.tolist(), floors.tolist()):
+                yield ElevatorEvent(command="(" if up else ")", floor=after)
+            if len(floors):
+                floor = int(floors[-1])
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def floors(self) -> np.ndarray:
+        """Return the floor after each command."""
+        ups = np.unpackbits(
+            np.frombuffer(self._bits, dtype=np.uint8), count=self._length
+        )
+        return np.cumsum(ups.astype(np.int64) * 2 - 1) + self._start
+
+    def track(self, command: str, floor: int) -> None:
+        """Record a command and the floor it led to.
+
+        Args:
+          command (str): the command last used.
+          floor (int): the floor the elevator was on after executing
+            the command.
+
+        Raises:
+          ValueError: if the command isn't one, or the floor doesn't
+            follow from the command and the floor before it.
+        """
+        if command not in CHAR_TO_COMMAND_MAP:
+            raise ValueError(f"Unknown command {command!r}.")
+        step = 1 if command == "(" else -1
+        if not self._length:
+            self._start = self._floor = floor - step
+        if floor != self._floor + step:
+            raise ValueError(
+                f"Floor {floor} doesn't follow {command!r} from floor {self._floor}."
+            )
+        if not self._length % 8:
+            self._bits.append(0)
+        if step > 0:
+            self._bits[-1] |= 0x80 >> (self._length % 8)
+        self._length += 1
+        self._floor = floor
+
+    def extend(self, commands: "Commands", floor: int) -> None:
+        """Record a string of commands followed from a floor all at once."""
+        commands = commands.encode() if isinstance(commands, str) else commands
+        # Track commands one at a time until the rest start on a byte.
+        head = -self._length % 8
+        for command in bytes(commands[:head]).decode():
+            floor += 1 if command == "(" else -1
+            self.track(command, floor)
+        rest = codes(commands[head:])
+        if not len(rest):
+            return
+        if not self._length:
+            self._start = self._floor = floor
+        elif floor != self._floor:
+            raise ValueError(f"Floor {floor} doesn't follow from floor {self._floor}.")
+        ups = rest == UP
+        self._bits.extend(np.packbits(ups).tobytes())
+        self._length += len(rest)
+        up_count = int(np.count_nonzero(ups))
+        self._floor += up_count - (len(rest) - up_count)
+
+
+History = Union[ElevatorHistory, CompactElevatorHistory]
+
+
 class Elevator:
     """An elevator for navigating a large apartment building.
 
+    On its own it follows commands one at a time and tracks each move in
+    its history. Given an engine, it hands whole strings of commands to
+    that instead, and asks it which command first reached a floor.
+
     Attributes:
       floor (int): the current floor the elevator's on.
-      history (ElevatorHistory): record of the elevator's movements.
+      history (History): record of the elevator's movements. It stays
+        empty while an engine follows the commands.
+      engine (Optional[Engine]): the VectorElevator or ParallelElevator
+        that follows commands in bulk, if any.
     """
 
     def __init__(
-        self, floor: int = 0, history: Optional[ElevatorHistory] = None
+        self,
+        floor: int = 0,
+        history: Optional[History] = None,
+        engine: Optional["Engine"] = None,
     ) -> None:
-        """Initialize an elevator at the given floor."""
+        """Initialize an elevator at the given floor, moving its engine,
+        if any, there too.
+        """
         self.floor = floor
-        self.history = history or ElevatorHistory()
+        self.history: History = ElevatorHistory() if history is None else history
+        self.engine = engine
+        if engine is not None:
+            engine.floor = floor
 
     def execute(self, commands: str) -> int:
         """Follow a string of commands to a destination.
@@ -102,25 +239,469 @@ class Elevator:
         Returns:
           (int): the final destination floor.
         """
+        if self.engine is not None:
+            self.floor = self.engine.execute(commands)
+            return self.floor
+
         for command in commands:
             self._execute(command)
 
         return self.floor
 
+    def first_position(self, floor: int) -> Optional[int]:
+        """Return the position of the command that first reached a floor,
+        counting from 1, or None if none did.
+        """
+        if self.engine is not None:
+            return self.engine.first_position(floor)
+
+        for position, event in enumerate(self.history, start=1):
+            if event.floor == floor:
+                return position
+        return None
+
     def _execute(self, command: str) -> None:
         """Change floors per command and track the movement."""
         self.floor = CHAR_TO_COMMAND_MAP[command](self.floor)
         self.history.track(command, self.floor)
 
 
+class VectorElevator:
+    """An elevator that follows a whole string of commands at once.
+
+    It gives the same answers as Elevator, which stays the reference,
+    but keeps one array of floors instead of an event per command.
+
+    Attributes:
+      floor (int): the current floor the elevator's on.
+      floors (np.ndarray): the floor after each command followed.
+    """
+
+    def __init__(self, floor: int = 0) -> None:
+        self.floor = floor
+        self.floors = np.zeros(0, dtype=np.int32)
+
+    def execute(self, commands: Commands) -> int:
+        """Follow a string of commands to a destination.
+
+        Args:
+          commands (Commands): the command characters or bytes to follow.
+
+        Returns:
+          (int): the final destination floor.
+        """
+        new_floors = floors(commands, self.floor)
+        if not len(new_floors):
+            return self.floor
+        self.floors = (
+            np.concatenate((self.floors, new_floors))
+            if len(self.floors)
+            else new_floors
+        )
+        self.floor = int(new_floors[-1])
+        return self.floor
+
+    def first_position(self, floor: int) -> Optional[int]:
+        """Return the position of the command that first reached a floor,
+        counting from 1, or None if none did.
+        """
+        reached = self.floors == floor
+        if not reached.any():
+            return None
+        return int(np.argmax(reached)) + 1
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A stretch of commands, held in memory or read from a file.
+
+    Attributes:
+      source (Union[Buffer, str]): the commands, or the path of a file
+        of them.
+      start (int): the offset of the first command in the source.
+      end (int): the offset just past the last command.
+    """
+
+    source: Union[Buffer, str]
+    start: int
+    end: int
+
+    def read(self) -> Buffer:
+        if not isinstance(self.source, str):
+            return self.source[self.start : self.end]
+        with open(self.source, "rb") as data:
+            data.seek(self.start)
+            return data.read(self.end - self.start)
+
+    def detached(self) -> "Chunk":
+        """Return the chunk without the rest of its source, so it's cheap
+        to send to another process.
+        """
+        if not isinstance(self.source, str):
+            return Chunk(bytes(self.read()), 0, self.end - self.start)
+        return self
+
+
+@dataclass(frozen=True)
+class ChunkScan:
+    """What following a chunk of commands does, relative to the floor it
+    starts on.
+
+    Attributes:
+      delta (int): the floors moved from start to end.
+      lowest (int): the lowest floor reached.
+      lowest_position (int): the offset into the chunk of the command
+        that first reached the lowest floor.
+      highest (int): the highest floor reached.
+    """
+
+    delta: int
+    lowest: int
+    lowest_position: int
+    highest: int
+
+
+def scan(chunk: Chunk) -> ChunkScan:
+    """Follow a chunk of commands from floor 0 and sum up where it went."""
+    relative = floors(chunk.read())
+    if not len(relative):
+        return ChunkScan(0, 0, 0, 0)
+    lowest_position = int(np.argmin(relative))
+    return ChunkScan(
+        delta=int(relative[-1]),
+        lowest=int(relative[lowest_position]),
+        lowest_position=lowest_position,
+        highest=int(relative.max()),
+    )
+
+
+class ParallelElevator:
+    """An elevator that splits its commands into chunks and scans them on
+    a pool of processes.
+
+    Each worker sums up its chunk as a ChunkScan. Chaining the chunks'
+    deltas gives the floor each one starts on, which is all it takes to
+    find the destination and the chunk that first reaches any floor.
+    Only that one chunk is followed again, to find the exact command.
+
+    Attributes:
+      floor (int): the current floor the elevator's on.
+      workers (int): how many processes to use. Defaults to
+        default_workers().
+      chunk_size (int): the most commands a worker scans at a time.
+      chunks (List[Tuple[Chunk, ChunkScan, int]]): each chunk followed,
+        what it did, and the floor it started on.
+    """
+
+    def __init__(
+        self,
+        floor: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: int = PARALLEL_CHUNK_SIZE,
+    ) -> None:
+        self.floor = floor
+        self.workers = workers or default_workers()
+        self.chunk_size = chunk_size
+        self.chunks: List[Tuple[Chunk, ChunkScan, int]] = []
+
+    def execute(self, commands: Commands) -> int:
+        """Follow a string of commands to a destination.
+
+        Args:
+          commands (Commands): the command characters or bytes to follow.
+
+        Returns:
+          (int): the final destination floor.
+        """
+        commands = commands.encode() if isinstance(commands, str) else commands
+        return self._follow(commands, 0, len(commands))
+
+    def execute_file(
+        self, path: Union[str, Path], start: int = 0, end: Optional[int] = None
+    ) -> int:
+        """Follow the commands in a file, which each worker reads for
+        itself, to a destination.
+
+        Args:
+          path (Union[str, Path]): the file of commands.
+          start (int): the offset of the first command to follow.
+          end (Optional[int]): the offset just past the last command to
+            follow. Defaults to the end of the file.
+
+        Returns:
+          (int): the final destination floor.
+        """
+        end = os.path.getsize(path) if end is None else end
+        return self._follow(str(path), start, end)
+
+    def first_position(self, floor: int) -> Optional[int]:
+        """Return the position of the command that first reached a floor,
+        counting from 1, or None if none did.
+        """
+        position = 0
+        for chunk, found, start_floor in self.chunks:
+            # Floors change one at a time, so a chunk visits every floor
+            # between its lowest and highest.
+            if start_floor + found.lowest <= floor <= start_floor + found.highest:
+                reached = floors(chunk.read(), start_floor) == floor
+                return position + int(np.argmax(reached)) + 1
+            position += chunk.end - chunk.start
+        return None
+
+    def _follow(self, source: Union[Buffer, str], start: int, end: int) -> int:
+        chunks = [
+            Chunk(source, offset, min(offset + self.chunk_size, end))
+            for offset in range(start, end, self.chunk_size)
+        ]
+        if len(chunks) > 1 and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                scans = list(executor.map(scan, (c.detached() for c in chunks)))
+        else:
+            scans = [scan(chunk) for chunk in chunks]
+
+        for chunk, found in zip(chunks, scans):
+            self.chunks.append((chunk, found, self.floor))
+            self.floor += found.delta
+        return self.floor
+
+
+Engine = Union[VectorElevator, ParallelElevator]
+
+
+class FloorIndex:
+    """An index over the floors of a run, built once to answer questions
+    about it without following the commands again.
+
+    Positions count commands from 1, like the puzzle, and a floor counts
+    as visited each time a command stops there.
+
+    * The floor after any command, the first time a floor was reached,
+      and how often it was visited are O(1), from the floors themselves
+      and the positions grouped by floor.
+    * The lowest and highest floor between two positions are O(1) from
+      a sparse table over blocks of INDEX_BLOCK_SIZE floors, plus a scan
+      of the partial blocks at either end. Tabling blocks rather than
+      every floor keeps the index to a fraction of the run's size.
+
+    Attributes:
+      floors (np.ndarray): the floor after each command.
+    """
+
+    def __init__(self, floors: np.ndarray) -> None:
+        self.floors = floors
+        if not len(floors):
+            self._lowest = 0
+            self._starts = np.zeros(1, dtype=np.int64)
+            self._order = np.zeros(0, dtype=np.int64)
+            self._block_lows: List[np.ndarray] = []
+            self._block_highs: List[np.ndarray] = []
+            return
+
+        # Floors change one at a time, so the floors visited make up one
+        # unbroken range and can be numbered from the lowest.
+        self._lowest = int(floors.min())
+        offsets = floors - self._lowest
+        visits = np.bincount(offsets)
+        self._starts = np.concatenate(([0], np.cumsum(visits)))
+        self._order = np.argsort(offsets, kind="stable")
+
+        # Pad with the last floor to fill the final block.
+        padding = -len(floors) % INDEX_BLOCK_SIZE
+        blocks = np.concatenate(
+            (floors, np.full(padding, floors[-1], dtype=floors.dtype))
+        ).reshape(-1, INDEX_BLOCK_SIZE)
+        self._block_lows = sparse_table(blocks.min(axis=1), np.minimum)
+        self._block_highs = sparse_table(blocks.max(axis=1), np.maximum)
+
+    @classmethod
+    def from_commands(cls, commands: Commands, start: int = 0) -> "FloorIndex":
+        return cls(floors(commands, start))
+
+    @classmethod
+    def from_history(cls, history: History) -> "FloorIndex":
+        if isinstance(history, CompactElevatorHistory):
+            return cls(history.floors)
+        return cls(np.fromiter((floor for _, floor in history), dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.floors)
+
+    def floor_at(self, position: int) -> int:
+        """Return the floor after the command at a position."""
+        return int(self.floors[self._index(position)])
+
+    def first_position(self, floor: int) -> Optional[int]:
+        """Return the position of the command that first reached a floor,
+        or None if none did.
+        """
+        if not self.visits(floor):
+            return None
+        return int(self._order[self._starts[floor - self._lowest]]) + 1
+
+    def visits(self, floor: int) -> int:
+        """Return how many commands stopped on a floor."""
+        offset = floor - self._lowest
+        if not 0 <= offset < len(self._starts) - 1:
+            return 0
+        return int(self._starts[offset + 1] - self._starts[offset])
+
+    def positions(self, floor: int) -> np.ndarray:
+        """Return the positions of every command that stopped on a floor,
+        in order.
+        """
+        if not self.visits(floor):
+            return np.zeros(0, dtype=np.int64)
+        offset = floor - self._lowest
+        return self._order[self._starts[offset] : self._starts[offset + 1]] + 1
+
+    def lowest(self, start: int = 1, end: Optional[int] = None) -> int:
+        """Return the lowest floor between two positions, inclusive."""
+        return self._extreme(start, end, self._block_lows, np.min)
+
+    def highest(self, start: int = 1, end: Optional[int] = None) -> int:
+        """Return the highest floor between two positions, inclusive."""
+        return self._extreme(start, end, self._block_highs, np.max)
+
+    def _index(self, position: int) -> int:
+        if not 1 <= position <= len(self):
+            raise IndexError(f"No command at position {position}.")
+        return position - 1
+
+    def _extreme(
+        self,
+        start: int,
+        end: Optional[int],
+        table: List[np.ndarray],
+        reduce: Callable[[np.ndarray], Any],
+    ) -> int:
+        first = self._index(start)
+        last = self._index(len(self) if end is None else end)
+        if first > last:
+            raise ValueError(f"Positions {start} to {end} are out of order.")
+
+        first_block, last_block = first // INDEX_BLOCK_SIZE, last // INDEX_BLOCK_SIZE
+        if first_block == last_block:
+            return int(reduce(self.floors[first : last + 1]))
+
+        # The partial blocks at either end, then the whole ones between.
+        candidates = [
+            reduce(self.floors[first : (first_block + 1) * INDEX_BLOCK_SIZE]),
+            reduce(self.floors[last_block * INDEX_BLOCK_SIZE : last + 1]),
+        ]
+        if last_block - first_block > 1:
+            candidates.append(
+                range_query(table, first_block + 1, last_block - 1, reduce)
+            )
+        return int(reduce(np.array(candidates)))
+
+
+def sparse_table(
+    values: np.ndarray, combine: Callable[[np.ndarray, np.ndarray], np.ndarray]
+) -> List[np.ndarray]:
+    """Return levels where level k combines each run of 2^k values."""
+    levels = [values]
+    width = 1
+    while width * 2 <= len(values):
+        previous = levels[-1]
+        levels.append(combine(previous[:-width], previous[width:]))
+        width *= 2
+    return levels
+
+
+def range_query(
+    levels: List[np.ndarray],
+    first: int,
+    last: int,
+    reduce: Callable[[np.ndarray], Any],
+) -> Any:
+    """Combine the values between two indexes, inclusive, from two
+    overlapping runs of a sparse table.
+    """
+    level = (last - first + 1).bit_length() - 1
+    width = 1 << level
+    return reduce(np.array((levels[level][first], levels[level][last - width + 1])))
+
+
+def codes(commands: Commands) -> np.ndarray:
+    """Return the command bytes as an array, checking they're all commands.
+
+    Raises:
+      ValueError: if a character isn't a command.
+    """
+    codes = np.frombuffer(
+        commands.encode() if isinstance(commands, str) else commands, dtype=np.uint8
+    )
+    if np.count_nonzero(codes == UP) + np.count_nonzero(codes == DOWN) != len(codes):
+        position = int(np.flatnonzero((codes != UP) & (codes != DOWN))[0])
+        raise ValueError(
+            f"Unknown command {chr(codes[position])!r} at position {position + 1}."
+        )
+    return codes
+
+
+def steps(commands: Commands) -> np.ndarray:
+    """Return each command as a step of 1 or -1."""
+    return (codes(commands) == UP).view(np.int8) * np.int8(2) - np.int8(1)
+
+
+def floors(commands: Commands, start: int = 0) -> np.ndarray:
+    """Return the floor after each command, starting from a floor."""
+    moves = steps(commands)
+    # A floor can't get further from the start than there are commands.
+    wide = len(moves) + abs(start) >= np.iinfo(np.int32).max
+    result: np.ndarray = np.cumsum(moves, dtype=np.int64 if wide else np.int32)
+    if start:
+        result += start
+    return result
+
+
+def final_floor(commands: Commands, start: int = 0) -> int:
+    """Return the floor a string of commands leads to, by counting each
+    kind of command rather than following them.
+    """
+    checked = codes(commands)
+    up = int(np.count_nonzero(checked == UP))
+    return start + up - (len(checked) - up)
+
+
+def worth_parallel(data: Input) -> TypeGuard[MappedInput]:
+    """Return whether an input is a file big enough to be split among a
+    pool of processes.
+    """
+    return (
+        isinstance(data, MappedInput) and len(data) - data.tell() >= PARALLEL_THRESHOLD
+    )
+
+
+def follow(data: Input) -> Engine:
+    """Return an elevator that has followed the input's commands, using a
+    pool of processes for inputs big enough to be worth it.
+    """
+    if worth_parallel(data):
+        elevator = ParallelElevator()
+        elevator.execute_file(data.name, data.tell(), trimmed_end(data))
+        return elevator
+    vector_elevator = VectorElevator()
+    vector_elevator.execute(read_bytes(data))
+    return vector_elevator
+
+
+def part_one(data: Input) -> int:
+    """Return the floor the instructions lead to."""
+    if worth_parallel(data):
+        return follow(data).floor
+    return final_floor(read_bytes(data))
+
+
+def part_two(data: Input) -> Optional[int]:
+    """Return the position of the command that first enters the
+    basement.
+    """
+    return follow(data).first_position(-1)
+
+
 if __name__ == "__main__":
-    with open("aoc_2015/inputs/day_01_part_1.txt") as data:
-        # Remove the trailing newline.
-        commands = data.read()[:-1]
-
-    elevator = Elevator()
-    print(f"Part 1: {elevator.execute(commands)}")
-    for position, event in enumerate(elevator.history, start=1):
-        if event.floor == -1:
-            print(position)
-            break
+    with open("aoc_2015/inputs/day_01.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
@@ -31,8 +31,19 @@ present. Don't ask how they tie the bow, though; they'll never tell.
 
 How many total feet of ribbon should they order?
 """
-from dataclasses import dataclass
-from typing import Iterator, List
+import io
+import json
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from aoc.loader import ENCODING, Buffer, Input, MappedInput, read_bytes
+
+# How many dimension lines a streaming calculator parses at once.
+STREAM_BATCH_SIZE = 1 << 16
 
 
 @dataclass
@@ -68,22 +79,116 @@ class Present:
         return iter((self.length, self.width, self.height))
 
 
+@dataclass
+class PresentBatch:
+    """Many presents stored as one array per dimension.
+
+    A Present object per line costs a few hundred bytes and a Python loop
+    per sum; keeping the dimensions in columns lets every present be
+    measured at once.
+
+    Attributes:
+      lengths (np.ndarray): the length of each present.
+      widths (np.ndarray): the width of each present.
+      heights (np.ndarray): the height of each present.
+    """
+
+    lengths: np.ndarray
+    widths: np.ndarray
+    heights: np.ndarray
+
+    @classmethod
+    def from_presents(cls, presents: Iterable[Present]) -> "PresentBatch":
+        """Gather the dimensions of present objects into columns."""
+        dimensions = np.array([tuple(present) for present in presents], dtype=np.int64)
+        return cls.from_dimensions(dimensions.reshape(-1, 3))
+
+    @classmethod
+    def from_dimensions(cls, dimensions: np.ndarray) -> "PresentBatch":
+        """Split an array with a row of length, width, and height per
+        present into columns.
+        """
+        return cls(*np.ascontiguousarray(dimensions.T))
+
+    @classmethod
+    def from_text(cls, text: Union[str, Buffer]) -> "PresentBatch":
+        """Parse "LxWxH" dimension lines in bulk, without a Python object
+        per present.
+        """
+        if not isinstance(text, str):
+            text = str(text, ENCODING)
+        text = text.strip()
+        if not text:
+            return cls.from_dimensions(np.zeros((0, 3), dtype=np.int64))
+        try:
+            dimensions = np.loadtxt(
+                io.StringIO(text),
+                dtype=np.int64,
+                comments=None,
+                delimiter="x",
+                ndmin=2,
+            )
+        except ValueError as error:
+            raise ValueError("Every present needs dimensions like 2x3x4.") from error
+        # loadtxt skips blank lines, which count as malformed here.
+        if dimensions.shape != (text.count("\n") + 1, 3):
+            raise ValueError("Every present needs dimensions like 2x3x4.")
+        return cls.from_dimensions(dimensions)
+
+    @classmethod
+    def from_lines(cls, dimensions_list: Iterable[str]) -> "PresentBatch":
+        """Parse "LxWxH" dimension lines, with or without newlines, in
+        bulk.
+        """
+        return cls.from_text("\n".join(line.rstrip("\n") for line in dimensions_list))
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __iter__(self) -> Iterator[Present]:
+        """Yield each present as an object."""
+        for dimensions in zip(self.lengths, self.widths, self.heights):
+            yield Present(*map(int, dimensions))
+
+    def wrapping_paper(self) -> np.ndarray:
+        """Return the square feet of wrapping paper for each present."""
+        length_wise_area = self.lengths * self.widths
+        width_wise_area = self.widths * self.heights
+        height_wise_area = self.heights * self.lengths
+        smallest_area = np.minimum(
+            np.minimum(length_wise_area, width_wise_area), height_wise_area
+        )
+        return (
+            2 * (length_wise_area + width_wise_area + height_wise_area) + smallest_area
+        )
+
+    def ribbon(self) -> np.ndarray:
+        """Return the feet of ribbon for each present."""
+        longest = np.maximum(np.maximum(self.lengths, self.widths), self.heights)
+        shortest_perimeter = 2 * (self.lengths + self.widths + self.heights - longest)
+        return shortest_perimeter + self.lengths * self.widths * self.heights
+
+
 @dataclass
 class Calculator:
     """Calculator to measure total square feet of wrapping paper for
     a list of presents.
     """
 
-    presents: List[Present]
+    presents: Union[List[Present], PresentBatch]
 
     def calculate_wrapping_paper(self) -> int:
         """Return total needed square feet of wrapping paper for the
         presents.
         """
+        if isinstance(self.presents, PresentBatch):
+            return int(self.presents.wrapping_paper().sum())
         return sum(self._calculate_square_feet(present) for present in self.presents)
 
     def calculate_ribbon(self) -> int:
         """Return total needed length of ribbon for the presents."""
+        if isinstance(self.presents, PresentBatch):
+            return int(self.presents.ribbon().sum())
         return sum(self._calculate_ribbon_length(present) for present in self.presents)
 
     def _calculate_square_feet(self, present: Present) -> int:
@@ -101,13 +206,154 @@ class Calculator:
         )
 
 
+@dataclass
+class Tally:
+    """Running statistics of what each present costs in one material.
+
+    Attributes:
+      count (int): how many presents have been counted.
+      total (int): what they cost altogether.
+      smallest (Optional[int]): the cheapest present, if any.
+      largest (Optional[int]): the most expensive present, if any.
+      histogram (List[int]): presents by the bit length of their cost,
+        so bin i counts costs from 2 ** (i - 1) up to 2 ** i - 1.
+    """
+
+    count: int = 0
+    total: int = 0
+    smallest: Optional[int] = None
+    largest: Optional[int] = None
+    histogram: List[int] = field(default_factory=list)
+
+    def add(self, costs: np.ndarray) -> None:
+        """Count the costs of a batch of presents."""
+        if not len(costs):
+            return
+        self.count += len(costs)
+        self.total += int(costs.sum())
+        smallest, largest = int(costs.min()), int(costs.max())
+        self.smallest = (
+            smallest if self.smallest is None else min(self.smallest, smallest)
+        )
+        self.largest = largest if self.largest is None else max(self.largest, largest)
+        # frexp's exponent is the bit length for every cost below 2 ** 53.
+        bins = np.bincount(np.frexp(costs.astype(np.float64))[1])
+        if len(bins) > len(self.histogram):
+            self.histogram.extend([0] * (len(bins) - len(self.histogram)))
+        for bit_length, presents in enumerate(bins.tolist()):
+            self.histogram[bit_length] += presents
+
+
+@dataclass
+class StreamingCalculator:
+    """Calculator that reads presents a batch of lines at a time, keeping
+    only running totals, so an order of any length fits in memory.
+
+    Its state can be saved as a checkpoint and resumed later, skipping
+    the lines it had already read.
+
+    Attributes:
+      paper (Tally): square feet of wrapping paper per present.
+      ribbon (Tally): feet of ribbon per present.
+      lines_read (int): how many dimension lines have been consumed.
+    """
+
+    paper: Tally = field(default_factory=Tally)
+    ribbon: Tally = field(default_factory=Tally)
+    lines_read: int = 0
+
+    def add(self, presents: PresentBatch) -> None:
+        """Count a batch of presents."""
+        self.paper.add(presents.wrapping_paper())
+        self.ribbon.add(presents.ribbon())
+
+    def consume(
+        self, dimensions_list: Iterable[str], batch_size: int = STREAM_BATCH_SIZE
+    ) -> "StreamingCalculator":
+        """Count every present in an iterator of "LxWxH" lines.
+
+        Args:
+          dimensions_list (Iterable[str]): the lines to read, which may be
+            consumed only once.
+          batch_size (int): how many lines to parse at a time.
+
+        Returns:
+          (StreamingCalculator): itself, for chaining.
+        """
+        dimensions = iter(dimensions_list)
+        while batch := list(islice(dimensions, batch_size)):
+            self.add(PresentBatch.from_lines(batch))
+            self.lines_read += len(batch)
+        return self
+
+    def resume(
+        self, dimensions_list: Iterable[str], batch_size: int = STREAM_BATCH_SIZE
+    ) -> "StreamingCalculator":
+        """Count the presents in the same lines as before, skipping the
+        ones already read.
+        """
+        return self.consume(islice(dimensions_list, self.lines_read, None), batch_size)
+
+    def calculate_wrapping_paper(self) -> int:
+        """Return total needed square feet of wrapping paper so far."""
+        return self.paper.total
+
+    def calculate_ribbon(self) -> int:
+        """Return total needed length of ribbon so far."""
+        return self.ribbon.total
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Return the calculator's state as plain, JSON-ready values."""
+        return asdict(self)
+
+    @classmethod
+    def from_checkpoint(cls, state: Dict[str, Any]) -> "StreamingCalculator":
+        """Rebuild a calculator from a checkpoint."""
+        return cls(
+            Tally(**state["paper"]), Tally(**state["ribbon"]), state["lines_read"]
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "w") as output:
+            json.dump(self.checkpoint(), output, indent=2, sort_keys=True)
+            output.write("\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StreamingCalculator":
+        with open(path) as data:
+            return cls.from_checkpoint(json.load(data))
+
+
+def read_presents(dimensions_list: Iterable[str]) -> List[Present]:
+    """Build presents from "LxWxH" dimension lines."""
+    return [
+        Present(*[int(dimension) for dimension in dimensions.split("x")])
+        for dimensions in dimensions_list
+    ]
+
+
+def read_present_batch(data: Input) -> PresentBatch:
+    """Build a batch of presents from the rest of an input.
+
+    A mapped input is parsed straight from its bytes in one pass.
+    """
+    if isinstance(data, MappedInput):
+        return PresentBatch.from_text(read_bytes(data))
+    return PresentBatch.from_lines(data)
+
+
+def part_one(data: Input) -> int:
+    """Return total square feet of wrapping paper to order."""
+    return Calculator(read_present_batch(data)).calculate_wrapping_paper()
+
+
+def part_two(data: Input) -> int:
+    """Return total feet of ribbon to order."""
+    return Calculator(read_present_batch(data)).calculate_ribbon()
+
+
 if __name__ == "__main__":
-    with open("aoc_2015/inputs/day_02_part_1.txt") as data:
-        presents = [
-            Present(*[int(dimension) for dimension in dimensions.split("x")])
-            for dimensions in data
-        ]
-
-    calculator = Calculator(presents)
-    print(calculator.calculate_wrapping_paper())
-    print(calculator.calculate_ribbon())
+    with open("aoc_2015/inputs/day_02.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
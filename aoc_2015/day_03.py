@@ -27,7 +27,20 @@ script as the previous year.
 
 This year, how many houses receive at least one present?
 """
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Set, TextIO, Tuple, Union
+
+import numpy as np
+
+from aoc.loader import Buffer, read_bytes
+from aoc.workers import default_workers
+
+Position = Tuple[int, int]
+Directions = Union[str, Buffer]
+# Given how many moves and agents there are, return the agent who makes
+# each move.
+Assignment = Callable[[int, int], np.ndarray]
 
 
 def move_north(x: int, y: int) -> Tuple[int, int]:
@@ -56,6 +69,26 @@ DIRECTION_TO_MOVEMENT_MAP = {
     ">": move_east,
     "<": move_west,
 }
+NORTH, SOUTH, EAST, WEST = (ord(direction) for direction in "^v><")
+# The step each direction byte takes along each axis.
+X_STEPS = np.zeros(256, dtype=np.int8)
+X_STEPS[[EAST, WEST]] = 1, -1
+Y_STEPS = np.zeros(256, dtype=np.int8)
+Y_STEPS[[NORTH, SOUTH]] = 1, -1
+
+# Moves a VectorSanta turns into houses at a time.
+DELIVERY_CHUNK_SIZE = 1 << 20
+# A house is packed into one integer as x * 2 ** 32 + y + 2 ** 31, which
+# keeps both coordinates to 32 bits and sorts houses by x, then y.
+COORDINATE_BITS = 32
+COORDINATE_BIAS = 1 << (COORDINATE_BITS - 1)
+# Mark houses on a bitmap of the box around them, instead of sorting
+# them, when the box has at most this many cells per house; the bitmap
+# then takes no more memory than the packed houses.
+BITMAP_AREA_FACTOR = 8
+# Routes with at least this many moves are worth starting a pool of
+# processes to share out among agents.
+PARALLEL_THRESHOLD = 1 << 22
 
 
 class Santa:
@@ -87,18 +120,236 @@ class Santa:
         return len(self.tracker)
 
 
+class VectorSanta:
+    """Santa tracking his deliveries as one sorted array of packed houses.
+
+    He gives the same answers as Santa, who stays the reference, but each
+    house takes 8 bytes instead of a tuple in a set, and a route is
+    followed a chunk of moves at a time with a cumulative sum. Each
+    chunk's houses are merged into the sorted ones already visited.
+
+    Attributes:
+      position (Position): where Santa is now.
+      houses (np.ndarray): every house visited, packed and sorted.
+    """
+
+    def __init__(self, position: Position = (0, 0)) -> None:
+        self.position = position
+        self.houses = encode(np.array([position[0]]), np.array([position[1]]))
+
+    @property
+    def tracker(self) -> Set[Position]:
+        """Return the houses visited as a set of positions, like Santa's."""
+        return set(zip(*(axis.tolist() for axis in decode(self.houses))))
+
+    def deliver(self, directions: Directions) -> int:
+        """Track Santa as he follows directions for deliveries.
+
+        Args:
+          directions (Directions): the direction characters or bytes.
+
+        Returns:
+          (int): number of locations visited.
+        """
+        moves = direction_codes(directions)
+        for start in range(0, len(moves), DELIVERY_CHUNK_SIZE):
+            x, y = route(moves[start : start + DELIVERY_CHUNK_SIZE], self.position)
+            self.position = int(x[-1]), int(y[-1])
+            self.houses = merge_houses(self.houses, unique_houses(x, y))
+        return len(self.houses)
+
+
+@dataclass
+class DeliveryReport:
+    """Who delivered where when several agents shared the directions.
+
+    Attributes:
+      houses (int): houses that got at least one present.
+      per_agent (List[int]): houses each agent delivered to.
+      exclusive (List[int]): houses only that agent delivered to.
+      shared (int): houses more than one agent delivered to.
+    """
+
+    houses: int
+    per_agent: List[int] = field(default_factory=list)
+    exclusive: List[int] = field(default_factory=list)
+    shared: int = 0
+
+
+class Fleet:
+    """Several agents starting at the same house and sharing out one list
+    of directions between them, like Santa and Robo-Santa.
+
+    Each agent's houses are worked out separately, on a pool of processes
+    for long enough routes, then merged while counting how many agents
+    visited each house.
+
+    Attributes:
+      agents (int): how many agents deliver.
+      assign (Assignment): which agent makes each move. Defaults to
+        taking turns.
+      workers (int): how many processes to use. Defaults to
+        default_workers().
+    """
+
+    def __init__(
+        self,
+        agents: int = 2,
+        assign: Optional[Assignment] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        if agents < 1:
+            raise ValueError("A fleet needs at least one agent.")
+        self.agents = agents
+        self.assign = assign or round_robin
+        self.workers = workers or default_workers()
+
+    def deliver(self, directions: Directions) -> DeliveryReport:
+        """Share out the directions and track every agent's deliveries.
+
+        Args:
+          directions (Directions): the direction characters or bytes.
+
+        Returns:
+          (DeliveryReport): the houses delivered to, overall and by agent.
+        """
+        moves = direction_codes(directions)
+        owners = self.assign(len(moves), self.agents)
+        routes = [moves[owners == agent].tobytes() for agent in range(self.agents)]
+        if self.agents > 1 and self.workers != 1 and len(moves) >= PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                houses = list(executor.map(agent_houses, routes))
+        else:
+            houses = [agent_houses(route) for route in routes]
+        return report(houses)
+
+
+def round_robin(moves: int, agents: int) -> np.ndarray:
+    """Assign moves to agents in turn, starting with the first agent."""
+    return np.arange(moves) % agents
+
+
+def agent_houses(directions: Directions) -> np.ndarray:
+    """Return the houses one agent visits, packed and sorted."""
+    santa = VectorSanta()
+    santa.deliver(directions)
+    return santa.houses
+
+
+def report(houses: List[np.ndarray]) -> DeliveryReport:
+    """Merge the sorted houses of each agent and count who went where."""
+    if not houses:
+        return DeliveryReport(0)
+    merged = np.concatenate(houses)
+    agents = np.repeat(np.arange(len(houses)), [len(h) for h in houses])
+    # The stable sort merges the agents' sorted runs in linear time and
+    # keeps track of which agent each house came from.
+    order = np.argsort(merged, kind="stable")
+    merged, agents = merged[order], agents[order]
+    starts = np.flatnonzero(np.r_[True, merged[1:] != merged[:-1]])
+    visitors = np.diff(np.r_[starts, len(merged)])
+    alone = agents[starts[visitors == 1]]
+    return DeliveryReport(
+        houses=len(starts),
+        per_agent=[len(h) for h in houses],
+        exclusive=np.bincount(alone, minlength=len(houses)).tolist(),
+        shared=int(np.count_nonzero(visitors > 1)),
+    )
+
+
+def direction_codes(directions: Directions) -> np.ndarray:
+    """Return the direction bytes as an array, checking they're all
+    directions.
+
+    Raises:
+      ValueError: if a character isn't a direction.
+    """
+    codes = np.frombuffer(
+        directions.encode() if isinstance(directions, str) else directions,
+        dtype=np.uint8,
+    )
+    known = (X_STEPS[codes] != 0) | (Y_STEPS[codes] != 0)
+    if not known.all():
+        position = int(np.flatnonzero(~known)[0])
+        raise ValueError(
+            f"Unknown direction {chr(codes[position])!r} at position {position + 1}."
+        )
+    return codes
+
+
+def route(codes: np.ndarray, start: Position = (0, 0)) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the x and y coordinates after each move, from a start."""
+    x = np.cumsum(X_STEPS[codes], dtype=np.int64)
+    y = np.cumsum(Y_STEPS[codes], dtype=np.int64)
+    return x + start[0], y + start[1]
+
+
+def encode(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pack coordinates into one 64-bit integer each.
+
+    Both coordinates must fit in 32 bits, which takes over 2 ** 31 moves
+    in one direction to break.
+    """
+    return (x.astype(np.int64) << COORDINATE_BITS) + (y + COORDINATE_BIAS)
+
+
+def decode(houses: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Unpack encoded houses into their x and y coordinates."""
+    y = (houses & ((1 << COORDINATE_BITS) - 1)) - COORDINATE_BIAS
+    return houses >> COORDINATE_BITS, y
+
+
+def unique_houses(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Return the distinct houses at some coordinates, packed and sorted.
+
+    A route's houses are close together, so they're usually marked on a
+    bitmap of the box around them, which comes out already in order,
+    rather than sorted.
+    """
+    if not len(x):
+        return np.zeros(0, dtype=np.int64)
+    left, bottom = int(x.min()), int(y.min())
+    width = int(x.max()) - left + 1
+    height = int(y.max()) - bottom + 1
+    if width * height > BITMAP_AREA_FACTOR * len(x):
+        return distinct(np.sort(encode(x, y)))
+    seen = np.zeros(width * height, dtype=bool)
+    seen[(x - left) * height + (y - bottom)] = True
+    columns, rows = np.divmod(np.flatnonzero(seen), height)
+    return encode(columns + left, rows + bottom)
+
+
+def merge_houses(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Return the distinct houses in either of two sorted arrays.
+
+    A stable sort finds the two sorted runs and merges them in linear
+    time, where np.union1d would sort everything again.
+    """
+    return distinct(np.sort(np.concatenate((first, second)), kind="stable"))
+
+
+def distinct(houses: np.ndarray) -> np.ndarray:
+    """Return sorted houses without repeats."""
+    if not len(houses):
+        return houses
+    first = np.empty(len(houses), dtype=bool)
+    first[0] = True
+    np.not_equal(houses[1:], houses[:-1], out=first[1:])
+    return houses[first]
+
+
+def part_one(data: TextIO) -> int:
+    """Return how many houses Santa delivers to."""
+    return VectorSanta().deliver(read_bytes(data))
+
+
+def part_two(data: TextIO) -> int:
+    """Return how many houses Santa and Robo-Santa deliver to."""
+    return Fleet(2).deliver(read_bytes(data)).houses
+
+
 if __name__ == "__main__":
-    with open("aoc_2015/inputs/day_03_part_1.txt") as data:
-        # Remove the trailing newline.
-        directions = data.read()[:-1]
-
-    santa = Santa()
-    print(f"Part 1: {santa.deliver(directions)}")
-
-    new_santa = Santa()
-    robo_santa = Santa()
-    human_directions = directions[::2]
-    robo_directions = directions[1::2]
-    new_santa.deliver(human_directions)
-    robo_santa.deliver(robo_directions)
-    print(f"Part 2: {len(new_santa.tracker | robo_santa.tracker)}")
+    with open("aoc_2015/inputs/day_03.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
@@ -15,9 +15,33 @@ leading zeroes: 1, 2, 3, ...) that produces such a hash.
 
 Now find one that starts with six zeroes.
 """
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from hashlib import md5
+from pathlib import Path
+from string import hexdigits
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from aoc.workers import default_workers
 
 SECRET_KEY = "iwrupvqb"
+# Nonces a worker of a ParallelMiner tries before reporting back. Small
+# enough that the work left running once the answer is proven is short.
+PARALLEL_BLOCK_SIZE = 1 << 16
+# Blocks queued per worker, so each has the next one ready.
+BLOCKS_PER_WORKER = 2
+HEX_DIGITS = frozenset(hexdigits.lower())
+
+# Given an adventcoin key, a secret key, and a range of numbers, return
+# the lowest number in the range that mines a coin, or None.
+Engine = Callable[[str, str, int, int], Optional[int]]
+DEFAULT_ENGINE = "prefix"
+# Numbers a MultiMiner searches between progress reports.
+SEARCH_BLOCK_SIZE = 1 << 16
+# Seconds a MultiMiner searches between checkpoints.
+CHECKPOINT_INTERVAL = 60.0
 
 
 def infinite_sequence(start=0):
@@ -51,7 +75,303 @@ def main(
     return number
 
 
+def search_block(
+    adventcoin_key: str, secret_key: str, start: int, stop: int
+) -> Optional[int]:
+    """Return the lowest number from start up to stop that mines a coin,
+    or None if none does.
+    """
+    for number in range(start, stop):
+        if md5(f"{secret_key}{number}".encode()).hexdigest().startswith(adventcoin_key):
+            return number
+    return None
+
+
+def search_block_prefixed(
+    adventcoin_key: str, secret_key: str, start: int, stop: int
+) -> Optional[int]:
+    """Return the lowest number from start up to stop that mines a coin,
+    or None if none does, like search_block but faster.
+
+    The secret key is hashed once and its hash state copied for each
+    number, and the digest's leading bytes are checked as they are
+    rather than turned into hex first.
+    """
+    whole, nibble = digest_prefix(adventcoin_key)
+    copy = md5(secret_key.encode()).copy
+    for number in range(start, stop):
+        hashed = copy()
+        hashed.update(b"%d" % number)
+        digest = hashed.digest()
+        if digest.startswith(whole) and (
+            nibble is None or digest[len(whole)] >> 4 == nibble
+        ):
+            return number
+    return None
+
+
+def digest_prefix(adventcoin_key: str) -> Tuple[bytes, Optional[int]]:
+    """Return the bytes a digest must start with to have a hex digest
+    that starts with the adventcoin_key, and the high nibble of the byte
+    after them if the key has an odd number of digits.
+
+    Raises:
+      ValueError: if the key isn't lowercase hex, which no hex digest
+        starts with.
+    """
+    if not set(adventcoin_key) <= HEX_DIGITS:
+        raise ValueError(f"{adventcoin_key!r} isn't lowercase hex digits.")
+    even = len(adventcoin_key) - len(adventcoin_key) % 2
+    nibble = int(adventcoin_key[even:], 16) if even < len(adventcoin_key) else None
+    return bytes.fromhex(adventcoin_key[:even]), nibble
+
+
+ENGINES: Dict[str, Engine] = {
+    "hex": search_block,
+    "prefix": search_block_prefixed,
+}
+
+
+class ParallelMiner:
+    """A miner that hands out blocks of numbers to a pool of processes.
+
+    Blocks are searched out of order, but the answer is always the lowest
+    number that mines a coin: a block's find only counts once every block
+    before it has come back empty. At that point the blocks still queued
+    are cancelled; those already running finish, which takes at most one
+    block's time.
+
+    Attributes:
+      secret_key (str): the key every number is appended to.
+      workers (int): how many processes to use. Defaults to
+        default_workers().
+      block_size (int): how many numbers a worker searches at a time.
+      engine (str): the name of the search engine in ENGINES to use.
+    """
+
+    def __init__(
+        self,
+        secret_key: str = SECRET_KEY,
+        workers: Optional[int] = None,
+        block_size: int = PARALLEL_BLOCK_SIZE,
+        engine: str = DEFAULT_ENGINE,
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown search engine {engine!r}.")
+        self.secret_key = secret_key
+        self.workers = workers or default_workers()
+        self.block_size = block_size
+        self.engine = engine
+
+    def mine(self, adventcoin_key: str, start: int = 0) -> int:
+        """Return the lowest number from start on that combines with the
+        secret key to produce an MD5 hash that begins with the
+        adventcoin_key.
+        """
+        if self.workers == 1:
+            return self._mine_serially(adventcoin_key, start)
+
+        pending: Dict[Future, int] = {}
+        found: Dict[int, Optional[int]] = {}
+        next_block = 0
+        # Every block before this one has come back empty.
+        settled = 0
+        # The lowest block known to hold a coin; none after it is needed.
+        lowest: Optional[int] = None
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                while len(pending) < self.workers * BLOCKS_PER_WORKER and (
+                    lowest is None or next_block < lowest
+                ):
+                    block_start = start + next_block * self.block_size
+                    future = executor.submit(
+                        ENGINES[self.engine],
+                        adventcoin_key,
+                        self.secret_key,
+                        block_start,
+                        block_start + self.block_size,
+                    )
+                    pending[future] = next_block
+                    next_block += 1
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block = pending.pop(future)
+                    found[block] = future.result()
+                    if found[block] is not None and (lowest is None or block < lowest):
+                        lowest = block
+                while settled in found:
+                    number = found[settled]
+                    if number is not None:
+                        for future in pending:
+                            future.cancel()
+                        return number
+                    settled += 1
+
+    def _mine_serially(self, adventcoin_key: str, start: int) -> int:
+        while True:
+            stop = start + self.block_size
+            number = ENGINES[self.engine](adventcoin_key, self.secret_key, start, stop)
+            if number is not None:
+                return number
+            start = stop
+
+
+def search_block_multi(
+    adventcoin_keys: Iterable[str], secret_key: str, start: int, stop: int
+) -> Dict[str, int]:
+    """Return the lowest number from start up to stop that mines a coin
+    for each adventcoin key that any number in the range does.
+
+    Every number is hashed once whatever the number of keys. Digests that
+    don't start with the bytes all the keys share are skipped without
+    looking at any key.
+    """
+    remaining = {key: digest_prefix(key) for key in adventcoin_keys}
+    found: Dict[str, int] = {}
+    copy = md5(secret_key.encode()).copy
+    shared = min((whole for whole, _ in remaining.values()), default=b"")
+    for whole, _ in remaining.values():
+        while not whole.startswith(shared):
+            shared = shared[:-1]
+    for number in range(start, stop):
+        if not remaining:
+            break
+        hashed = copy()
+        hashed.update(b"%d" % number)
+        digest = hashed.digest()
+        if not digest.startswith(shared):
+            continue
+        for key, (whole, nibble) in list(remaining.items()):
+            if digest.startswith(whole) and (
+                nibble is None or digest[len(whole)] >> 4 == nibble
+            ):
+                found[key] = number
+                del remaining[key]
+    return found
+
+
+@dataclass
+class MultiMiner:
+    """A miner that looks for the lowest number for several adventcoin
+    keys in one pass, saving its place as it goes so a long search can
+    be resumed.
+
+    Attributes:
+      adventcoin_keys (List[str]): the hex prefixes to mine coins for.
+      secret_key (str): the key every number is appended to.
+      next_number (int): the lowest number not searched yet.
+      found (Dict[str, int]): the lowest number found for each key.
+      hashes (int): numbers hashed since this miner was created or
+        loaded.
+      elapsed (float): seconds spent searching over the same time.
+    """
+
+    adventcoin_keys: List[str]
+    secret_key: str = SECRET_KEY
+    next_number: int = 0
+    found: Dict[str, int] = field(default_factory=dict)
+    hashes: int = 0
+    elapsed: float = 0.0
+
+    def __post_init__(self) -> None:
+        for key in self.adventcoin_keys:
+            digest_prefix(key)
+
+    @property
+    def remaining(self) -> List[str]:
+        """Return the keys no number has been found for yet."""
+        return [key for key in self.adventcoin_keys if key not in self.found]
+
+    @property
+    def hash_rate(self) -> float:
+        """Return the numbers hashed per second so far."""
+        return self.hashes / self.elapsed if self.elapsed else 0.0
+
+    def search(
+        self,
+        stop: Optional[int] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_interval: float = CHECKPOINT_INTERVAL,
+        on_progress: Optional[Callable[["MultiMiner"], None]] = None,
+        block_size: int = SEARCH_BLOCK_SIZE,
+    ) -> Dict[str, int]:
+        """Search until every key has a number or the stop is reached.
+
+        Args:
+          stop (Optional[int]): the number to stop before, if any.
+          checkpoint_path (Optional[Union[str, Path]]): where to save the
+            search's place, every checkpoint_interval seconds and once it
+            stops.
+          checkpoint_interval (float): seconds between checkpoints.
+          on_progress (Optional[Callable[[MultiMiner], None]]): called
+            with the miner after every block of numbers.
+          block_size (int): how many numbers to search between reports.
+
+        Returns:
+          (Dict[str, int]): the lowest number found for each key.
+        """
+        last_checkpoint = time.perf_counter()
+        while self.remaining and (stop is None or self.next_number < stop):
+            start = time.perf_counter()
+            end = self.next_number + block_size
+            if stop is not None:
+                end = min(end, stop)
+            found = search_block_multi(
+                self.remaining, self.secret_key, self.next_number, end
+            )
+            self.found.update(found)
+            # Searching stops at the last key's number, and the numbers
+            # after it still count as unsearched.
+            if not self.remaining:
+                end = max(found.values()) + 1
+            self.hashes += end - self.next_number
+            self.next_number = end
+            self.elapsed += time.perf_counter() - start
+
+            if on_progress:
+                on_progress(self)
+            if (
+                checkpoint_path
+                and time.perf_counter() - last_checkpoint >= checkpoint_interval
+            ):
+                self.save(checkpoint_path)
+                last_checkpoint = time.perf_counter()
+        if checkpoint_path:
+            self.save(checkpoint_path)
+        return dict(self.found)
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Return the search's place as plain, JSON-ready values."""
+        state = asdict(self)
+        del state["hashes"], state["elapsed"]
+        return state
+
+    def save(self, path: Union[str, Path]) -> None:
+        with open(path, "w") as output:
+            json.dump(self.checkpoint(), output, indent=2, sort_keys=True)
+            output.write("\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MultiMiner":
+        """Pick a search up from a checkpoint."""
+        with open(path) as data:
+            return cls(**json.load(data))
+
+
+def part_one(data: TextIO) -> int:
+    """Return the lowest number that mines a coin with five zeroes."""
+    return ParallelMiner(data.read().strip()).mine("00000")
+
+
+def part_two(data: TextIO) -> int:
+    """Return the lowest number that mines a coin with six zeroes."""
+    return ParallelMiner(data.read().strip()).mine("000000")
+
+
 if __name__ == "__main__":
-    five_zeros = main("00000")
-    print(f"Part 1: {five_zeros}")
-    print(f"Part 2: {main('000000', sequence_start=five_zeros + 1)}")
+    with open("aoc_2015/inputs/day_04.txt") as data:
+        secret_key = data.read().strip()
+
+    coins = MultiMiner(["00000", "000000"], secret_key).search()
+    print(f"Part 1: {coins['00000']}")
+    print(f"Part 2: {coins['000000']}")
@@ -32,20 +32,47 @@ Now, a nice string is one with all of the following properties:
 How many strings are nice under these new rules?
 """
 import re
-from typing import Callable, Sequence
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from aoc.loader import ENCODING, NEWLINE, Input, MappedInput
+from aoc.workers import default_workers
+
+VOWELS = "aeiouAEIOU"
+# Strings longer than this are checked rule by rule in linear time, since
+# backtracking makes some fused patterns quadratic in the length.
+FUSED_MAX_LENGTH = 256
+# Characters of input a worker validates at a time in bulk.
+BULK_CHUNK_SIZE = 1 << 20
+# Chunks queued per worker, so each has the next one ready.
+CHUNKS_PER_WORKER = 2
 
 
 def validate_vowels(string: str) -> bool:
     """Return whether string contains at least three vowels."""
-    vowels = re.sub("(?i)([^aeiou])", "", string)
-    return len(vowels) > 2
+    return sum(map(string.count, VOWELS)) > 2
 
 
 def validate_double_letters(string: str) -> bool:
     """Return whether string contains a double letter."""
-    for i, c in enumerate(string[:-1]):
-        if c == string[i + 1]:
+    previous = None
+    for c in string:
+        if c == previous:
             return True
+        previous = c
     return False
 
 
@@ -58,9 +85,15 @@ def validate_special_letters(string: str) -> bool:
 
 
 def validate_pair_of_pairs(string: str) -> bool:
-    """Return whether string contains two letters that twice."""
-    for i, c in enumerate(string[:-2]):
-        if c + string[i + 1] in string[i + 2 :]:
+    """Return whether string contains two letters that twice.
+
+    Each pair's first position is remembered, so a later copy that
+    starts at least two letters on doesn't overlap it.
+    """
+    first_seen: Dict[str, int] = {}
+    for i in range(1, len(string)):
+        pair = string[i - 1 : i + 1]
+        if i - first_seen.setdefault(pair, i) >= 2:
             return True
     return False
 
@@ -69,9 +102,11 @@ def validate_skipped_repeating_letters(string: str) -> bool:
     """Return whether string contains repeated letters with a letter
     between them (e.g. "xyx").
     """
-    for i, c in enumerate(string[:-2]):
-        if c == string[i + 2]:
+    before_previous = previous = None
+    for c in string:
+        if c == before_previous:
             return True
+        before_previous, previous = previous, c
     return False
 
 
@@ -88,21 +123,300 @@ PART_TWO_VALIDATORS = [
 ]
 
 
+class Rule(ABC):
+    """A property nice strings have, written as a regular expression
+    lookahead so any number of rules can be fused into one expression,
+    and as a check in linear time for strings too long for that.
+
+    A rule can also be called on a string by itself, like a validator.
+    """
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    @abstractmethod
+    def fragment(self, group: str) -> str:
+        """Return a lookahead that matches at the start of a string with
+        the property, naming any group it captures after group.
+        """
+
+    @abstractmethod
+    def check(self, string: str) -> bool:
+        """Return whether a string has the property, in linear time."""
+
+    def __call__(self, string: str) -> bool:
+        return self.check(string)
+
+
+@dataclass(frozen=True)
+class Vowels(Rule):
+    """At least some number of vowels, in either case."""
+
+    minimum: int = 3
+    letters: str = "aeiou"
+
+    def fragment(self, group: str) -> str:
+        return f"(?=(?i:(?:.*?[{re.escape(self.letters)}]){{{self.minimum}}}))"
+
+    def check(self, string: str) -> bool:
+        letters = self.letters.lower() + self.letters.upper()
+        return sum(map(string.count, set(letters))) >= self.minimum
+
+
+@dataclass(frozen=True)
+class DoubleLetter(Rule):
+    """A letter that appears twice in a row."""
+
+    def fragment(self, group: str) -> str:
+        return f"(?=.*(?P<{group}>.)(?P={group}))"
+
+    def check(self, string: str) -> bool:
+        return validate_double_letters(string)
+
+
+@dataclass(frozen=True)
+class ForbiddenPairs(Rule):
+    """None of some pairs of letters."""
+
+    pairs: Tuple[str, ...] = ("ab", "cd", "pq", "xy")
+
+    def fragment(self, group: str) -> str:
+        return f"(?!.*(?:{'|'.join(map(re.escape, self.pairs))}))"
+
+    def check(self, string: str) -> bool:
+        return not any(pair in string for pair in self.pairs)
+
+
+@dataclass(frozen=True)
+class RepeatedPair(Rule):
+    """A pair of letters that appears twice without overlapping."""
+
+    def fragment(self, group: str) -> str:
+        return f"(?=.*(?P<{group}>..).*(?P={group}))"
+
+    def check(self, string: str) -> bool:
+        return validate_pair_of_pairs(string)
+
+
+@dataclass(frozen=True)
+class SkippedRepeat(Rule):
+    """A letter that repeats with exactly one letter between."""
+
+    def fragment(self, group: str) -> str:
+        return f"(?=.*(?P<{group}>.).(?P={group}))"
+
+    def check(self, string: str) -> bool:
+        return validate_skipped_repeating_letters(string)
+
+
+RULES = [Vowels(), DoubleLetter(), ForbiddenPairs()]
+# The cheaper rule goes first, since matching stops at the first failure.
+PART_TWO_RULES = [SkippedRepeat(), RepeatedPair()]
+
+
+class FusedValidator:
+    """Validate strings against several rules with one compiled regular
+    expression, so checking a string is a single call into the regex
+    engine, which stops at the first rule that fails.
+
+    This is not one pass over the string: each rule's lookahead scans it
+    again from the start. It pays off for the part two rules, which the
+    validator chain checks in Python a character at a time, but not for
+    part one's, whose validators mostly call into C already.
+
+    Strings longer than FUSED_MAX_LENGTH are checked rule by rule instead,
+    which takes linear time where backtracking might not.
+
+    Attributes:
+      rules (Tuple[Rule, ...]): the rules, checked in order.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = tuple(rules)
+        self._match = re.compile(
+            "".join(rule.fragment(f"rule{i}") for i, rule in enumerate(self.rules))
+        ).match
+
+    def __call__(self, string: str) -> bool:
+        """Return whether a string passes every rule."""
+        if len(string) > FUSED_MAX_LENGTH:
+            return all(rule.check(string) for rule in self.rules)
+        return self._match(string) is not None
+
+    def count(self, strings: Iterable[str]) -> int:
+        """Return how many strings pass every rule."""
+        return sum(1 for string in strings if self(string))
+
+
+@dataclass
+class ValidationReport:
+    """How many strings passed each rule, and which rule each naughty
+    string failed first, for choosing the order to check rules in.
+
+    Attributes:
+      strings (int): how many strings were checked.
+      nice (int): how many passed every rule.
+      passed (Dict[str, int]): how many passed each rule, by name.
+      first_failures (Dict[str, int]): how many failed each rule before
+        any other, checking the rules in order.
+    """
+
+    strings: int = 0
+    nice: int = 0
+    passed: Dict[str, int] = field(default_factory=dict)
+    first_failures: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> Dict[str, int]:
+        """Return how many strings failed each rule, by name."""
+        return {name: self.strings - passed for name, passed in self.passed.items()}
+
+    def add(self, other: "ValidationReport") -> None:
+        """Count another report's strings in with this one's."""
+        self.strings += other.strings
+        self.nice += other.nice
+        for name, passed in other.passed.items():
+            self.passed[name] = self.passed.get(name, 0) + passed
+        for name, failures in other.first_failures.items():
+            self.first_failures[name] = self.first_failures.get(name, 0) + failures
+
+
+def validate_report(rules: Sequence[Rule], strings: Iterable[str]) -> ValidationReport:
+    """Check every rule on every string and count the results.
+
+    Unlike FusedValidator, a string that fails one rule is still checked
+    against the rest, so each rule's count covers every string.
+    """
+    names = [rule.name for rule in rules]
+    if len(set(names)) != len(names):
+        raise ValueError("Rules in one report need different names.")
+    checks = [FusedValidator([rule]) for rule in rules]
+    passed = [0] * len(rules)
+    first_failures = [0] * len(rules)
+    count = nice = 0
+    for string in strings:
+        count += 1
+        first = None
+        for i, check in enumerate(checks):
+            if check(string):
+                passed[i] += 1
+            elif first is None:
+                first = i
+        if first is None:
+            nice += 1
+        else:
+            first_failures[first] += 1
+    return ValidationReport(
+        count, nice, dict(zip(names, passed)), dict(zip(names, first_failures))
+    )
+
+
+def validate_chunk(rules: Sequence[Rule], text: str) -> ValidationReport:
+    """Report on the strings in a chunk of whole lines."""
+    return validate_report(rules, text.splitlines())
+
+
+def chunks(data: Input, chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[str]:
+    """Yield the rest of an input in chunks of whole lines, each about
+    chunk_size characters long.
+
+    A mapped input is split on its bytes, so only the chunk being yielded
+    is ever decoded.
+    """
+    if not isinstance(data, MappedInput):
+        chunk: List[str] = []
+        size = 0
+        for line in data:
+            chunk.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                yield "".join(chunk)
+                chunk, size = [], 0
+        if chunk:
+            yield "".join(chunk)
+        return
+
+    buffer, size = data.buffer, len(data)
+    start = data.tell()
+    while start < size:
+        newline = buffer.find(NEWLINE, start + max(chunk_size - 1, 0))
+        end = size if newline == -1 else newline + 1
+        yield buffer[start:end].decode(ENCODING)
+        start = end
+        data.seek(start)
+
+
+def validate_bulk(
+    data: Input,
+    rules: Sequence[Rule] = RULES,
+    workers: Optional[int] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> ValidationReport:
+    """Report on every string in an input, validating chunks of it on a
+    pool of processes.
+
+    Args:
+      data (Input): the strings, one per line.
+      rules (Sequence[Rule]): the rules to check, in order.
+      workers (Optional[int]): how many processes to use. Defaults to
+        default_workers().
+      chunk_size (int): about how many characters to send a worker at a
+        time.
+
+    Returns:
+      (ValidationReport): the nice strings and how each rule did.
+    """
+    workers = workers or default_workers()
+    report = ValidationReport(
+        passed={rule.name: 0 for rule in rules},
+        first_failures={rule.name: 0 for rule in rules},
+    )
+    pieces = chunks(data, chunk_size)
+    if workers == 1:
+        for piece in pieces:
+            report.add(validate_chunk(rules, piece))
+        return report
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Set[Future] = set()
+        for piece in pieces:
+            pending.add(executor.submit(validate_chunk, rules, piece))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report.add(future.result())
+        for future in pending:
+            report.add(future.result())
+    return report
+
+
 def main(
-    strings: Sequence[str],
+    strings: Iterable[str],
     validators: Sequence[Callable[[str], bool]] = VALIDATORS,
 ) -> int:
-    """Return number of strings that pass validation."""
-    good_count = []
+    """Return number of strings that pass validation, checking each one
+    as it's read.
+    """
+    good_count = 0
     for string in strings:
         if all(validate(string) for validate in validators):
-            good_count.append(1)
-    return sum(good_count)
+            good_count += 1
+    return good_count
+
+
+def part_one(data: TextIO) -> int:
+    """Return how many strings are nice."""
+    return main(data)
+
+
+def part_two(data: TextIO) -> int:
+    """Return how many strings are nice under the new rules."""
+    return FusedValidator(PART_TWO_RULES).count(data)
 
 
 if __name__ == "__main__":
     with open("aoc_2015/inputs/day_05.txt") as data:
-        strings = [string for string in data]
-
-    print(f"Part 1: {main(strings)}")
-    print(f"Part 2: {main(strings, validators=PART_TWO_VALIDATORS)}")
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
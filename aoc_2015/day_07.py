@@ -40,7 +40,7 @@ Now, take the signal you got on wire a, override wire b to that signal,
 and reset the other wires (including wire a). What new signal is
 ultimately provided to wire a?
 """
-from typing import Dict, List
+from typing import Dict, List, TextIO
 
 
 def AND(left: int, right: int) -> int:
@@ -144,14 +144,26 @@ class Circuit:
         return result
 
 
-if __name__ == "__main__":
-    with open("aoc_2015/inputs/day_07.txt") as data:
-        instructions = [instruction[:-1] for instruction in data]
+def part_one(data: TextIO) -> int:
+    """Return the signal provided to wire a."""
+    instructions = [instruction.rstrip("\n") for instruction in data]
+    return Circuit.build(instructions).trace("a")
 
-    circuit = Circuit.build(instructions)
-    signal_a = circuit.trace("a")
-    print(f"Part 1: {signal_a}")
+
+def part_two(data: TextIO) -> int:
+    """Return the signal provided to wire a after overriding wire b
+    with the original signal of wire a.
+    """
+    instructions = [instruction.rstrip("\n") for instruction in data]
+    signal_a = Circuit.build(instructions).trace("a")
 
     circuit = Circuit.build(instructions)
     circuit._wire_map["b"] = str(signal_a)
-    print(f"Part 2: {circuit.trace('a')}")
+    return circuit.trace("a")
+
+
+if __name__ == "__main__":
+    with open("aoc_2015/inputs/day_07.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
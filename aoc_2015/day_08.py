@@ -40,7 +40,7 @@ puzzle) is 42 - 23 = 19.
 import ast
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, TextIO
 
 slash = re.compile(r"\\\\(?:(?!\\)|(?!\")|(?<!\\))")
 quote = re.compile(r"\\\"")
@@ -160,10 +160,18 @@ class SpaceCounter:
         return self.memory_sizer.calculate_memory_size(string)
 
 
+def part_one(data: TextIO) -> int:
+    """Return code characters minus in-memory characters."""
+    return SpaceCounter([string.rstrip("\n") for string in data]).count()
+
+
+def part_two(data: TextIO) -> int:
+    """Return encoded characters minus code characters."""
+    return SpaceCounter([string.rstrip("\n") for string in data]).escaped_count()
+
+
 if __name__ == "__main__":
     with open("aoc_2015/inputs/day_08.txt") as data:
-        strings = [string[:-1] for string in data]
-
-    counter = SpaceCounter(strings)
-    print(f"Part 1: {counter.count()}")
-    print(f"Part 2: {counter.escaped_count()}")
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
@@ -56,7 +56,9 @@ are those Elves carrying in total?
 
 """
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterable, List, TextIO
+
+from aoc.loader import blocks
 
 
 @dataclass
@@ -83,14 +85,18 @@ class ElfStats:
         self.top_3_calories = self.calculate_top_3_calories()
 
     @classmethod
-    def from_calories_list(cls, calories_list: List[str]) -> "ElfStats":
-        """Calculate elf stats from a list of their calories."""
+    def from_calories_list(cls, calories_list: Iterable[str]) -> "ElfStats":
+        """Calculate elf stats from lines of their calories.
+
+        Only the Elf being counted and the top three are kept, so the
+        lines can come from any iterable, however long.
+        """
         elf = Elf()
         stats = cls([elf])
 
         for calories in calories_list:
-            # "\n" separates Elves from each other.
-            if calories == "\n":
+            # A blank line separates Elves from each other.
+            if not calories.strip():
                 stats.check_for_top_elf(elf)
                 # On to the next Elf.
                 elf = Elf()
@@ -98,6 +104,16 @@ class ElfStats:
 
             elf.meals.append(int(calories))
 
+        # The last Elf may not be followed by a blank line.
+        stats.check_for_top_elf(elf)
+        return stats
+
+    @classmethod
+    def from_meal_blocks(cls, meal_blocks: Iterable[List[str]]) -> "ElfStats":
+        """Calculate elf stats from the meals of each Elf in turn."""
+        stats = cls([Elf()])
+        for meals in meal_blocks:
+            stats.check_for_top_elf(Elf([int(meal) for meal in meals]))
         return stats
 
     def calculate_top_3_calories(self) -> int:
@@ -122,11 +138,18 @@ class ElfStats:
         self.top_3_calories = self.calculate_top_3_calories()
 
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_01.txt") as data:
-        calories_list = [line for line in data]
+def part_one(data: TextIO) -> int:
+    """Return the calories carried by the top Elf."""
+    return ElfStats.from_meal_blocks(blocks(data)).top_elf.total_calories
+
+
+def part_two(data: TextIO) -> int:
+    """Return the calories carried by the top three Elves."""
+    return ElfStats.from_meal_blocks(blocks(data)).top_3_calories
 
-    stats = ElfStats.from_calories_list(calories_list)
 
-    print(f"Part 1: {stats.top_elf.total_calories}")
-    print(f"Part 2: {stats.top_3_calories}")
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_01.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
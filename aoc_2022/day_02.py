@@ -52,7 +52,7 @@ total score be if everything goes exactly according to your strategy
 guide?
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, List, TextIO, Tuple
 
 
 @dataclass
@@ -188,11 +188,20 @@ class Game2(RockPaperScissors):
         return throw_one, throw_two
 
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_02.txt") as data:
-        rounds = [round for round in data]
+def part_one(data: TextIO) -> int:
+    """Return the score from following the strategy guide."""
+    rounds = [round for round in data]
+    return RockPaperScissors(Player(), Player(), rounds).run()
+
 
-    score = RockPaperScissors(Player(), Player(), rounds).run()
+def part_two(data: TextIO) -> int:
+    """Return the score from following the Elf's instructions."""
+    rounds = [round for round in data]
+    return Game2(Player(), Player(), rounds).run()
 
-    print(f"Part 1: {score}")
-    print(f"Part 2: {Game2(Player(), Player(), rounds).run()}")
+
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_02.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
@@ -59,7 +59,7 @@ Find the item type that corresponds to the badges of each three-Elf
 group. What is the sum of the priorities of those item types?
 """
 import string
-from typing import List
+from typing import Iterable, Sequence, TextIO
 
 PRIORITIES = {char: i for i, char in enumerate(string.ascii_letters, start=1)}
 
@@ -70,25 +70,35 @@ def find_common(content: str) -> int:
     return PRIORITIES[common.pop()]
 
 
-def sort(contents: List[str]) -> int:
+def sort(contents: Iterable[str]) -> int:
     return sum(find_common(content) for content in contents)
 
 
-def find_common_by_group(contents: List[str]) -> int:
-    # Slice the newline character off the item lists.
-    common = set(contents[0][:-1]) & set(contents[1][:-1]) & set(contents[2][:-1])
+def find_common_by_group(contents: Sequence[str]) -> int:
+    # Strip the newline character off the item lists.
+    common = set.intersection(*(set(content.rstrip("\n")) for content in contents))
     return PRIORITIES[common.pop()]
 
 
-def sort_by_group(contents: List[str]) -> int:
-    return sum(
-        find_common_by_group(contents[i : i + 3]) for i in range(0, len(contents), 3)
-    )
+def sort_by_group(contents: Iterable[str]) -> int:
+    # Zipping one iterator with itself takes the rucksacks three at a time
+    # as they're read.
+    rucksacks = iter(contents)
+    return sum(find_common_by_group(group) for group in zip(*[rucksacks] * 3))
+
+
+def part_one(data: TextIO) -> int:
+    """Return the priority sum of items in both compartments."""
+    return sort(data)
+
+
+def part_two(data: TextIO) -> int:
+    """Return the priority sum of each group's badge."""
+    return sort_by_group(data)
 
 
 if __name__ == "__main__":
     with open("aoc_2022/inputs/day_03.txt") as data:
-        rucksacks = [rucksack for rucksack in data]
-
-    print(f"Part One: {sort(rucksacks)}")
-    print(f"Part 2: {sort_by_group(rucksacks)}")
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
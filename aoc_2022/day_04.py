@@ -22,7 +22,7 @@ at all.
 
 In how many assignment pairs do the ranges overlap?
 """
-from typing import List, Tuple
+from typing import Iterable, TextIO, Tuple
 
 
 class Assignment:
@@ -42,33 +42,48 @@ class Assignment:
         return self.sections - other.sections
 
 
-def assess(section_pairs: List[str]) -> Tuple[int, int]:
+def assess(section_pairs: Iterable[str]) -> Tuple[int, int]:
     """Check section pairs for overlapping assignments.
 
+    Pairs are checked one at a time as they're read, so any iterable of
+    lines can be assessed without holding them all.
+
     Returns:
         (
             count of assignments fully containing the other,
             count of assignments overlapping at all,
         )
     """
-    containment_tracker = []
-    overlapping_tracker = []
+    containment_count = 0
+    overlapping_count = 0
     for pair in section_pairs:
+        if not pair.strip():
+            continue
         raw_first, raw_second = pair.split(",")
         first, second = Assignment(raw_first), Assignment(raw_second)
         if not first - second or not second - first:
-            containment_tracker.append(1)
-            overlapping_tracker.append(1)
+            containment_count += 1
+            overlapping_count += 1
         elif first & second:
-            overlapping_tracker.append(1)
+            overlapping_count += 1
+
+    return containment_count, overlapping_count
+
 
-    return sum(containment_tracker), sum(overlapping_tracker)
+def part_one(data: TextIO) -> int:
+    """Return how many pairs have one range fully containing the other."""
+    containment, _ = assess(data)
+    return containment
+
+
+def part_two(data: TextIO) -> int:
+    """Return how many pairs have overlapping ranges."""
+    _, overlapping = assess(data)
+    return overlapping
 
 
 if __name__ == "__main__":
     with open("aoc_2022/inputs/day_04.txt") as data:
-        assignment_pairs = [pair for pair in data]
-
-    containment, overlapping = assess(assignment_pairs)
-    print(f"Part One: {containment}")
-    print(f"Part Two: {overlapping}")
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
@@ -88,7 +88,7 @@ ends up on top of each stack?
 """
 import copy
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
 
 
 @dataclass
@@ -261,16 +261,23 @@ class CrateMover9001(CrateMover9000):
         self.inventory.stacks[destination].supplies.extend(crates_to_move[::-1])
 
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_05.txt") as data:
-        commands = [command[:-1] for command in data][10:]
+def read_commands(data: TextIO) -> List[str]:
+    """Return the rearrangement commands below the stacks drawing."""
+    return [command[:-1] for command in data][10:]
+
+
+def part_one(data: TextIO) -> str:
+    """Return the top supplies after rearranging with a CrateMover 9000."""
+    return CrateMover9000(Inventory()).rearrange(read_commands(data))
 
-    crane = CrateMover9000(Inventory())
-    crane_9001 = CrateMover9001(Inventory())
 
-    top_supplies = crane.rearrange(commands)
-    revised_top_supplies = crane_9001.rearrange(commands)
+def part_two(data: TextIO) -> str:
+    """Return the top supplies after rearranging with a CrateMover 9001."""
+    return CrateMover9001(Inventory()).rearrange(read_commands(data))
 
-    print(crane.inventory)
-    print(f"Part One: {top_supplies}")
-    print(f"Part Two: {revised_top_supplies}")
+
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_05.txt") as data:
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
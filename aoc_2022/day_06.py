@@ -47,7 +47,7 @@ start-of-message marker is detected?
 """
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Optional
+from typing import Deque, Optional, TextIO
 
 
 @dataclass
@@ -75,11 +75,18 @@ class Receiver:
         return len(set(buffer)) == len(buffer)
 
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_06.txt") as data:
-        signal = data.readline()
+def part_one(data: TextIO) -> Optional[int]:
+    """Return the position after the first start-of-packet marker."""
+    return Receiver(data.readline()).find_marker()
+
 
-    receiver = Receiver(signal)
+def part_two(data: TextIO) -> Optional[int]:
+    """Return the position after the first start-of-message marker."""
+    return Receiver(data.readline()).find_marker(14)
 
-    print(f"Part One: {receiver.find_marker()}")
-    print(f"Part Two: {receiver.find_marker(14)}")
+
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_06.txt") as data:
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
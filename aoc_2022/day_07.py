@@ -115,7 +115,7 @@ more than once!)
 Find all of the directories with a total size of at most 100000. What is
 the sum of the total sizes of those directories?
 """
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, TextIO, Union
 
 
 class Node:
@@ -256,11 +256,20 @@ class Filesystem:
         ]
 
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_07.txt") as data:
-        log = [line[:-1] for line in data]
+def part_one(data: TextIO) -> int:
+    """Return the total size of directories of at most 100000."""
+    fs = Filesystem.build_from_log([line[:-1] for line in data])
+    return fs.size_up_to_limit()
+
 
-        fs = Filesystem.build_from_log(log)
+def part_two(data: TextIO) -> int:
+    """Return the size of the smallest directory to delete."""
+    fs = Filesystem.build_from_log([line[:-1] for line in data])
+    return fs.free_storage().size
 
-        print(f"Part One: {fs.size_up_to_limit()}")
-        print(f"Part Two: {fs.free_storage().size}")
+
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_07.txt") as data:
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
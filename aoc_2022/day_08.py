@@ -85,8 +85,16 @@ for the tree house.
 Consider each tree on your map. What is the highest scenic score
 possible for any tree?
 """
-from dataclasses import dataclass
-from typing import Optional, Set, Tuple
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence, Set, TextIO, Tuple
+
+import numpy as np
+
+from aoc.grid import ArrayGrid
+from aoc.loader import Input
+
+# Trees are 0 to 9 tall.
+TREE_HEIGHTS = 10
 
 
 class Point:
@@ -126,127 +134,170 @@ class Tree(Point):
 
 @dataclass(frozen=True)
 class Grid:
-    """Your basic Cartesian grid."""
+    """Your basic Cartesian grid, holding tree heights in an array and
+    making Trees only when asked for one.
+    """
 
-    height: int
-    width: int
-    _grid: Tuple[Tuple[Tree, ...], ...]
+    heights: ArrayGrid
 
     @classmethod
-    def from_rows(cls, rows: Tuple[str, ...]) -> "Grid":
-        height = len(rows)
-        width = len(rows[0]) if height else 0
-        return cls(
-            height,
-            width,
-            tuple(
-                tuple(
-                    Tree(y=y, x=x, height=int(height)) for x, height in enumerate(row)
-                )
-                for y, row in enumerate(rows)
-            ),
-        )
+    def from_rows(cls, rows: Sequence[str]) -> "Grid":
+        return cls(ArrayGrid(ArrayGrid.from_rows(rows).cells - ord("0")))
+
+    @classmethod
+    def from_input(cls, data: Input) -> "Grid":
+        return cls(ArrayGrid(ArrayGrid.from_input(data).cells - ord("0")))
+
+    @property
+    def height(self) -> int:
+        return self.heights.height
+
+    @property
+    def width(self) -> int:
+        return self.heights.width
 
     def __getitem__(self, coordinates: Tuple[int, int]) -> Tree:
         y, x = coordinates
-        return self._grid[y][x]
+        return Tree(y=y, x=x, height=int(self.heights[y, x]))
 
-    def __iter__(self):
-        return iter([tree for row in self._grid for tree in row])
+    def __iter__(self) -> Iterator[Tree]:
+        return (self[y, x] for y, x in self.heights.positions())
 
 
 @dataclass
 class Surveyor:
-    """Person checking sight lines for visible trees."""
+    """Person checking sight lines for visible trees.
+
+    Each sight line is surveyed for every tree at once by sweeping across
+    the grid a column at a time, looking back the way it came. The sweeps
+    are made once, and checking a single tree reads its results.
+    """
 
     grid: Grid
+    _sight_lines: Optional[List[Tuple[np.ndarray, np.ndarray]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def survey(self) -> Tree:
         """Return the tree with the best view of other trees."""
-        for tree in self.grid:
-            self.check_scenic_score(tree)
+        north, east, south, west = self.viewing_distances()
+        scores = north * east * south * west
+        y, x = np.unravel_index(np.argmax(scores), scores.shape)
 
-        return max(self.grid, key=lambda t: t.scenic_score)
+        tree = self.grid[int(y), int(x)]
+        self.check_scenic_score(tree)
+        return tree
 
     def check_scenic_score(self, tree: Tree) -> None:
-        for i in range(tree.y - 1, -1, -1):
-            if tree.height > self.grid[i, tree.x].height:
-                tree.viewing_distance_north += 1
-            else:
-                tree.viewing_distance_north += 1
-                break
-
-        for i in range(tree.y + 1, self.grid.height):
-            if tree.height > self.grid[i, tree.x].height:
-                tree.viewing_distance_south += 1
-            else:
-                tree.viewing_distance_south += 1
-                break
-
-        for i in range(tree.x - 1, -1, -1):
-            if tree.height > self.grid[tree.y, i].height:
-                tree.viewing_distance_west += 1
-            else:
-                tree.viewing_distance_west += 1
-                break
-
-        for i in range(tree.x + 1, self.grid.width):
-            if tree.height > self.grid[tree.y, i].height:
-                tree.viewing_distance_east += 1
-            else:
-                tree.viewing_distance_east += 1
-                break
+        """Record how far a tree can see in each direction."""
+        north, east, south, west = self.viewing_distances()
+        tree.viewing_distance_north = int(north[tree.position])
+        tree.viewing_distance_east = int(east[tree.position])
+        tree.viewing_distance_south = int(south[tree.position])
+        tree.viewing_distance_west = int(west[tree.position])
 
     def count_visible(self) -> int:
-        visible_trees = self.survey_perimeter() | self.survey_inner_trees()
-        return len(visible_trees)
+        return int(np.count_nonzero(self.visible()))
 
     def survey_perimeter(self) -> Set[Tuple[int, int]]:
-        visible_trees = set()
-        # Perimeter is visible.
-        for i in range(self.grid.width):
-            visible_trees.add((0, i))  # top
-            visible_trees.add((i, 0))  # left
-            visible_trees.add((self.grid.width - 1, i))  # bottom
-            visible_trees.add((i, self.grid.width - 1))  # right
-
-        return visible_trees
+        """Return the positions of the trees on the edge of the grid,
+        which are all visible.
+        """
+        edge = np.zeros(self.grid.heights.shape, dtype=bool)
+        edge[:1] = edge[-1:] = edge[:, :1] = edge[:, -1:] = True
+        return positions(edge)
 
     def survey_inner_trees(self) -> Set[Tuple[int, int]]:
-        inner_height, inner_length = self.grid.height - 1, self.grid.width - 1
-        return set(
-            visible_tree.position
-            for y in range(1, inner_height)
-            for x in range(1, inner_length)
-            if (visible_tree := self.check_sight_lines(y, x))
-        )
+        """Return the positions of the visible trees inside the edge."""
+        inner = np.zeros(self.grid.heights.shape, dtype=bool)
+        inner[1:-1, 1:-1] = True
+        return positions(self.visible() & inner)
 
     def check_sight_lines(self, y: int, x: int) -> Optional[Tree]:
-        tree = self.grid[y, x]
-        return (
-            self.check_sight_line(tree, set(self.grid[y, i] for i in range(0, x)))
-            or self.check_sight_line(
-                tree, set(self.grid[y, i] for i in range(x + 1, self.grid.width))
-            )
-            or self.check_sight_line(tree, set(self.grid[i, x] for i in range(0, y)))
-            or self.check_sight_line(
-                tree, set(self.grid[i, x] for i in range(y + 1, self.grid.height))
-            )
-            or None
-        )
+        """Return the tree at a position if it's visible from outside the
+        grid.
+        """
+        if any(visible[y, x] for visible, _ in self.sight_lines()):
+            return self.grid[y, x]
+        return None
 
     def check_sight_line(self, tree: Tree, trees: Set[Tree]) -> Optional[Tree]:
-        if all(tree > left_tree for left_tree in trees):
+        """Return a tree if it's taller than all of some others."""
+        if all(tree > other_tree for other_tree in trees):
             return tree
         return None
 
+    def visible(self) -> np.ndarray:
+        """Return which trees can be seen from outside the grid."""
+        return np.logical_or.reduce([visible for visible, _ in self.sight_lines()])
+
+    def viewing_distances(self) -> List[np.ndarray]:
+        """Return how far each tree can see north, east, south, and west."""
+        return [distance for _, distance in self.sight_lines()]
+
+    def sight_lines(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Return whether each tree is visible from, and how far it can
+        see toward, the north, east, south, and west edges.
+        """
+        if self._sight_lines is not None:
+            return self._sight_lines
+        heights = self.grid.heights.cells
+        # Turn the grid so each edge is on the left, sweep it, and turn
+        # the results back.
+        turns = (
+            (lambda a: a.T, lambda a: a.T),
+            (lambda a: a[:, ::-1], lambda a: a[:, ::-1]),
+            (lambda a: a.T[:, ::-1], lambda a: a[:, ::-1].T),
+            (lambda a: a, lambda a: a),
+        )
+        lines = []
+        for turn, unturn in turns:
+            visible, distance = look_west(turn(heights))
+            lines.append((unturn(visible), unturn(distance)))
+        self._sight_lines = lines
+        return lines
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_08.txt") as data:
-        rows = tuple(line[:-1] for line in data)
 
-        grid = Grid.from_rows(rows)
-        surveyor = Surveyor(grid)
+def positions(mask: np.ndarray) -> Set[Tuple[int, int]]:
+    """Return the positions of the cells set in a mask."""
+    return {(int(y), int(x)) for y, x in np.argwhere(mask)}
+
+
+def look_west(heights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return whether each tree is visible from the left edge, and how
+    many trees it can see toward it.
+    """
+    height, width = heights.shape
+    visible = np.zeros(heights.shape, dtype=bool)
+    distance = np.zeros(heights.shape, dtype=np.int64)
+    tallest = np.full(height, -1, dtype=np.int64)
+    # The column of the nearest tree so far at least as tall as each
+    # height, or of the edge if there is none.
+    blocker = np.zeros((height, TREE_HEIGHTS), dtype=np.int64)
+    rows = np.arange(height)
+    levels = np.arange(TREE_HEIGHTS)
+
+    for x in range(width):
+        column = heights[:, x].astype(np.int64)
+        visible[:, x] = column > tallest
+        np.maximum(tallest, column, out=tallest)
+        distance[:, x] = x - blocker[rows, column]
+        blocker[levels <= column[:, None]] = x
+    return visible, distance
 
-        print(f"Part One: {surveyor.count_visible()}")
-        print(f"Part Two: {surveyor.survey().scenic_score}")
+
+def part_one(data: TextIO) -> int:
+    """Return how many trees are visible from outside the grid."""
+    return Surveyor(Grid.from_input(data)).count_visible()
+
+
+def part_two(data: TextIO) -> int:
+    """Return the highest scenic score of any tree."""
+    return Surveyor(Grid.from_input(data)).survey().scenic_score
+
+
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_08.txt") as data:
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
@@ -89,7 +89,7 @@ series of motions. Each knot further down the rope follows the knot in
 front of it using the same rules as before.
 """
 from dataclasses import dataclass, field
-from typing import Iterator, List, Tuple
+from typing import Iterator, List, TextIO, Tuple
 
 
 @dataclass
@@ -178,9 +178,18 @@ class Rope:
         return new_y, new_x
 
 
+def part_one(data: TextIO) -> int:
+    """Return how many positions the tail of a short rope visits."""
+    return Rope().move(tuple(line[:-1] for line in data))
+
+
+def part_two(data: TextIO) -> int:
+    """Return how many positions the tail of a ten-knot rope visits."""
+    return Rope(10).move(tuple(line[:-1] for line in data))
+
+
 if __name__ == "__main__":
     with open("aoc_2022/inputs/day_09.txt") as data:
-        motions = tuple(line[:-1] for line in data)
-
-    print(f"Part One: {Rope().move(motions)}")
-    print(f"Part Two: {Rope(10).move(motions)}")
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
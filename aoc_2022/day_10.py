@@ -93,7 +93,7 @@ pixel dark (.).
 Render the image given by your program. What eight capital letters appear on your CRT?
 """
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, TextIO, Tuple
 
 
 def noop(strength: str = "0") -> List[int]:
@@ -175,10 +175,20 @@ class CPU:
         self.register += signal
 
 
-if __name__ == "__main__":
-    with open("aoc_2022/inputs/day_10.txt") as data:
-        instructions = tuple(line[:-1] for line in data)
+def part_one(data: TextIO) -> int:
+    """Return the sum of the key signal strengths."""
+    return CPU().run(tuple(line[:-1] for line in data))
 
+
+def part_two(data: TextIO) -> str:
+    """Return the image rendered on the CRT."""
     cpu = CPU()
-    print(f"Part One: {cpu.run(instructions)}")
-    print(f"Part Two:\n{cpu.crt}")
+    cpu.run(tuple(line[:-1] for line in data))
+    return str(cpu.crt)
+
+
+if __name__ == "__main__":
+    with open("aoc_2022/inputs/day_10.txt") as data:
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two:\n{part_two(data)}")
@@ -351,7 +351,7 @@ import json
 from collections import deque
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Deque, Dict, List, Tuple, TypedDict
+from typing import Deque, Dict, List, TextIO, Tuple, TypedDict
 
 
 class Operation(TypedDict):
@@ -486,11 +486,19 @@ class MonkeyBusinessCalculator:
                 self.tracker[monkey.name] += 1
 
 
+def part_one(data: TextIO) -> int:
+    """Return the monkey business after 20 rounds."""
+    return MonkeyBusinessCalculator.build(json.load(data)).calculate()
+
+
+def part_two(data: TextIO) -> int:
+    """Return the monkey business after 10000 unrelieved rounds."""
+    calculator = MonkeyBusinessCalculator.build(json.load(data))
+    return calculator.calculate(10000, divide_by_3=False)
+
+
 if __name__ == "__main__":
     with open("aoc_2022/inputs/day_11.json") as data:
-        monkey_defs = json.load(data)
-
-    calculator = MonkeyBusinessCalculator.build(monkey_defs)
-    print(f"Part One: {calculator.calculate()}")
-    calculator = MonkeyBusinessCalculator.build(monkey_defs)
-    print(f"Part Two: {calculator.calculate(10000, divide_by_3=False)}")
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
@@ -43,12 +43,21 @@ What is the fewest steps required to move starting from any square with
 elevation a to the location that should get the best signal?
 """
 from dataclasses import dataclass, field
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from aoc.grid import ArrayGrid
+from aoc.loader import Input
 
 CHAR_TO_HEIGHT_MAP = {
     c: n
     for n, c in list(enumerate("abcdefghijklmnopqrstuvwxyz")) + [(0, "S"), (25, "E")]
 }
+# The elevation of every byte value, for looking up a whole grid at once.
+ELEVATIONS = np.zeros(256, dtype=np.int16)
+for character, elevation in CHAR_TO_HEIGHT_MAP.items():
+    ELEVATIONS[ord(character)] = elevation
 
 
 class Cell:
@@ -79,6 +88,15 @@ class Cell:
     def __str__(self) -> str:
         return self.height
 
+    def __eq__(self, other: object) -> bool:
+        """Cells are the same square if they share a place and height."""
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return (self.y, self.x, self.height) == (other.y, other.x, other.height)
+
+    def __hash__(self) -> int:
+        return hash((self.y, self.x, self.height))
+
     def __xor__(self, other: "Cell") -> bool:
         """Return if one can move from cell to other."""
         return CHAR_TO_HEIGHT_MAP[self.height] >= CHAR_TO_HEIGHT_MAP[other.height] - 1
@@ -100,125 +118,138 @@ class Cell:
         )
 
 
+def can_climb(here: np.ndarray, there: np.ndarray) -> np.ndarray:
+    """Return where one can move from squares here to squares there."""
+    return ELEVATIONS[there] <= ELEVATIONS[here] + 1
+
+
 @dataclass
 class Terrain:
-    """Heightmap to my destination."""
+    """Heightmap to my destination.
+
+    The heightmap is kept as an array of height characters. Cells are
+    made when asked for, linked to the squares around them.
+    """
 
-    grid: List[List[Cell]]
+    grid: ArrayGrid
     start: Cell
     end: Cell
 
     def __post_init__(self) -> None:
-        for cell in self:
-            self.link(cell)
+        self.link(self.start)
+        self.link(self.end)
 
     @classmethod
-    def from_input(cls, heightmap: Tuple[Tuple[str, ...], ...]) -> "Terrain":
+    def from_input(cls, heightmap: Sequence[Sequence[str]]) -> "Terrain":
         """Draw the terrain from the heightmap input."""
-        grid: List[List[Cell]] = []
-        for y, row in enumerate(heightmap):
-            grid.append([])
-            for x, height in enumerate(row):
-                cell = Cell(y, x, height)
-                if height == "S":
-                    start = cell
-                if height == "E":
-                    end = cell
-                grid[y].append(cell)
-
-        return cls(grid, start, end)
+        return cls.from_grid(ArrayGrid.from_rows(heightmap))
+
+    @classmethod
+    def from_grid(cls, grid: ArrayGrid) -> "Terrain":
+        """Draw the terrain from a grid of height characters."""
+        start, end = (
+            np.argwhere(grid.cells == ord(height))[0] for height in ("S", "E")
+        )
+        return cls(
+            grid,
+            Cell(int(start[0]), int(start[1]), "S"),
+            Cell(int(end[0]), int(end[1]), "E"),
+        )
 
     def __getitem__(self, position: Tuple[int, int]) -> Optional[Cell]:
         """Return a cell for the given position if it exists."""
-        y, x = position
-        if y < 0 or y >= len(self.grid):
-            return None
-
-        if x < 0 or x >= len(self.grid[0]):
-            return None
-
-        return self.grid[y][x]
+        cell = self._cell(position)
+        if cell is not None:
+            self.link(cell)
+        return cell
 
     def __iter__(self) -> Iterator[Cell]:
         """Return each cell of the grid."""
-        return iter(cell for row in self.grid for cell in row)
+        return (self[position] for position in self.grid.positions())  # type: ignore
 
     def __str__(self) -> str:
-        return "\n".join(" ".join(str(cell) for cell in row) for row in self.grid)
+        return "\n".join(" ".join(row) for row in str(self.grid).splitlines())
 
     def link(self, cell: Cell) -> None:
         """Configure directions."""
         row, column = cell
 
-        cell.north = self[row - 1, column]
-        cell.south = self[row + 1, column]
-        cell.east = self[row, column + 1]
-        cell.west = self[row, column - 1]
+        cell.north = self._cell((row - 1, column))
+        cell.south = self._cell((row + 1, column))
+        cell.east = self._cell((row, column + 1))
+        cell.west = self._cell((row, column - 1))
+
+    def _cell(self, position: Tuple[int, int]) -> Optional[Cell]:
+        if position not in self.grid:
+            return None
+        y, x = position
+        return Cell(y, x, chr(self.grid[y, x]))
 
 
 @dataclass
 class Dijkstra:
-    """Walk a terrain to find the shortest route to the end."""
-
-    paths: Dict[Tuple[int, int], int] = field(default_factory=dict)
-
-    def walk(self, terrain: Terrain) -> int:
-        """Return fewest steps to move from start to end of terrain."""
-        self.paths[terrain.start.coordinates] = 0
+    """Walk a terrain to find the shortest route to the end.
 
-        frontier = [terrain.start]
-        while frontier:
-            new_frontier = []
+    Every square is an equal step away, so this is a breadth-first
+    search over the whole grid at once.
+    """
 
-            for cell in frontier:
-                for link in cell.links:
-                    if link.coordinates in self.paths:
-                        continue
+    steps: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=int))
 
-                    self.paths[link.coordinates] = self.paths[cell.coordinates] + 1
-                    new_frontier.append(link)
+    @property
+    def paths(self) -> Dict[Tuple[int, int], int]:
+        """Return the fewest steps to each square the last search reached."""
+        return {
+            (int(y), int(x)): int(self.steps[y, x])
+            for y, x in np.argwhere(self.steps >= 0)
+        }
 
-            frontier = new_frontier
+    def walk(self, terrain: Terrain) -> int:
+        """Return fewest steps to move from start to end of terrain."""
+        sources = np.zeros(terrain.grid.shape, dtype=bool)
+        sources[terrain.start.coordinates] = True
+        targets = np.zeros(terrain.grid.shape, dtype=bool)
+        targets[terrain.end.coordinates] = True
 
-        return self.paths[terrain.end.coordinates]
+        self.steps = terrain.grid.distances(sources, can_climb, targets)
+        return self._shortest(targets)
 
     def run(self, terrain: Terrain) -> int:
         """Start from E and find the first a or S for shortest path."""
-        terrain.start = terrain.end
-        self.paths = {}
-        self.paths[terrain.start.coordinates] = 0
+        sources = np.zeros(terrain.grid.shape, dtype=bool)
+        sources[terrain.end.coordinates] = True
+        targets = ELEVATIONS[terrain.grid.cells] == 0
+
+        # Retrace the climb: step down to anywhere that could climb here.
+        self.steps = terrain.grid.distances(
+            sources, lambda here, there: can_climb(there, here), targets
+        )
+        return self._shortest(targets)
+
+    def _shortest(self, targets: np.ndarray) -> int:
+        reached = self.steps[targets & (self.steps >= 0)]
+        if not reached.size:
+            raise ValueError("No route reaches the destination.")
+        return int(reached.min())
 
-        frontier = [terrain.start]
-        while frontier:
-            new_frontier: List[Cell] = []
 
-            for cell in frontier:
-                for link in tuple(
-                    neighbor for neighbor in cell.neighbors if neighbor ^ cell
-                ):
-                    if link.coordinates in self.paths:
-                        continue
+def read_heightmap(data: Input) -> ArrayGrid:
+    """Return the heightmap as a grid of height characters."""
+    return ArrayGrid.from_input(data)
 
-                    self.paths[link.coordinates] = self.paths[cell.coordinates] + 1
-                    new_frontier.append(link)
 
-            for cell in new_frontier:
-                if cell.height in {"a", "S"}:
-                    answer = cell
-                    new_frontier = []
-                    break
+def part_one(data: TextIO) -> int:
+    """Return the fewest steps from the start to the end."""
+    return Dijkstra().walk(Terrain.from_grid(read_heightmap(data)))
 
-            frontier = new_frontier
 
-        return self.paths[answer.coordinates]
+def part_two(data: TextIO) -> int:
+    """Return the fewest steps from any lowest square to the end."""
+    return Dijkstra().run(Terrain.from_grid(read_heightmap(data)))
 
 
 if __name__ == "__main__":
     with open("aoc_2022/inputs/day_12.txt") as data:
-        grid = tuple(tuple(height for height in line[:-1]) for line in data)
-
-    terrain = Terrain.from_input(grid)
-    dijkstra = Dijkstra()
-
-    print(f"Part One: {dijkstra.walk(terrain)}")
-    print(f"Part Two: {dijkstra.run(terrain)}")
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
@@ -93,7 +93,9 @@ key for the distress signal?
 """
 import json
 from itertools import zip_longest
-from typing import Optional
+from typing import Optional, TextIO
+
+from aoc.loader import blocks
 
 
 def validate(left, right) -> Optional[bool]:
@@ -138,8 +140,6 @@ def sort(pairs):
     for pair in pairs:
         for packet in pair:
             for index in range(len(sorted_signal)):
-                print(index)
-                print(sorted_signal)
                 sorted_packet = sorted_signal.pop(index)
                 if validate(packet, sorted_packet):
                     sorted_signal.insert(index, packet)
@@ -148,8 +148,6 @@ def sort(pairs):
                 else:
                     sorted_signal.insert(index, sorted_packet)
 
-    for item in sorted_signal:
-        print(item)
     return [
         index + 1
         for index in range(len(sorted_signal))
@@ -163,15 +161,23 @@ def sort(pairs):
     ]
 
 
+def read_pairs(data: TextIO):
+    """Return the packets grouped into pairs."""
+    return [[json.loads(packet) for packet in pair] for pair in blocks(data)]
+
+
+def part_one(data: TextIO) -> int:
+    """Return the sum of the indices of pairs in the right order."""
+    return compare(read_pairs(data))
+
+
+def part_two(data: TextIO) -> int:
+    """Return the decoder key for the distress signal."""
+    return sort(read_pairs(data))
+
+
 if __name__ == "__main__":
     with open("aoc_2022/inputs/day_13.txt") as data:
-        pairs = [[]]  # type: ignore
-        for line in data:
-            try:
-                packet = json.loads(line)
-                pairs[-1].append(packet)
-            except json.JSONDecodeError:
-                pairs.append([])
-
-    print(f"Part One: {compare(pairs)}")
-    print(f"Part Two: {sort(pairs)}")
+        print(f"Part One: {part_one(data)}")
+        data.seek(0)
+        print(f"Part Two: {part_two(data)}")
@@ -32,7 +32,7 @@ now need to recover. On each line, the calibration value can be found by
 combining the first digit and the last digit (in that order) to form a
 single two-digit number.
 """
-from typing import Callable, Sequence
+from typing import Callable, Iterable, TextIO
 
 
 def digits(calibration: str) -> int:
@@ -60,13 +60,25 @@ def enhanced_digits(calibration: str) -> int:
     return int(numbers[0] + numbers[-1])
 
 
-def main(calibrations: Sequence[str], digit_func: Callable[[str], int] = digits) -> int:
+def main(calibrations: Iterable[str], digit_func: Callable[[str], int] = digits) -> int:
+    """Return the sum of calibration values, reading them one at a time."""
     return sum(digit_func(calibration) for calibration in calibrations)
 
 
+def part_one(data: TextIO) -> int:
+    """Return the sum of the calibration values."""
+    return main(data)
+
+
+def part_two(data: TextIO) -> int:
+    """Return the sum of the calibration values, including spelled-out
+    digits.
+    """
+    return main(data, digit_func=enhanced_digits)
+
+
 if __name__ == "__main__":
     with open("aoc_2023/inputs/day_01.txt") as data:
-        calibrations = [line for line in data]
-
-    print(f"Part 1: {main(calibrations)}")
-    print(f"Part 2: {main(calibrations, digit_func=enhanced_digits)}")
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
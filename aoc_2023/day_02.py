@@ -60,7 +60,7 @@ For each game, find the minimum set of cubes that must have been present. What i
 
 """
 from dataclasses import dataclass
-from typing import Sequence, Tuple
+from typing import Sequence, TextIO, Tuple
 
 RED_LIMIT = 12
 GREEN_LIMIT = 13
@@ -152,14 +152,18 @@ def sum_power_possibilities(games: Sequence[CubeGame]) -> int:
     )
 
 
-if __name__ == "__main__":
-    with open("aoc_2023/inputs/day_02.txt") as data:
-        records = [line for line in data]
+def part_one(data: TextIO) -> int:
+    """Return the sum of the IDs of the possible games."""
+    return sum_possibilities([CubeGame.from_record(record) for record in data])
+
 
-    games = [CubeGame.from_record(record) for record in records]
+def part_two(data: TextIO) -> int:
+    """Return the sum of the power of each game's minimum set of cubes."""
+    return sum_power_possibilities([CubeGame.from_record(record) for record in data])
 
-    sum_of_possibilities = sum_possibilities(games)
-    print(f"Part 1: {sum_of_possibilities}")
 
-    sum_of_the_power_of_possibilities = sum_power_possibilities(games)
-    print(f"Part 2: {sum_of_the_power_of_possibilities}")
+if __name__ == "__main__":
+    with open("aoc_2023/inputs/day_02.txt") as data:
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
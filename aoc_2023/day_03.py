@@ -30,18 +30,19 @@ What is the sum of all of the part numbers in the engine schematic?
 """
 import re
 from collections import namedtuple
-from typing import Dict, List, Sequence, Set
+from typing import Dict, List, Sequence, Set, TextIO
+
+import numpy as np
+
+from aoc.grid import ArrayGrid
 
 Point = namedtuple("Point", ("x", "y"))
 
 
 def collect_symbols(schematic: Sequence[str]) -> Dict[Point, List[int]]:
-    return {
-        Point(x, y): []
-        for x in range(len(schematic))
-        for y in range(len(schematic))
-        if schematic[x][y] not in "0123456789."
-    }
+    cells = ArrayGrid.from_rows(schematic).cells
+    symbols = ~np.isin(cells, np.frombuffer(b"0123456789.", dtype=np.uint8))
+    return {Point(int(x), int(y)): [] for x, y in np.argwhere(symbols)}
 
 
 def collect_parts(
@@ -72,11 +73,24 @@ def sum_gear_ratios(parts_map: Dict[Point, List[int]]) -> int:
     return sum(parts[0] * parts[1] for parts in parts_map.values() if len(parts) == 2)
 
 
+def read_parts(data: TextIO) -> Dict[Point, List[int]]:
+    """Return the part numbers adjacent to each symbol."""
+    schematic = tuple(line for line in data)
+    return collect_parts(collect_symbols(schematic), schematic)
+
+
+def part_one(data: TextIO) -> int:
+    """Return the sum of all part numbers."""
+    return sum_parts(read_parts(data))
+
+
+def part_two(data: TextIO) -> int:
+    """Return the sum of all gear ratios."""
+    return sum_gear_ratios(read_parts(data))
+
+
 if __name__ == "__main__":
     with open("aoc_2023/inputs/day_03.txt") as data:
-        schematic = tuple(line for line in data)
-
-    symbols_map = collect_symbols(schematic)
-    parts_map = collect_parts(symbols_map, schematic)
-    print(f"Part 1: {sum_parts(parts_map)}")
-    print(f"Part 1: {sum_gear_ratios(parts_map)}")
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
@@ -91,7 +91,7 @@ scratchcards are won. Including the original set of scratchcards, how
 many total scratchcards do you end up with?
 """
 from dataclasses import dataclass
-from typing import Sequence, Set
+from typing import Sequence, Set, TextIO
 
 
 @dataclass(frozen=True)
@@ -144,10 +144,19 @@ def tabulate_tickets(
     )
 
 
+def part_one(data: TextIO) -> int:
+    """Return how many points the scratchcards are worth."""
+    return sum_tickets(tuple(Scratchcard.from_ticket(ticket) for ticket in data))
+
+
+def part_two(data: TextIO) -> int:
+    """Return how many scratchcards are won in total."""
+    scratchcards = tuple(Scratchcard.from_ticket(ticket) for ticket in data)
+    return tabulate_tickets(scratchcards, scratchcards)
+
+
 if __name__ == "__main__":
     with open("aoc_2023/inputs/day_04.txt") as data:
-        tickets = tuple(line for line in data)
-
-    scratchcards = tuple(Scratchcard.from_ticket(ticket) for ticket in tickets)
-    print(f"Part 1: {sum_tickets(scratchcards)}")
-    print(f"Part 2: {tabulate_tickets(scratchcards, scratchcards)}")
+        print(f"Part 1: {part_one(data)}")
+        data.seek(0)
+        print(f"Part 2: {part_two(data)}")
@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(text):
+        path = tmp_path / "input.txt"
+        path.write_text(text)
+        return path
+
+    return write
+
+
+@pytest.fixture
+def calories(tmp_path):
+    path = tmp_path / "calories.txt"
+    path.write_text("1000\n2000\n\n4000\n\n")
+    return path
@@ -0,0 +1,72 @@
+import pytest
+
+from aoc import bench
+from aoc.bench import Baseline, Benchmark, Comparison, Result
+
+
+def test_run_times_every_repeat_with_a_fresh_setup():
+    setups = []
+
+    def setup():
+        setups.append(None)
+        return lambda: [0] * 1000
+
+    result = bench.run(Benchmark("example", setup, repeat=3))
+
+    # One setup per timed repeat, plus one for tracing memory.
+    assert len(setups) == 4
+    assert 0 <= result.best <= result.median <= result.p90
+    assert result.peak_memory > 0
+    assert result.calibration > 0
+
+
+def test_comparison_flags_slower_or_bigger_results():
+    assert not Comparison("same", 1.0, 1.0).regressed(0.25)
+    assert not Comparison("noisy", 1.2, 0.9).regressed(0.25)
+    assert Comparison("slower", 1.3, 1.0).regressed(0.25)
+    assert Comparison("bigger", 1.0, 1.3).regressed(0.25)
+
+
+def test_baseline_compares_relative_to_calibration():
+    baseline = Baseline({"example": Result(0.1, 0.12, 0.09, 1000, 0.01)})
+
+    # Twice as slow on a machine that is twice as slow is no change.
+    comparison = baseline.compare("example", Result(0.2, 0.2, 0.2, 1000, 0.02))
+
+    assert comparison.time_ratio == pytest.approx(1.0)
+    assert comparison.memory_ratio == pytest.approx(1.0)
+
+
+def test_results_keep_their_own_calibration():
+    baseline = Baseline(
+        {
+            "fast machine": Result(0.1, 0.12, 0.09, 1000, 0.01),
+            "slow machine": Result(0.3, 0.36, 0.27, 1000, 0.03),
+        }
+    )
+    result = Result(0.2, 0.2, 0.2, 1000, 0.02)
+
+    assert baseline.compare("fast machine", result).time_ratio == pytest.approx(1.0)
+    assert baseline.compare("slow machine", result).time_ratio == pytest.approx(1.0)
+
+
+def test_baseline_round_trips_through_a_file(tmp_path):
+    path = tmp_path / "benchmarks.json"
+    baseline = Baseline({"example": Result(0.1, 0.12, 0.09, 1000, 0.01)})
+
+    baseline.save(path)
+
+    assert Baseline.load(path) == baseline
+
+
+def test_select_filters_registered_benchmarks_by_name():
+    selected = bench.select("aoc_2022.day_12")
+    assert [benchmark.name for benchmark in selected] == [
+        "aoc_2022.day_12.Dijkstra.walk"
+    ]
+    assert len(bench.select()) > len(selected)
+
+
+def test_every_stored_baseline_has_a_benchmark():
+    names = {benchmark.name for benchmark in bench.select()}
+    assert set(Baseline.load().results) == names
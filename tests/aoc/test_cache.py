@@ -0,0 +1,90 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+from aoc.cache import ResultCache, first_party_sources
+from aoc.runner import Puzzle, measure
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    return ResultCache(tmp_path / "cache")
+
+
+def test_key_depends_on_part_and_input(result_cache, calories, tmp_path):
+    other = tmp_path / "other.txt"
+    other.write_text("1000\n\n")
+    puzzle = Puzzle(2022, 1)
+
+    key = result_cache.key(puzzle, 1, calories)
+
+    assert key == result_cache.key(puzzle, 1, calories)
+    assert key != result_cache.key(puzzle, 2, calories)
+    assert key != result_cache.key(puzzle, 1, other)
+    assert key != result_cache.key(Puzzle(2022, 2), 1, calories)
+
+
+def test_sources_follow_first_party_imports():
+    sources = first_party_sources("aoc_2022.day_12")
+    assert sorted(sources) == ["aoc.grid", "aoc.loader", "aoc_2022.day_12"]
+    assert sources["aoc.grid"].name == "grid.py"
+
+
+def test_key_depends_on_imported_first_party_modules(
+    result_cache, calories, tmp_path, monkeypatch
+):
+    package = tmp_path / "aoc_1999"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "day_01.py").write_text("from aoc_1999 import helpers\n")
+    helpers = package / "helpers.py"
+    helpers.write_text("import json\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    puzzle = Puzzle(1999, 1)
+
+    key = result_cache.key(puzzle, 1, calories)
+    helpers.write_text("import json  # changed\n")
+
+    assert result_cache.key(puzzle, 1, calories) != key
+    sys.modules.pop("aoc_1999", None)
+
+
+def test_put_and_get_answers(result_cache):
+    assert result_cache.get("missing") is None
+
+    result_cache.put("number", 4000)
+    result_cache.put("text", "FWSHSPJWM")
+
+    assert result_cache.get("number") == 4000
+    assert result_cache.get("text") == "FWSHSPJWM"
+
+
+def test_answers_that_are_not_json_are_skipped(result_cache):
+    result_cache.put("object", object())
+    assert result_cache.get("object") is None
+
+
+def test_evicts_least_recently_used_answers(tmp_path):
+    result_cache = ResultCache(tmp_path / "cache", max_size=30)
+    result_cache.put("first", 1)
+    result_cache.put("second", 2)
+    # Make first the most recently used, then push past the limit.
+    os.utime(result_cache.directory / "second.json", (0, 0))
+    assert result_cache.get("first") == 1
+    result_cache.put("third", 3)
+
+    assert result_cache.get("second") is None
+    assert result_cache.get("first") == 1
+    assert result_cache.get("third") == 3
+
+
+def test_measure_reuses_cached_answers(result_cache, calories):
+    first = measure(Puzzle(2022, 1), 2, calories, cache=result_cache)
+    second = measure(Puzzle(2022, 1), 2, calories, cache=result_cache)
+
+    assert (first.answer, first.cached) == (7000, False)
+    assert (second.answer, second.cached) == (7000, True)
+    assert second.peak_memory is None
@@ -0,0 +1,164 @@
+import json
+
+import pytest
+
+from aoc import bench, cache
+from aoc.bench import Baseline, Result
+from aoc.cli import main
+
+
+@pytest.fixture(autouse=True)
+def result_cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", directory)
+    return directory
+
+
+def test_run_reports_each_part(calories, capsys):
+    assert main(["run", "--year", "2022", "--day", "1", "--input", str(calories)]) == 0
+    output = capsys.readouterr().out
+    assert "2022 day 01 part 1: 4000" in output
+    assert "2022 day 01 part 2: 7000" in output
+
+
+def test_run_reports_json(calories, capsys):
+    main(
+        [
+            "run",
+            "--year",
+            "2022",
+            "--day",
+            "1",
+            "--part",
+            "2",
+            "--input",
+            str(calories),
+            "--json",
+            "--no-memory",
+        ]
+    )
+    (line,) = capsys.readouterr().out.splitlines()
+    report = json.loads(line)
+    assert report["answer"] == 7000
+    assert report["part"] == 2
+    assert report["peak_memory"] is None
+
+
+def test_run_needs_a_single_puzzle_for_an_input(calories):
+    with pytest.raises(SystemExit):
+        main(["run", "--year", "2022", "--input", str(calories)])
+
+
+def test_run_needs_a_matching_puzzle():
+    with pytest.raises(SystemExit):
+        main(["run", "--year", "1999"])
+
+
+def test_generate_writes_an_input(tmp_path):
+    path = tmp_path / "directions.txt"
+    args = ["generate", "--year", "2015", "--day", "3", "--scale", "10"]
+    assert main(args + ["--output", str(path)]) == 0
+    assert len(path.read_text()) == 11
+
+
+def test_generate_needs_a_known_puzzle():
+    with pytest.raises(SystemExit):
+        main(["generate", "--year", "1999", "--day", "1"])
+
+
+def test_bench_saves_and_checks_a_baseline(tmp_path, capsys):
+    path = tmp_path / "benchmarks.json"
+    args = ["bench", "--filter", "aoc_2022.day_06", "--baseline", str(path)]
+
+    assert main(args + ["--save"]) == 0
+    assert main(args + ["--check", "--threshold", "100"]) == 0
+
+    output = capsys.readouterr().out
+    assert "aoc_2022.day_06.Receiver.find_marker" in output
+    assert "time x" in output
+
+
+def test_bench_save_only_replaces_filtered_results(tmp_path, monkeypatch):
+    path = tmp_path / "benchmarks.json"
+    name = "aoc_2022.day_06.Receiver.find_marker"
+    stored = Result(0.1, 0.12, 0.09, 1000, 0.01)
+    Baseline({"other": stored, name: stored}).save(path)
+    args = ["bench", "--baseline", str(path), "--save"]
+
+    # Without a filter, results already in the baseline are kept.
+    benchmarks = bench.select(name)
+    monkeypatch.setattr(bench, "select", lambda pattern: benchmarks)
+    assert main(args) == 0
+    assert Baseline.load(path).results == {"other": stored, name: stored}
+
+    assert main(args + ["--filter", name]) == 0
+    baseline = Baseline.load(path)
+    assert baseline.results["other"] == stored
+    assert baseline.results[name] != stored
+
+
+def test_bench_check_needs_a_baseline(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["bench", "--check", "--baseline", str(tmp_path / "missing.json")])
+
+
+def test_run_all_reports_every_part_and_saves_timings(tmp_path, capsys):
+    path = tmp_path / "timings.json"
+    args = ["run", "--all", "--year", "2022", "--day", "1", "--timings", str(path)]
+
+    assert main(args + ["--json", "--workers", "2"]) == 0
+
+    reports = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert sorted(report["answer"] for report in reports) == [66186, 196804]
+    assert set(json.loads(path.read_text())) == {"2022-01-1", "2022-01-2"}
+
+
+def test_run_all_cannot_take_an_input(calories):
+    with pytest.raises(SystemExit):
+        main(["run", "--all", "--year", "2022", "--day", "1", "--input", str(calories)])
+
+
+def test_run_reuses_answers_unless_told_not_to(calories, capsys, result_cache_dir):
+    args = ["run", "--year", "2022", "--day", "1", "--part", "2"]
+    args += ["--input", str(calories)]
+
+    main(args)
+    main(args)
+    main(args + ["--no-cache"])
+
+    output = capsys.readouterr().out
+    assert output.count("7000") == 3
+    assert output.count("(cached)") == 1
+    assert len(list(result_cache_dir.glob("*.json"))) == 1
+
+
+def test_run_profile_saves_profiles(calories, capsys, tmp_path):
+    directory = tmp_path / "profiles"
+    args = ["run", "--year", "2022", "--day", "1", "--input", str(calories)]
+
+    assert main(args + ["--profile", "--profile-dir", str(directory)]) == 0
+
+    output = capsys.readouterr().out
+    assert "2022 day 01 part 1: 4000" in output
+    assert "Largest allocations" in output
+    assert (directory / "2022-01-2.prof").exists()
+
+
+def test_startup_reports_each_puzzle_and_checks_the_budget(capsys):
+    args = ["startup", "--year", "2022", "--day", "1", "--repeat", "1"]
+
+    assert main(args + ["--check"]) == 0
+    assert main(args + ["--check", "--budget", "0"]) == 1
+
+    output = capsys.readouterr().out
+    assert "2022 day 01: ready in" in output
+    assert "OVER BUDGET" in output
+
+
+def test_bench_times_cold_starts_against_a_budget(tmp_path, capsys):
+    path = tmp_path / "benchmarks.json"
+    args = ["bench", "--filter", "cold_start[2022-01]", "--baseline", str(path)]
+
+    assert main(args) == 0
+
+    assert "aoc.startup.cold_start[2022-01]" in capsys.readouterr().out
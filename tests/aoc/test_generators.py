@@ -0,0 +1,74 @@
+import re
+
+import pytest
+
+from aoc.generators import GENERATORS, generate, write
+from aoc.runner import Puzzle, discover, measure
+from aoc_2015.day_06 import Grid
+from aoc_2022.day_07 import Filesystem
+
+# Solving these takes too long for a unit test no matter the input.
+SLOW_PUZZLES = {(2015, 4), (2015, 6)}
+
+
+def test_every_puzzle_has_a_generator():
+    assert {(p.year, p.day) for p in discover()} == set(GENERATORS)
+
+
+def test_generate_is_repeatable_by_seed():
+    assert "".join(generate(2022, 8, 100, seed=1)) == "".join(
+        generate(2022, 8, 100, seed=1)
+    )
+    assert "".join(generate(2022, 8, 100, seed=1)) != "".join(
+        generate(2022, 8, 100, seed=2)
+    )
+
+
+def test_generate_scales():
+    assert len("".join(generate(2015, 1, 5000))) == 5001
+    assert len(list("".join(generate(2015, 2, 300)).splitlines())) == 300
+    assert len("".join(generate(2022, 8, 10000)).splitlines()) == 100
+
+
+def test_generate_rejects_unknown_puzzles():
+    with pytest.raises(ValueError):
+        generate(1999, 1)
+
+
+@pytest.mark.parametrize(
+    ("year", "day"), sorted(set(GENERATORS) - SLOW_PUZZLES), ids=str
+)
+def test_generated_inputs_are_solvable(year, day, tmp_path, capsys):
+    path = tmp_path / "input.txt"
+    write(year, day, path, scale=20, seed=1)
+
+    for part in (1, 2):
+        assert measure(Puzzle(year, day), part, path).answer is not None
+
+
+def test_generated_secret_key():
+    assert re.fullmatch(r"[a-z]{8}\n", "".join(generate(2015, 4)))
+
+
+def test_generated_light_instructions():
+    instructions = "".join(generate(2015, 6, 50)).splitlines()
+    assert len(instructions) == 50
+    for instruction in instructions:
+        x1, y1, x2, y2, operator = Grid(1)._process_instruction(instruction)
+        assert operator in ("turn_on", "turn_off", "toggle")
+        assert 0 <= x1 <= x2 < 1000
+        assert 0 <= y1 <= y2 < 1000
+
+
+@pytest.mark.parametrize("scale", [1, 1000, 2000])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_generated_filesystem_needs_a_deletion(scale, seed):
+    log = "".join(generate(2022, 7, scale, seed=seed)).splitlines(keepends=True)
+    filesystem = Filesystem.build_from_log(log)
+    assert 70000000 - 30000000 < filesystem.root.size < 70000000
+    assert filesystem.free_storage().size > 0
+
+
+def test_write_streams_to_stdout(capsys):
+    write(2015, 3, scale=10)
+    assert len(capsys.readouterr().out) == 11
@@ -0,0 +1,93 @@
+import io
+
+import numpy as np
+import pytest
+
+from aoc.grid import ArrayGrid, shift
+from aoc.loader import MappedInput
+
+
+def test_grid_can_be_made_from_bytes():
+    grid = ArrayGrid.from_bytes(b"abc\ndef\n\n")
+    assert grid.shape == (2, 3)
+    assert str(grid) == "abc\ndef"
+    assert grid[1, 0] == ord("d")
+
+
+def test_grid_can_be_made_from_rows():
+    assert ArrayGrid.from_rows(["ab\n", "cd\n"]) == ArrayGrid.from_bytes(b"ab\ncd")
+    assert ArrayGrid.from_rows((("a", "b"), ("c", "d"))) == ArrayGrid.from_rows(
+        ["ab", "cd"]
+    )
+    assert ArrayGrid.from_rows([]).shape == (0, 0)
+
+
+def test_grid_reads_the_rest_of_an_input(write):
+    with MappedInput(write("skip\nab\ncd\n")) as data:
+        data.readline()
+        grid = ArrayGrid.from_input(data)
+        assert data.read() == ""
+    assert str(grid) == "ab\ncd"
+    assert ArrayGrid.from_input(io.StringIO("ab\ncd\n")) == grid
+
+
+@pytest.mark.parametrize("text", (b"abc\nde\nfgh", b"ab\ncde", b"abc\nde"))
+def test_grid_rows_must_be_the_same_width(text):
+    with pytest.raises(ValueError):
+        ArrayGrid.from_bytes(text)
+
+
+def test_grid_rectangles_update_in_place():
+    grid = ArrayGrid.full(3, 4)
+    grid.rectangle(0, 1, 1, 2)[...] += 1
+    grid.rectangle(1, 0, 2, 1)[...] ^= 1
+    assert grid.cells.tolist() == [[0, 1, 1, 0], [1, 0, 1, 0], [1, 1, 0, 0]]
+
+
+def test_grid_neighbors_stay_on_the_grid():
+    grid = ArrayGrid.full(2, 2)
+    assert list(grid.neighbors(0, 0)) == [(0, 1), (1, 0)]
+    assert list(grid.neighbors(0, 0, diagonal=True)) == [(0, 1), (1, 0), (1, 1)]
+    assert (2, 0) not in grid
+
+
+def test_shift_fills_the_cells_left_behind():
+    array = np.arange(4).reshape(2, 2)
+    assert shift(array, 1, 0, -1).tolist() == [[-1, -1], [0, 1]]
+    assert shift(array, 0, -1, -1).tolist() == [[1, -1], [3, -1]]
+    assert shift(array, 2, 0, -1).tolist() == [[-1, -1], [-1, -1]]
+
+
+def open_cells(here, there):
+    return there == ord(".")
+
+
+def test_grid_distances_follow_the_move_rule():
+    grid = ArrayGrid.from_rows(["..#", ".##", "..."])
+    steps = grid.distances(grid.cells == 0, open_cells)
+    assert (steps == -1).all()
+
+    sources = np.zeros(grid.shape, dtype=bool)
+    sources[0, 0] = True
+    steps = grid.distances(sources, open_cells)
+    assert steps.tolist() == [[0, 1, -1], [1, -1, -1], [2, 3, 4]]
+
+    targets = np.zeros(grid.shape, dtype=bool)
+    targets[2, 1] = True
+    steps = grid.distances(sources, open_cells, targets)
+    assert steps[2, 1] == 3
+    assert steps[2, 2] == -1
+
+
+def test_grid_distances_follow_a_winding_path():
+    # Walls leave gaps alternately at the bottom and the top, so the
+    # only path snakes down and up every other column.
+    rows = [".#...#...", ".#.#.#.#.", ".#.#.#.#.", ".#.#.#.#.", "...#...#."]
+    grid = ArrayGrid.from_rows(rows)
+    sources = np.zeros(grid.shape, dtype=bool)
+    sources[0, 0] = True
+
+    steps = grid.distances(sources, open_cells)
+    assert steps[0, 8] == 4 * (4 + 2)
+    assert steps.max() == steps[4, 8] == 28
+    assert (steps[grid.cells == ord("#")] == -1).all()
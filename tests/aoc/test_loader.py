@@ -0,0 +1,58 @@
+import io
+import json
+
+import pytest
+
+from aoc.loader import MappedInput, blocks, lines, read_bytes
+
+
+def test_mapped_input_reads_like_a_file(write):
+    with MappedInput(write("first\nsecond\nthird")) as data:
+        assert data.readline() == "first\n"
+        assert list(data) == ["second\n", "third"]
+        data.seek(0)
+        assert data.read(5) == "first"
+        assert data.read() == "\nsecond\nthird"
+
+
+def test_mapped_input_handles_empty_files(write):
+    with MappedInput(write("")) as data:
+        assert data.read() == ""
+        assert list(data) == []
+
+
+def test_mapped_input_loads_json(write):
+    with MappedInput(write('[{"starting": [1, 2]}]\n')) as data:
+        assert json.load(data) == [{"starting": [1, 2]}]
+
+
+def test_lines_drop_newlines(write):
+    with MappedInput(write("a\nb\n")) as data:
+        assert list(lines(data)) == ["a", "b"]
+    assert list(lines(io.StringIO("a\nb"))) == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["1\n2\n\n3\n\n\n4\n", "1\n2\n\n3\n\n\n4", "\n1\n2\n\n3\n\n4\n\n"],
+)
+def test_blocks_split_on_blank_lines(write, text):
+    expected = [["1", "2"], ["3"], ["4"]]
+    with MappedInput(write(text)) as data:
+        assert list(blocks(data)) == expected
+    assert list(blocks(io.StringIO(text))) == expected
+
+
+def test_read_bytes_drops_trailing_whitespace(write):
+    with MappedInput(write("skip\n(()(\n\n")) as data:
+        data.readline()
+        assert read_bytes(data) == b"(()("
+        assert data.read() == ""
+    assert read_bytes(io.StringIO("(()(\n")) == b"(()("
+
+
+def test_read_bytes_shares_the_mapping(write):
+    with MappedInput(write("(()(\n")) as data:
+        view = read_bytes(data)
+        assert isinstance(view, memoryview)
+        assert view.obj is data.buffer
@@ -0,0 +1,28 @@
+from aoc.parallel import load_timings, run_all, save_timings, schedule, timing_key
+from aoc.runner import Measurement, Puzzle
+
+
+def test_schedule_puts_untimed_then_longest_parts_first():
+    quick, slow, new = (Puzzle(2022, 1), 1), (Puzzle(2015, 4), 2), (Puzzle(2023, 4), 1)
+    timings = {timing_key(*quick): 0.01, timing_key(*slow): 8.0}
+
+    assert schedule([quick, slow, new], timings) == [new, slow, quick]
+
+
+def test_timings_round_trip_and_keep_unmeasured_parts(tmp_path):
+    path = tmp_path / "timings.json"
+    assert load_timings(path) == {}
+
+    save_timings([Measurement(2022, 11, 2, 0, 1.5, 1.5)], path)
+    save_timings([Measurement(2022, 1, 1, 0, 0.25, 0.25)], path)
+
+    assert load_timings(path) == {"2022-11-2": 1.5, "2022-01-1": 0.25}
+
+
+def test_run_all_measures_every_job():
+    jobs = [(Puzzle(2022, 1), 1), (Puzzle(2022, 1), 2), (Puzzle(2015, 1), 1)]
+
+    measurements = list(run_all(jobs, workers=2, trace_memory=False))
+
+    answers = {(m.year, m.day, m.part): m.answer for m in measurements}
+    assert answers == {(2022, 1, 1): 66186, (2022, 1, 2): 196804, (2015, 1, 1): 74}
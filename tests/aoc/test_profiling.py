@@ -0,0 +1,56 @@
+import pytest
+
+from aoc.profiling import StackSampler, frame_label, profile
+from aoc.runner import Puzzle
+
+
+def test_profile_solves_the_part_and_saves_its_files(calories, tmp_path):
+    result = profile(Puzzle(2022, 1), 2, calories, top=3)
+
+    assert result.measurement.answer == 7000
+    assert result.measurement.peak_memory > 0
+    assert "part_two" in result.stats_report(5)
+    assert len(result.allocations) <= 3
+
+    paths = result.write(tmp_path / "profiles")
+    names = {path.name for path in paths}
+    assert {"2022-01-2.prof", "2022-01-2.allocations.txt"} <= names
+
+
+def test_profile_keeps_solver_output_off_stdout(calories, monkeypatch, capsys):
+    def noisy(data):
+        print("debugging")
+        return 1000
+
+    monkeypatch.setattr(Puzzle, "solver", lambda self, part: noisy)
+    assert profile(Puzzle(2022, 1), 1, calories).measurement.answer == 1000
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "debugging\n"
+
+
+@pytest.mark.skipif(not StackSampler.available(), reason="needs SIGPROF")
+def test_sampler_collapses_stacks_below_the_root():
+    def busy():
+        return sum(i * i for i in range(300000))
+
+    def root():
+        return busy()
+
+    sampler = StackSampler(root.__code__, interval=0.0005)
+    sampler.start()
+    try:
+        for _ in range(10):
+            root()
+    finally:
+        sampler.stop()
+
+    stacks = sampler.stacks()
+    assert stacks
+    assert all(stack.startswith(frame_label(busy.__code__)) for stack in stacks)
+    assert all(" " not in stack.rsplit(")", 1)[-1] for stack in stacks)
+
+
+def test_frame_label_names_the_function_and_where_it_is():
+    label = frame_label(profile.__code__)
+    assert label.startswith("profile (aoc/profiling.py:")
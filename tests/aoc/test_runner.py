@@ -0,0 +1,94 @@
+import pytest
+
+from aoc.runner import (
+    Measurement,
+    Puzzle,
+    discover,
+    format_bytes,
+    measure,
+    numbered,
+)
+
+
+def test_discover_finds_every_day_module_in_order():
+    puzzles = discover()
+    assert Puzzle(2015, 1) == puzzles[0]
+    assert Puzzle(2022, 11) in puzzles
+    assert puzzles == sorted(puzzles, key=lambda p: (p.year, p.day))
+
+
+def test_discover_filters_by_year_and_day():
+    assert discover(2022, 11) == [Puzzle(2022, 11)]
+    assert discover(2023) == [Puzzle(2023, day) for day in range(1, 5)]
+    assert discover(1999) == []
+
+
+def test_puzzle_knows_its_module_and_input():
+    puzzle = Puzzle(2022, 11)
+    assert puzzle.module_name == "aoc_2022.day_11"
+    assert puzzle.default_input.name == "day_11.json"
+
+
+def test_measure_solves_a_part_from_the_given_input(tmp_path):
+    path = tmp_path / "calories.txt"
+    path.write_text("1000\n2000\n\n4000\n\n")
+
+    measurement = measure(Puzzle(2022, 1), 1, path)
+
+    assert measurement.answer == 4000
+    assert measurement.wall_time >= 0
+    assert measurement.cpu_time >= 0
+    assert measurement.peak_memory > 0
+
+
+def test_measure_can_skip_tracing_memory(tmp_path):
+    path = tmp_path / "calories.txt"
+    path.write_text("1000\n2000\n\n4000\n\n")
+
+    measurement = measure(Puzzle(2022, 1), 2, path, trace_memory=False)
+
+    assert measurement.answer == 7000
+    assert measurement.peak_memory is None
+
+
+def test_measure_keeps_solver_output_off_stdout(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "calories.txt"
+    path.write_text("1000\n")
+
+    def noisy(data):
+        print("debugging")
+        return 1000
+
+    monkeypatch.setattr(Puzzle, "solver", lambda self, part: noisy)
+    assert measure(Puzzle(2022, 1), 1, path).answer == 1000
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "debugging\n"
+
+
+def test_measurement_formats_for_humans():
+    measurement = Measurement(2022, 1, 2, 7000, 1.5, 1.25, 2048)
+    assert str(measurement) == (
+        "2022 day 01 part 2: 7000\n" "  wall 1.5000s, cpu 1.2500s, peak memory 2.0 KiB"
+    )
+
+
+def test_measurement_puts_multiline_answers_on_their_own_lines():
+    measurement = Measurement(2022, 10, 2, "#.\n.#", 1.5, 1.25)
+    assert str(measurement) == (
+        "2022 day 10 part 2:\n#.\n.#\n" "  wall 1.5000s, cpu 1.2500s, peak memory n/a"
+    )
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512.0 B"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
+    assert format_bytes(5 * 1024**3) == "5.0 GiB"
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    (("day_07", 7), ("day_7", None), ("day_007", None), ("day_xy", None)),
+)
+def test_numbered_names_need_every_digit(name, expected):
+    assert numbered(name, "day_", 2) == expected
@@ -0,0 +1,45 @@
+import pytest
+
+from aoc import startup
+from aoc.runner import Puzzle
+from aoc.startup import Import, Startup, parse_import_times
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       174 |        174 |   aoc
+import time:       356 |        356 |     mmap
+import time:      2977 |       3533 |   aoc.loader
+import time:      2703 |       6410 | aoc_2022.day_01
+import time:      1000 |       1000 | json
+"""
+
+
+def test_import_times_are_parsed_in_seconds():
+    imports = parse_import_times("unrelated warning\n" + REPORT)
+
+    assert imports[0] == Import("aoc", 0.000174, 0.000174, 1)
+    assert imports[1] == Import("mmap", 0.000356, 0.000356, 2)
+    assert [module.depth for module in imports] == [1, 2, 1, 0, 0]
+
+
+def test_startup_totals_imports_by_day_and_package():
+    result = Startup(Puzzle(2022, 1), 0.05, parse_import_times(REPORT))
+
+    assert result.import_time == pytest.approx(0.00741)
+    assert result.day_import_time == pytest.approx(0.00641)
+    assert result.heaviest(2) == [
+        ("aoc", pytest.approx(0.003151)),
+        ("aoc_2022", pytest.approx(0.002703)),
+    ]
+    assert "2022 day 01: ready in 50.0 ms" in str(result)
+
+
+def test_measure_keeps_the_fastest_cold_start():
+    result = startup.measure(Puzzle(2022, 1), repeat=2)
+
+    assert result.wall_time > 0
+    assert result.day_import_time > 0
+    # The runner shouldn't import anything only other commands need.
+    names = {module.name for module in result.imports}
+    assert "aoc.bench" not in names
+    assert "aoc.parallel" not in names
@@ -0,0 +1,19 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.workers import default_workers
+
+
+def test_default_workers_is_one_per_cpu():
+    assert default_workers() == (os.cpu_count() or 1)
+
+
+def test_default_workers_is_one_inside_a_pool():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(default_workers).result() == 1
+
+
+def test_default_workers_follows_the_parent_process(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    assert default_workers() == 1
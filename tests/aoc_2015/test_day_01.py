@@ -1,4 +1,21 @@
-from aoc_2015.day_01 import Elevator
+import multiprocessing
+import random
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aoc.loader import MappedInput
+from aoc_2015 import day_01
+from aoc_2015.day_01 import (
+    CompactElevatorHistory,
+    Elevator,
+    FloorIndex,
+    ParallelElevator,
+    VectorElevator,
+    final_floor,
+    floors,
+)
 
 
 def test_elevator_goes_up():
@@ -30,3 +47,200 @@ def test_elevator_keeps_log_of_movements():
         ("(", 2),
         (")", 1),
     )
+
+
+@pytest.mark.parametrize("commands", ("", "(", "))(", "(()(()(", "()())(((", "())"))
+def test_vector_elevator_matches_the_reference(commands):
+    reference, vector = Elevator(), VectorElevator()
+
+    assert vector.execute(commands) == reference.execute(commands)
+    assert final_floor(commands) == reference.floor
+    assert vector.floors.tolist() == [floor for _, floor in reference.history]
+    for floor in (-1, 0, 1, 5):
+        assert vector.first_position(floor) == reference.first_position(floor)
+
+
+def test_vector_elevator_carries_on_from_its_floor():
+    elevator = VectorElevator(floor=2)
+    elevator.execute(b"))")
+    elevator.execute(b")")
+    assert elevator.floor == -1
+    assert elevator.floors.tolist() == [1, 0, -1]
+    assert elevator.first_position(-1) == 3
+
+
+def test_floors_reject_unknown_commands():
+    with pytest.raises(ValueError, match="at position 4"):
+        floors("(()x")
+    with pytest.raises(ValueError):
+        final_floor("(\n")
+
+
+def test_compact_history_matches_the_full_history():
+    commands = "(()))(" * 5000 + "()("
+    full, compact = Elevator(), Elevator(history=CompactElevatorHistory())
+
+    full.execute(commands)
+    compact.execute(commands)
+
+    assert len(compact.history) == len(full.history) == len(commands)
+    assert list(compact.history) == list(full.history)
+    assert compact.history.floors.tolist() == [floor for _, floor in full.history]
+    assert compact.first_position(-1) == full.first_position(-1)
+
+
+def test_compact_history_extends_in_bulk():
+    history = CompactElevatorHistory()
+    history.track("(", 3)
+    history.extend("())(()))((()", 3)
+    history.extend(b"", 3)
+
+    elevator = Elevator(floor=2)
+    elevator.execute("(())(()))((()")
+    assert list(history) == list(elevator.history)
+
+
+def test_compact_history_only_takes_floors_that_follow():
+    history = CompactElevatorHistory()
+    history.track(")", -1)
+    with pytest.raises(ValueError):
+        history.track("(", 1)
+    with pytest.raises(ValueError):
+        history.track("x", 0)
+
+
+def test_compact_history_packs_each_command_into_a_bit():
+    tracemalloc.start()
+    try:
+        history = CompactElevatorHistory()
+        history.extend("()(" * 100_000, 0)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert len(history) == 300_000
+    assert size < 300_000 / 8 * 2
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_parallel_elevator_matches_the_vector_elevator(workers):
+    commands = "((()()))))(((" * 30 + ")" * 400 + "(" * 50
+    vector = VectorElevator(floor=3)
+    parallel = ParallelElevator(floor=3, workers=workers, chunk_size=17)
+
+    assert parallel.execute(commands) == vector.execute(commands)
+    assert len(parallel.chunks) > 1
+    for floor in (-300, -1, 0, 3, 5, 7, 100):
+        assert parallel.first_position(floor) == vector.first_position(floor)
+
+
+def test_parallel_elevator_uses_one_worker_inside_a_pool(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    assert ParallelElevator().workers == 1
+    assert ParallelElevator(workers=2).workers == 2
+
+
+def test_parallel_elevator_reads_chunks_of_a_file(tmp_path):
+    path = tmp_path / "commands.txt"
+    path.write_text("skip(()))())))(((\n")
+    parallel = ParallelElevator(workers=2, chunk_size=4)
+
+    assert parallel.execute_file(path, start=4, end=17) == final_floor("(()))())))(((")
+    assert parallel.first_position(-1) == 5
+
+    parallel.execute("))))")
+    assert parallel.floor == -5
+    assert parallel.first_position(-4) == 10
+    assert parallel.first_position(-5) == 17
+
+
+@pytest.mark.parametrize(
+    "engine", (VectorElevator(), ParallelElevator(workers=1, chunk_size=5))
+)
+def test_elevator_hands_commands_to_its_engine(engine):
+    commands = "((()()))))(((" * 3 + "))"
+    reference, elevator = Elevator(floor=2), Elevator(floor=2, engine=engine)
+
+    assert elevator.execute(commands) == reference.execute(commands)
+    assert elevator.floor == engine.floor
+    assert len(elevator.history) == 0
+    for floor in (-1, 0, 2, 4, 5):
+        assert elevator.first_position(floor) == reference.first_position(floor)
+
+
+def test_elevator_engine_scans_chunks_on_several_workers(monkeypatch):
+    dispatched = []
+
+    class Pool(ProcessPoolExecutor):
+        def map(self, fn, *iterables, **kwargs):
+            chunks = list(iterables[0])
+            dispatched.append((self._max_workers, len(chunks)))
+            return super().map(fn, chunks, **kwargs)
+
+    monkeypatch.setattr(day_01, "ProcessPoolExecutor", Pool)
+    commands = "(()))(" * 50 + ")" * 200
+    reference = Elevator()
+    elevator = Elevator(engine=ParallelElevator(workers=2, chunk_size=32))
+
+    assert elevator.execute(commands) == reference.execute(commands)
+    assert dispatched == [(2, 16)]
+    assert elevator.first_position(-1) == reference.first_position(-1)
+    assert elevator.first_position(-150) == reference.first_position(-150)
+
+
+def test_parts_split_big_inputs_among_processes(tmp_path, monkeypatch):
+    path = tmp_path / "day_01.txt"
+    path.write_text("(())" * 10 + "())" + "(\n")
+    monkeypatch.setattr(day_01, "PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(day_01, "PARALLEL_CHUNK_SIZE", 8)
+
+    with MappedInput(path) as data:
+        assert day_01.part_one(data) == 0
+    with MappedInput(path) as data:
+        assert day_01.part_two(data) == 43
+
+
+def test_floor_index_answers_queries_like_a_brute_force_search():
+    rng = random.Random(1)
+    commands = "".join(rng.choice("(()") for _ in range(1000))
+    walked = floors(commands).tolist()
+    index = FloorIndex.from_commands(commands)
+
+    assert len(index) == 1000
+    assert index.floor_at(1) == walked[0]
+    assert index.floor_at(1000) == walked[-1]
+    for floor in range(min(walked) - 1, max(walked) + 2):
+        positions = [p for p, f in enumerate(walked, start=1) if f == floor]
+        assert index.visits(floor) == len(positions)
+        assert index.positions(floor).tolist() == positions
+        assert index.first_position(floor) == (positions[0] if positions else None)
+    for _ in range(200):
+        start = rng.randint(1, 1000)
+        end = rng.randint(start, 1000)
+        assert index.lowest(start, end) == min(walked[start - 1 : end])
+        assert index.highest(start, end) == max(walked[start - 1 : end])
+    assert index.lowest() == min(walked)
+    assert index.highest() == max(walked)
+
+
+def test_floor_index_builds_from_any_history():
+    full, compact = Elevator(), Elevator(history=CompactElevatorHistory())
+    full.execute("(()))")
+    compact.execute("(()))")
+
+    for history in (full.history, compact.history):
+        index = FloorIndex.from_history(history)
+        assert index.first_position(-1) == 5
+        assert index.visits(1) == 2
+
+
+def test_floor_index_checks_positions():
+    index = FloorIndex.from_commands("")
+    assert index.first_position(0) is None
+    assert index.visits(0) == 0
+
+    index = FloorIndex.from_commands("(()")
+    with pytest.raises(IndexError):
+        index.floor_at(4)
+    with pytest.raises(ValueError):
+        index.lowest(3, 2)
@@ -1,4 +1,16 @@
-from aoc_2015.day_02 import Calculator, Present
+import io
+
+import numpy as np
+import pytest
+
+from aoc_2015.day_02 import (
+    Calculator,
+    Present,
+    PresentBatch,
+    StreamingCalculator,
+    read_present_batch,
+    read_presents,
+)
 
 
 def test_present_knows_dimensions():
@@ -24,3 +36,93 @@ def test_calculator_calculates_needed_ribbon():
     assert Calculator([present]).calculate_ribbon() == 34
     assert Calculator([tall_present]).calculate_ribbon() == 14
     assert Calculator([present, tall_present]).calculate_ribbon() == 48
+
+
+def test_present_batch_measures_each_present():
+    batch = PresentBatch.from_lines(["2x3x4\n", "1x1x10\n"])
+    assert len(batch) == 2
+    assert batch.wrapping_paper().tolist() == [58, 43]
+    assert batch.ribbon().tolist() == [34, 14]
+
+
+def test_present_batch_parses_lines_without_newlines():
+    batch = PresentBatch.from_lines(["2x3x4", "1x1x10"])
+    assert Calculator(batch).calculate_wrapping_paper() == 101
+    assert (
+        Calculator(batch).calculate_wrapping_paper()
+        == Calculator(read_presents(["2x3x4", "1x1x10"])).calculate_wrapping_paper()
+    )
+
+
+def test_calculator_accepts_a_batch_or_a_list():
+    presents = [Present(2, 3, 4), Present(1, 1, 10)]
+    batch = PresentBatch.from_presents(presents)
+    assert list(batch) == presents
+    assert Calculator(batch).calculate_wrapping_paper() == 101
+    assert Calculator(batch).calculate_ribbon() == 48
+
+
+def test_present_batch_agrees_with_present_objects():
+    rng = np.random.default_rng(2)
+    dimensions = [
+        "x".join(map(str, sides)) + "\n" for sides in rng.integers(1, 30, (200, 3))
+    ]
+    presents = Calculator(read_presents(dimensions))
+    batch = Calculator(read_present_batch(io.StringIO("".join(dimensions))))
+    assert batch.calculate_wrapping_paper() == presents.calculate_wrapping_paper()
+    assert batch.calculate_ribbon() == presents.calculate_ribbon()
+
+
+def test_present_batch_parses_nothing():
+    assert len(PresentBatch.from_text("\n")) == 0
+    assert Calculator(PresentBatch.from_text(b"")).calculate_ribbon() == 0
+
+
+@pytest.mark.parametrize(
+    "text", ("2 3 4", "2x3x4\n2x3\n", "2x3x4\n2xAx3\n", "2x3x4x5", "2x3x4\n\n1x1x1")
+)
+def test_present_batch_rejects_malformed_dimensions(text):
+    with pytest.raises(ValueError):
+        PresentBatch.from_text(text)
+
+
+def test_streaming_calculator_keeps_running_totals():
+    calculator = StreamingCalculator().consume(
+        iter(["2x3x4\n", "1x1x10\n", "3x3x3\n"]), batch_size=2
+    )
+    assert calculator.lines_read == 3
+    assert calculator.calculate_wrapping_paper() == 101 + 63
+    assert calculator.calculate_ribbon() == 48 + 39
+    assert (calculator.paper.smallest, calculator.paper.largest) == (43, 63)
+    assert (calculator.ribbon.smallest, calculator.ribbon.largest) == (14, 39)
+    # 43 and 58 have six bits, 63 too; 14 has four, 34 and 39 six.
+    assert calculator.paper.histogram == [0, 0, 0, 0, 0, 0, 3]
+    assert calculator.ribbon.histogram == [0, 0, 0, 0, 1, 0, 2]
+
+
+def test_streaming_calculator_reads_lines_without_newlines():
+    dimensions = ["2x3x4", "1x1x10", "3x3x3"]
+    calculator = StreamingCalculator().consume(iter(dimensions), batch_size=2)
+    assert calculator.calculate_wrapping_paper() == 101 + 63
+    assert calculator.calculate_ribbon() == 48 + 39
+    resumed = StreamingCalculator().consume(dimensions[:1]).resume(dimensions)
+    assert resumed == calculator
+
+
+def test_streaming_calculator_resumes_from_a_checkpoint(tmp_path):
+    dimensions = ["2x3x4\n", "1x1x10\n", "3x3x3\n", "5x1x2\n"]
+    whole = StreamingCalculator().consume(dimensions)
+
+    partial = StreamingCalculator().consume(dimensions[:2])
+    path = tmp_path / "checkpoint.json"
+    partial.save(path)
+    resumed = StreamingCalculator.load(path).resume(iter(dimensions), batch_size=1)
+    assert resumed == whole
+    assert StreamingCalculator.from_checkpoint(whole.checkpoint()) == whole
+
+
+def test_streaming_calculator_starts_empty():
+    calculator = StreamingCalculator().consume([])
+    assert calculator.calculate_wrapping_paper() == 0
+    assert calculator.paper.smallest is None
+    assert calculator.paper.histogram == []
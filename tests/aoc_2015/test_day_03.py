@@ -1,4 +1,20 @@
-from aoc_2015.day_03 import Santa
+import multiprocessing
+import random
+
+import numpy as np
+import pytest
+
+from aoc_2015 import day_03
+from aoc_2015.day_03 import (
+    DeliveryReport,
+    Fleet,
+    Santa,
+    VectorSanta,
+    decode,
+    encode,
+    merge_houses,
+    unique_houses,
+)
 
 
 def test_santa_tracks_his_deliveries():
@@ -14,3 +30,94 @@ def test_revisiting_does_not_increase_locations_visited():
 def test_santa_can_go_in_all_cardinal_directions():
     santa = Santa()
     assert santa.deliver("^>v<") == 4
+
+
+def test_vector_santa_agrees_with_santa():
+    rng = random.Random(3)
+    for directions in [
+        "",
+        ">",
+        "^v^v^v^v^v",
+        "^>v<",
+        "".join(rng.choice("^v<>>") for _ in range(5000)),
+    ]:
+        santa, vector_santa = Santa(), VectorSanta()
+        assert vector_santa.deliver(directions) == santa.deliver(directions)
+        assert vector_santa.tracker == santa.tracker
+
+
+def test_vector_santa_follows_routes_in_chunks(monkeypatch):
+    monkeypatch.setattr(day_03, "DELIVERY_CHUNK_SIZE", 3)
+    santa = VectorSanta()
+    assert santa.deliver(b"^>v<<<") == 6
+    assert santa.deliver("<") == 7
+    assert santa.position == (-3, 0)
+
+
+def test_vector_santa_rejects_unknown_directions():
+    with pytest.raises(ValueError, match="'x' at position 3"):
+        VectorSanta().deliver("^>x")
+
+
+def test_houses_pack_into_one_integer_in_order():
+    x = np.array([-(2**31), -1, 0, 0, 5])
+    y = np.array([2**31 - 1, 7, -(2**31), 0, -2])
+    houses = encode(x, y)
+    assert (np.diff(houses) > 0).all()
+    assert [axis.tolist() for axis in decode(houses)] == [x.tolist(), y.tolist()]
+
+
+def test_unique_houses_sort_spread_out_houses_too():
+    x = np.array([0, 10**6, 0, -(10**6)])
+    y = np.array([0, 3, 0, 3])
+    assert (
+        unique_houses(x, y).tolist()
+        == encode(np.array([-(10**6), 0, 10**6]), np.array([3, 0, 3])).tolist()
+    )
+    assert merge_houses(encode(x[:1], y[:1]), unique_houses(x, y)).tolist() == (
+        unique_houses(x, y).tolist()
+    )
+
+
+def test_fleet_reports_shared_and_exclusive_houses():
+    assert Fleet(2).deliver("^v") == DeliveryReport(
+        houses=3, per_agent=[2, 2], exclusive=[1, 1], shared=1
+    )
+    assert Fleet(2).deliver("^>v<").houses == 3
+    assert Fleet(2).deliver("^v^v^v^v^v").houses == 11
+
+
+def test_fleet_agrees_with_santas_taking_turns():
+    rng = random.Random(18)
+    directions = "".join(rng.choice("^v<>") for _ in range(3000))
+    for agents in (1, 2, 3):
+        santas = [Santa() for _ in range(agents)]
+        for agent, santa in enumerate(santas):
+            santa.deliver(directions[agent::agents])
+        report = Fleet(agents).deliver(directions)
+        assert report.houses == len(set().union(*(s.tracker for s in santas)))
+        assert report.per_agent == [len(s.tracker) for s in santas]
+        assert report.houses == sum(report.exclusive) + report.shared
+
+
+def test_fleet_takes_custom_assignments():
+    def halves(moves, agents):
+        return np.arange(moves) * agents // moves
+
+    assert Fleet(2, assign=halves).deliver(">>>>>>") == DeliveryReport(
+        houses=4, per_agent=[4, 4], exclusive=[0, 0], shared=4
+    )
+
+
+def test_fleet_uses_one_worker_inside_a_pool(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    assert Fleet(3).workers == 1
+    assert Fleet(3, workers=2).workers == 2
+
+
+def test_fleet_tracks_agents_in_worker_processes(monkeypatch):
+    monkeypatch.setattr(day_03, "PARALLEL_THRESHOLD", 0)
+    directions = "".join(random.Random(7).choice("^v<>") for _ in range(500))
+    assert Fleet(3, workers=2).deliver(directions) == Fleet(3, workers=1).deliver(
+        directions
+    )
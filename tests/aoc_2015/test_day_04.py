@@ -1,7 +1,19 @@
 import hashlib
+import multiprocessing
 from unittest.mock import create_autospec
 
-from aoc_2015.day_04 import main
+import pytest
+
+from aoc.workers import default_workers
+from aoc_2015.day_04 import (
+    MultiMiner,
+    ParallelMiner,
+    digest_prefix,
+    main,
+    search_block,
+    search_block_multi,
+    search_block_prefixed,
+)
 
 
 def test_main_finds_number_that_matches_key():
@@ -19,3 +31,95 @@ def test_main_keeps_going_until_a_match():
     number = main("000", secret_key="blah", hash_func=hash_func)
     assert number == 1
     assert hash_func.call_count == 2
+
+
+def test_search_block_finds_the_lowest_number_in_range():
+    assert search_block("000", "abcdef", 0, 10000) == main("000", secret_key="abcdef")
+    assert search_block("000", "abcdef", 0, 10) is None
+
+
+@pytest.mark.parametrize("key", ["000", "00", "0", "a", "ab", "abc", "fe0"])
+def test_prefixed_search_agrees_with_hex_digests(key):
+    assert search_block_prefixed(key, "abcdef", 0, 20000) == search_block(
+        key, "abcdef", 0, 20000
+    )
+
+
+def test_digest_prefix_splits_off_an_odd_nibble():
+    assert digest_prefix("00000") == (b"\0\0", 0)
+    assert digest_prefix("000000") == (b"\0\0\0", None)
+    assert digest_prefix("ab1") == (b"\xab", 1)
+    with pytest.raises(ValueError):
+        digest_prefix("00G")
+    with pytest.raises(ValueError):
+        digest_prefix("AB")
+
+
+def test_parallel_miner_rejects_unknown_engines():
+    with pytest.raises(ValueError):
+        ParallelMiner(engine="sha")
+
+
+def test_parallel_miner_uses_one_worker_inside_a_pool(monkeypatch):
+    assert ParallelMiner().workers == default_workers()
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    assert ParallelMiner().workers == 1
+    assert ParallelMiner(workers=3).workers == 3
+
+
+@pytest.mark.parametrize("engine", ["hex", "prefix"])
+def test_miner_engines_find_the_same_number(engine):
+    miner = ParallelMiner("abcdef", workers=1, block_size=500, engine=engine)
+    assert miner.mine("000") == main("000", secret_key="abcdef")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("block_size", [64, 1000])
+def test_parallel_miner_finds_the_lowest_number(workers, block_size):
+    miner = ParallelMiner("abcdef", workers=workers, block_size=block_size)
+    for key, start in [("000", 0), ("00", 0), ("000", 1000)]:
+        assert miner.mine(key, start) == main(
+            key, sequence_start=start, secret_key="abcdef"
+        )
+
+
+def test_multi_search_finds_every_key_in_one_pass():
+    keys = ["000", "00", "a1", "fff"]
+    assert search_block_multi(keys, "abcdef", 0, 20000) == {
+        key: search_block(key, "abcdef", 0, 20000) for key in keys
+    }
+    assert search_block_multi(["000"], "abcdef", 0, 10) == {}
+
+
+def test_multi_miner_reports_progress():
+    reports = []
+    miner = MultiMiner(["00", "000"], "abcdef")
+    found = miner.search(
+        block_size=1000, on_progress=lambda m: reports.append(m.next_number)
+    )
+    assert found == {key: main(key, secret_key="abcdef") for key in ["00", "000"]}
+    assert reports[:2] == [1000, 2000]
+    assert miner.next_number == miner.hashes == found["000"] + 1
+    assert miner.hash_rate > 0
+    assert miner.remaining == []
+
+
+def test_multi_miner_resumes_from_a_checkpoint(tmp_path):
+    path = tmp_path / "search.json"
+    miner = MultiMiner(["00", "000"], "abcdef")
+    assert miner.search(stop=1500, checkpoint_path=path, block_size=1000) == {
+        "00": main("00", secret_key="abcdef")
+    }
+    resumed = MultiMiner.load(path)
+    assert resumed.next_number == 1500
+    assert resumed.remaining == ["000"]
+    assert resumed.search(checkpoint_path=path, checkpoint_interval=0) == {
+        "00": main("00", secret_key="abcdef"),
+        "000": main("000", secret_key="abcdef"),
+    }
+    assert MultiMiner.load(path).found == resumed.found
+
+
+def test_multi_miner_rejects_keys_no_digest_starts_with():
+    with pytest.raises(ValueError):
+        MultiMiner(["0x"])
@@ -1,7 +1,31 @@
+import io
+import multiprocessing
+import random
+
+import pytest
+
+from aoc.loader import MappedInput
+from aoc_2015 import day_05
 from aoc_2015.day_05 import (
+    FUSED_MAX_LENGTH,
+    PART_TWO_RULES,
+    PART_TWO_VALIDATORS,
+    RULES,
+    VALIDATORS,
+    DoubleLetter,
+    ForbiddenPairs,
+    FusedValidator,
+    RepeatedPair,
+    Rule,
+    SkippedRepeat,
+    ValidationReport,
+    Vowels,
+    chunks,
     main,
+    validate_bulk,
     validate_double_letters,
     validate_pair_of_pairs,
+    validate_report,
     validate_skipped_repeating_letters,
     validate_special_letters,
     validate_vowels,
@@ -66,3 +90,142 @@ def test_main_runs_validators_on_strings_and_returns_number_that_pass():
 def test_main_skips_strings_that_fail_validation():
     good_count = main(["akeddk", "ascolub", "ascolluab"])
     assert good_count == 0
+
+
+def test_main_reads_strings_from_any_iterable():
+    strings = (string for string in ["akeddik", "akeddk"] * 1000)
+    assert main(strings) == 1000
+
+
+def random_strings(count, length=16, letters="abcdepqxyAEz"):
+    rng = random.Random(5)
+    return [
+        "".join(rng.choice(letters) for _ in range(rng.randint(0, length))) + "\n"
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "rule, validate",
+    [
+        (Vowels(), validate_vowels),
+        (DoubleLetter(), validate_double_letters),
+        (ForbiddenPairs(), validate_special_letters),
+        (RepeatedPair(), validate_pair_of_pairs),
+        (SkippedRepeat(), validate_skipped_repeating_letters),
+    ],
+)
+def test_rules_agree_with_validators(rule, validate):
+    fused = FusedValidator([rule])
+    for string in random_strings(500):
+        assert rule(string) == fused(string) == validate(string), string
+
+
+def test_fused_validator_agrees_with_validator_chain():
+    strings = random_strings(2000)
+    assert FusedValidator(RULES).count(strings) == main(strings)
+    assert FusedValidator(PART_TWO_RULES).count(strings) == main(
+        strings, PART_TWO_VALIDATORS
+    )
+    every_rule = FusedValidator(RULES + PART_TWO_RULES)
+    assert every_rule.count(strings) == main(strings, VALIDATORS + PART_TWO_VALIDATORS)
+
+
+def test_rules_take_options():
+    assert Vowels(minimum=1, letters="y")("xyz")
+    assert not Vowels(minimum=2, letters="y")("xyz")
+    assert not ForbiddenPairs(("a.",))("xa.z")
+    assert ForbiddenPairs(("a.",))("xabz")
+
+
+def test_rules_must_implement_fragment_and_check():
+    class Unchecked(Rule):
+        def fragment(self, group: str) -> str:
+            return ""
+
+    with pytest.raises(TypeError):
+        Unchecked()
+
+
+def test_validate_pair_of_pairs_skips_overlapping_pairs():
+    assert not validate_pair_of_pairs("aaa")
+    assert validate_pair_of_pairs("aaaa")
+    assert validate_pair_of_pairs("xyxy")
+    assert not validate_pair_of_pairs("")
+
+
+def test_validators_agree_with_slicing_on_long_strings():
+    def pair_of_pairs(string):
+        return any(string[i : i + 2] in string[i + 2 :] for i in range(len(string)))
+
+    for string in random_strings(50, length=400, letters="abcdefghijklmnopqrstuvwxyz"):
+        assert validate_pair_of_pairs(string) == pair_of_pairs(string)
+    distinct = "".join(map(chr, range(0x4E00, 0x4E00 + 3000)))
+    assert not validate_pair_of_pairs(distinct)
+    assert validate_pair_of_pairs(distinct + distinct[1500:1502])
+    assert not validate_double_letters(distinct)
+    assert not validate_skipped_repeating_letters(distinct)
+
+
+def test_fused_validator_checks_long_strings_rule_by_rule():
+    long_nice = "aei" + "xz" * FUSED_MAX_LENGTH + "zz"
+    assert FusedValidator(RULES)(long_nice)
+    assert not FusedValidator(RULES)(long_nice + "ab")
+    strings = [long_nice, long_nice + "ab", "akeddik"]
+    assert FusedValidator(RULES).count(strings) == main(strings) == 2
+
+
+def test_validation_report_counts_each_rule_and_first_failures():
+    report = validate_report(RULES, ["akeddik", "akedik", "abeddik", "xyz"])
+    assert report == ValidationReport(
+        strings=4,
+        nice=1,
+        passed={"Vowels": 3, "DoubleLetter": 2, "ForbiddenPairs": 2},
+        first_failures={"Vowels": 1, "DoubleLetter": 1, "ForbiddenPairs": 1},
+    )
+    assert report.failed == {"Vowels": 1, "DoubleLetter": 2, "ForbiddenPairs": 2}
+
+
+def test_validation_report_needs_distinct_rule_names():
+    with pytest.raises(ValueError):
+        validate_report([Vowels(), Vowels(minimum=1)], ["a"])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 10**6])
+def test_chunks_split_inputs_on_whole_lines(tmp_path, chunk_size):
+    text = "".join(random_strings(300))
+    path = tmp_path / "strings.txt"
+    path.write_text(text)
+    with MappedInput(path) as data:
+        mapped = list(chunks(data, chunk_size))
+    streamed = list(chunks(io.StringIO(text), chunk_size))
+    assert "".join(mapped) == "".join(streamed) == text
+    assert all(chunk.endswith("\n") for chunk in mapped + streamed)
+
+
+def test_validate_bulk_runs_serially_inside_a_pool(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("started a pool inside a pool worker")
+
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    monkeypatch.setattr(day_05, "ProcessPoolExecutor", no_pool)
+    strings = random_strings(200)
+    report = validate_bulk(io.StringIO("".join(strings)), chunk_size=100)
+    assert report.nice == main(strings)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_bulk_agrees_with_main(workers):
+    strings = random_strings(2000)
+    for rules, validators in [
+        (RULES, VALIDATORS),
+        (PART_TWO_RULES, PART_TWO_VALIDATORS),
+    ]:
+        report = validate_bulk(
+            io.StringIO("".join(strings)), rules, workers=workers, chunk_size=2000
+        )
+        assert report.strings == 2000
+        assert report.nice == main(strings, validators)
+        assert report.strings - report.nice == sum(report.first_failures.values())
+        for rule in rules:
+            assert report.passed[rule.name] == sum(map(rule, strings))
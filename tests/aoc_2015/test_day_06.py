@@ -1,4 +1,8 @@
-from aoc_2015.day_06 import DimmableLight, Grid, Light
+import random
+
+import pytest
+
+from aoc_2015.day_06 import DimmableLight, Grid, Light, VectorGrid
 
 
 def test_light_becomes_active_if_turned_on():
@@ -78,3 +82,51 @@ def test_dimmable_light_toggle_increases_brightness_by_two():
     light = DimmableLight()
     light.toggle()
     assert light.active == 2
+
+
+@pytest.mark.parametrize(
+    "instruction", ["turn on 0,0 through 0,9", "turn on 0,9 through 0,0"]
+)
+def test_vector_grid_draws_like_grid(instruction):
+    grid, vector_grid = Grid(10), VectorGrid(10)
+    assert vector_grid.decorate([instruction]) == grid.decorate([instruction]) == 10
+    assert str(vector_grid) == str(grid)
+
+
+def random_instructions(count, length):
+    rng = random.Random(6)
+    operators = ["turn on", "turn off", "toggle"]
+    return [
+        f"{rng.choice(operators)} {rng.randrange(length)},{rng.randrange(length)}"
+        f" through {rng.randrange(length)},{rng.randrange(length)}\n"
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("bulb_type", [Light, DimmableLight])
+def test_vector_grid_agrees_with_grid(bulb_type):
+    instructions = random_instructions(200, 30)
+    grid = Grid(30, bulb_type=bulb_type)
+    vector_grid = VectorGrid(30, bulb_type=bulb_type)
+    assert vector_grid.decorate(iter(instructions)) == grid.decorate(instructions)
+    assert vector_grid.lights.cells.tolist() == [
+        [light.active for light in column] for column in grid._coordinates
+    ]
+
+
+def test_vector_grid_draws_lit_lights_whatever_their_brightness():
+    grid = VectorGrid(2, bulb_type=DimmableLight)
+    grid.decorate(["toggle 0,0 through 0,0", "turn on 1,1 through 1,1"])
+    assert str(grid) == " *  \n   *\n"
+
+
+def test_vector_grid_dims_lights_no_lower_than_off():
+    grid = VectorGrid(3, bulb_type=DimmableLight)
+    instructions = ["toggle 0,0 through 0,0", "turn off 0,0 through 2,2"]
+    assert grid.decorate(instructions) == 1
+    assert grid.decorate(["turn off 0,0 through 2,2"]) == 0
+
+
+def test_vector_grid_rejects_unknown_instructions():
+    with pytest.raises(ValueError, match="turn around"):
+        VectorGrid(3).decorate(["turn around 0,0 through 1,1"])
@@ -74,3 +74,10 @@ def test_stats_sorts_from_a_calories_list():
     stats = ElfStats.from_calories_list(["3", "3", "\n", "2", "\n", "\n"])
     assert stats.top_elf.total_calories == 6
     assert stats.top_3_calories == 8
+
+
+def test_stats_sort_a_stream_without_a_final_blank_line():
+    calories_list = iter(["1", "", "5\n", "\n", "2", "2"])
+    stats = ElfStats.from_calories_list(calories_list)
+    assert stats.top_elf.total_calories == 5
+    assert stats.top_3_calories == 10
@@ -16,3 +16,13 @@ def test_sort_by_group_finds_common_character_in_group_rucksacks():
         )
         == 18
     )
+
+
+def test_sorts_read_rucksacks_from_any_iterable():
+    rucksacks = [
+        "vJrwpWtwJgWrhcsFMMfFFhFp",
+        "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL",
+        "PmmdzqPrVvPwwTWBwg",
+    ]
+    assert sort(iter(rucksacks)) == 16 + 38 + 42
+    assert sort_by_group(rucksack for rucksack in rucksacks * 2) == 36
@@ -1,3 +1,5 @@
+import tracemalloc
+
 import pytest
 
 from aoc_2022.day_04 import Assignment, assess
@@ -27,3 +29,15 @@ def test_assess_counts_assignments_that_contain_their_pair(pairs, containment_co
 def test_asses_counts_assignments_that_overlap_at_all(pairs, overlapping_count):
     _, assessment_count = assess(pairs)
     assert assessment_count == overlapping_count
+
+
+def test_assess_streams_pairs_in_bounded_memory():
+    pairs = (f"{n}-{n + 2},{n + 1}-{n + 3}\n" for n in range(100_000))
+    tracemalloc.start()
+    try:
+        assessment = assess(pairs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert assessment == (0, 100_000)
+    assert peak < 64 * 1024
@@ -1,6 +1,15 @@
+import numpy as np
 import pytest
 
-from aoc_2022.day_08 import Grid, Surveyor
+from aoc_2022.day_08 import Grid, Surveyor, Tree, look_west
+
+EXAMPLE = (
+    "30373",
+    "25512",
+    "65332",
+    "33549",
+    "35390",
+)
 
 
 def test_can_make_a_grid():
@@ -120,3 +129,51 @@ def test_assess_scenic_scores():
 
     assert tree.scenic_score == 8
     assert repr(tree) == "Tree(y=3, x=2, height=5)"
+
+
+def test_look_west_sweeps_each_row_from_the_left_edge():
+    visible, distance = look_west(np.array([[3, 0, 3, 7, 3], [2, 5, 5, 1, 2]]))
+    assert visible.tolist() == [
+        [True, False, False, True, False],
+        [True, True, False, False, False],
+    ]
+    assert distance.tolist() == [[0, 1, 2, 3, 1], [0, 1, 1, 1, 2]]
+
+
+def test_look_west_handles_an_empty_grid():
+    visible, distance = look_west(np.zeros((3, 0), dtype=np.uint8))
+    assert visible.shape == distance.shape == (3, 0)
+
+
+def test_surveyor_checks_a_trees_scenic_score():
+    surveyor = Surveyor(Grid.from_rows(EXAMPLE))
+    tree = surveyor.grid[1, 2]
+    surveyor.check_scenic_score(tree)
+
+    assert (
+        tree.viewing_distance_north,
+        tree.viewing_distance_east,
+        tree.viewing_distance_south,
+        tree.viewing_distance_west,
+    ) == (1, 2, 2, 1)
+    assert tree.scenic_score == 4
+
+
+def test_surveyor_surveys_the_perimeter_and_inner_trees_apart():
+    surveyor = Surveyor(Grid.from_rows(EXAMPLE))
+    perimeter = surveyor.survey_perimeter()
+    inner = surveyor.survey_inner_trees()
+
+    assert len(perimeter) == 16
+    assert inner == {(1, 1), (1, 2), (2, 1), (2, 3), (3, 2)}
+    assert len(perimeter | inner) == surveyor.count_visible()
+
+
+def test_surveyor_checks_sight_lines_of_one_tree():
+    surveyor = Surveyor(Grid.from_rows(EXAMPLE))
+    assert surveyor.check_sight_lines(1, 1).position == (1, 1)
+    assert surveyor.check_sight_lines(1, 3) is None
+
+    tree = Tree(y=0, x=0, height=5)
+    assert surveyor.check_sight_line(tree, {Tree(y=0, x=1, height=4)}) is tree
+    assert surveyor.check_sight_line(tree, {Tree(y=0, x=1, height=5)}) is None
@@ -74,3 +74,27 @@ def test_dijkstra_can_run_through_the_terrain():
     )
     dijkstra = Dijkstra()
     assert dijkstra.run(terrain) == 29
+
+
+def test_dijkstra_keeps_the_steps_to_every_square_reached():
+    terrain = Terrain.from_input(
+        (
+            ("S", "a", "b", "q", "p", "o", "n", "m"),
+            ("a", "b", "c", "r", "y", "x", "x", "l"),
+            ("a", "c", "c", "s", "z", "E", "x", "k"),
+            ("a", "c", "c", "t", "u", "v", "w", "j"),
+            ("a", "b", "d", "e", "f", "g", "h", "i"),
+        )
+    )
+    dijkstra = Dijkstra()
+    assert dijkstra.walk(terrain) == 31
+    assert dijkstra.steps.shape == (5, 8)
+    assert dijkstra.paths[0, 0] == 0
+    assert dijkstra.paths[0, 1] == dijkstra.paths[1, 0] == 1
+    assert dijkstra.paths[2, 5] == max(dijkstra.paths.values()) == 31
+
+    # Running down from the end stops at the first a it reaches.
+    assert dijkstra.run(terrain) == 29
+    assert dijkstra.paths[2, 5] == 0
+    assert max(dijkstra.paths.values()) == 29
+    assert (0, 0) not in dijkstra.paths
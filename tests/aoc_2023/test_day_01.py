@@ -36,3 +36,8 @@ def test_enhanced_main():
         "7pqrstsixteen",
     ]
     assert main(calibrations, digit_func=enhanced_digits) == 281
+
+
+def test_main_reads_calibrations_from_any_iterable():
+    calibrations = (f"a{n % 10}b\n" for n in range(100))
+    assert main(calibrations) == sum(11 * (n % 10) for n in range(100))
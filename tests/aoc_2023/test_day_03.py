@@ -37,6 +37,15 @@ def test_collect_symbols():
     assert collect_symbols(SCHEMATIC).keys() == expected_symbols
 
 
+def test_collect_symbols_of_a_wide_schematic_read_with_newlines():
+    schematic = ("12.#@\n", "=.3..\n")
+    assert collect_symbols(schematic) == {
+        Point(0, 3): [],
+        Point(0, 4): [],
+        Point(1, 0): [],
+    }
+
+
 @pytest.mark.parametrize(
     ("row", "edges", "found"),
     (